@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Compare template extraction strategies used by `specify init --here`.
+
+The legacy path extracted the archive into a temporary directory, walked it
+again and copied every file into the project. The current path streams each
+zip member straight to its final location. This script builds a synthetic
+template archive and reports wall time and bytes written for both.
+
+Usage:
+    python benchmarks/extract_template.py
+    python benchmarks/extract_template.py --files 2000 --size-kb 64 --runs 5
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from specify_cli.archive import extract_template_zip, handle_vscode_settings  # noqa: E402
+
+
+def build_archive(path: Path, files: int, size_kb: int) -> int:
+    """Write a nested template-like archive and return its uncompressed size."""
+    payload = os.urandom(size_kb * 1024)
+    total = 0
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("template/.vscode/settings.json", '{"chat.promptFiles": true}\n')
+        for i in range(files):
+            name = f"template/.specify/templates/group-{i % 20:02d}/file-{i:05d}.md"
+            zf.writestr(name, payload)
+            total += len(payload)
+    return total
+
+
+def legacy_extract(zip_path: Path, project_path: Path) -> None:
+    """The pre-streaming `--here` strategy: extractall into a temp dir, then copy."""
+    with zipfile.ZipFile(zip_path) as zip_ref, tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        zip_ref.extractall(temp_path)
+        items = list(temp_path.iterdir())
+        source_dir = items[0] if len(items) == 1 and items[0].is_dir() else temp_path
+        for item in source_dir.iterdir():
+            dest_path = project_path / item.name
+            if item.is_dir():
+                if dest_path.exists():
+                    for sub_item in item.rglob("*"):
+                        if sub_item.is_file():
+                            rel_path = sub_item.relative_to(item)
+                            dest_file = dest_path / rel_path
+                            dest_file.parent.mkdir(parents=True, exist_ok=True)
+                            if dest_file.name == "settings.json" and dest_file.parent.name == ".vscode":
+                                handle_vscode_settings(sub_item, dest_file, rel_path)
+                            else:
+                                shutil.copy2(sub_item, dest_file)
+                else:
+                    shutil.copytree(item, dest_path)
+            else:
+                shutil.copy2(item, dest_path)
+
+
+def streaming_extract(zip_path: Path, project_path: Path) -> None:
+    with zipfile.ZipFile(zip_path) as zip_ref:
+        extract_template_zip(zip_ref, project_path, merge=True, verbose=False)
+
+
+def written_bytes() -> int | None:
+    """Bytes passed to write() by this process so far (Linux only)."""
+    try:
+        with open("/proc/self/io", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("wchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def measure(strategy, zip_path: Path, workdir: Path, runs: int) -> tuple[float, int | None]:
+    best = float("inf")
+    io_bytes = None
+    for run in range(runs):
+        project = workdir / f"{strategy.__name__}-{run}"
+        # Existing project with its own .specify/ and .vscode/ so both paths merge
+        (project / ".specify").mkdir(parents=True)
+        (project / ".vscode").mkdir()
+        (project / ".vscode" / "settings.json").write_text('{"editor.tabSize": 2}\n')
+        before = written_bytes()
+        start = time.perf_counter()
+        strategy(zip_path, project)
+        best = min(best, time.perf_counter() - start)
+        after = written_bytes()
+        if before is not None and after is not None:
+            io_bytes = after - before
+        shutil.rmtree(project)
+    return best, io_bytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=1000, help="number of files in the synthetic template")
+    parser.add_argument("--size-kb", type=int, default=32, help="size of each file in KiB")
+    parser.add_argument("--runs", type=int, default=3, help="runs per strategy (best time is reported)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        zip_path = workdir / "spec-kit-template-bench.zip"
+        payload = build_archive(zip_path, args.files, args.size_kb)
+        print(f"Archive: {args.files} files, {payload / 1024 / 1024:.1f} MiB uncompressed")
+        print(f"{'strategy':<12} {'best time':>10} {'bytes written':>16}")
+        for label, strategy in (("legacy", legacy_extract), ("streaming", streaming_extract)):
+            elapsed, io_bytes = measure(strategy, zip_path, workdir, args.runs)
+            io_text = f"{io_bytes / 1024 / 1024:.1f} MiB" if io_bytes is not None else "n/a"
+            print(f"{label:<12} {elapsed * 1000:>8.1f}ms {io_text:>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Compare connection setup cost of the HTTP client strategies used for templates.
+
+Fetches the latest release metadata and then downloads a few template assets,
+three ways:
+
+* ``fresh``  - a new httpx.Client per request (what a client=None call used to do)
+* ``pooled`` - the shared client from specify_cli.github.get_http_client()
+* ``async``  - one AsyncClient from get_async_http_client(), assets fetched
+               concurrently (HTTP/2 multiplexed when ``h2`` is installed)
+
+For each strategy it reports the wall time and how many TCP connections and
+TLS handshakes were opened, counted with httpcore trace events. Point
+SPECIFY_GITHUB_API_URL at a local stand-in to run it offline.
+
+Usage:
+    python benchmarks/http_pool.py
+    python benchmarks/http_pool.py --assets 8 --rounds 3
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import httpx  # noqa: E402
+
+from specify_cli.github import (  # noqa: E402
+    _client_options,
+    _github_auth_headers,
+    _latest_release_url,
+    get_async_http_client,
+    get_http_client,
+    http2_enabled,
+)
+
+
+class ConnectionCounter:
+    """httpcore ``trace`` extension callback counting connection setup events."""
+
+    def __init__(self):
+        self.tcp = 0
+        self.tls = 0
+
+    def __call__(self, event_name, info):
+        if event_name == "connection.connect_tcp.complete":
+            self.tcp += 1
+        elif event_name == "connection.start_tls.complete":
+            self.tls += 1
+
+    async def async_call(self, event_name, info):
+        self(event_name, info)
+
+
+def _asset_urls(release: dict, count: int) -> list[str]:
+    assets = sorted(release.get("assets", []), key=lambda asset: asset.get("size", 0))
+    return [asset["browser_download_url"] for asset in assets[:count]]
+
+
+def run_sync(urls: list[str], client_factory, counter: ConnectionCounter) -> None:
+    headers = _github_auth_headers()
+    for url in urls:
+        client = client_factory()
+        response = client.get(url, headers=headers, follow_redirects=True, timeout=60, extensions={"trace": counter})
+        response.raise_for_status()
+        if client is not get_http_client():
+            client.close()
+
+
+async def run_async(api_url: str, count: int, counter: ConnectionCounter) -> None:
+    headers = _github_auth_headers()
+    extensions = {"trace": counter.async_call}
+    async with get_async_http_client() as client:
+        response = await client.get(api_url, headers=headers, follow_redirects=True, timeout=30, extensions=extensions)
+        response.raise_for_status()
+        urls = _asset_urls(response.json(), count)
+        responses = await asyncio.gather(*(
+            client.get(url, headers=headers, follow_redirects=True, timeout=60, extensions=extensions) for url in urls
+        ))
+        for asset_response in responses:
+            asset_response.raise_for_status()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--assets", type=int, default=4, help="Number of (smallest) assets to download per round")
+    parser.add_argument("--rounds", type=int, default=1, help="Repetitions per strategy; the median is reported")
+    args = parser.parse_args()
+
+    api_url = _latest_release_url()
+    release = get_http_client().get(api_url, headers=_github_auth_headers(), follow_redirects=True, timeout=30).json()
+    urls = [api_url, *_asset_urls(release, args.assets)]
+    print(f"{api_url} + {len(urls) - 1} assets, HTTP/2 {'enabled' if http2_enabled() else 'unavailable (pip install h2)'}\n")
+
+    strategies = {
+        "fresh": lambda counter: run_sync(urls, lambda: httpx.Client(**_client_options(False)), counter),
+        "pooled": lambda counter: run_sync(urls, get_http_client, counter),
+        "async": lambda counter: asyncio.run(run_async(api_url, args.assets, counter)),
+    }
+    print(f"  {'strategy':<8} {'wall ms':>9} {'tcp':>5} {'tls':>5}")
+    for name, run in strategies.items():
+        samples = []
+        for _ in range(args.rounds):
+            counter = ConnectionCounter()
+            start = time.perf_counter()
+            run(counter)
+            samples.append(((time.perf_counter() - start) * 1000, counter.tcp, counter.tls))
+        wall_ms, tcp, tls = sorted(samples)[len(samples) // 2]
+        print(f"  {name:<8} {wall_ms:9.1f} {tcp:5d} {tls:5d}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
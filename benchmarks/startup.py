@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Measure `specify` cold-start cost and fail when it regresses.
+
+Runs `python -X importtime -c "import specify_cli.cli"` in fresh interpreters
+(the Typer app every command goes through) and reports the median cumulative
+import time together with its slowest dependencies, then times a few
+lightweight commands end to end, including their peak resident memory.
+
+Two checks guard against regressions:
+
+* the median import time must stay within ``--budget-ms``;
+* modules that only network or interactive commands need (httpx, truststore,
+  readchar, zipfile, Rich Live/Progress/Table/Tree) and the lazily loaded
+  command and template modules must not be imported by ``specify_cli.cli``.
+  This check does not depend on machine speed.
+
+Exits with status 1 when either check fails, so it can run in CI.
+
+Usage:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --runs 20 --budget-ms 80 --top 15
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+DEFERRED_MODULES = [
+    "httpx",
+    "truststore",
+    "ssl",
+    "readchar",
+    "zipfile",
+    "platformdirs",
+    "rich.live",
+    "rich.progress",
+    "rich.table",
+    "rich.tree",
+    "specify_cli.api",
+    "specify_cli.archive",
+    "specify_cli.batch",
+    "specify_cli.commands.init",
+    "specify_cli.features",
+    "specify_cli.agentcontext",
+    "specify_cli.featurestatus",
+    "specify_cli.github",
+    "specify_cli.project",
+    "specify_cli.projectcontext",
+    "specify_cli.yamldoc",
+]
+
+ENTRY_MODULE = "specify_cli.cli"
+
+# Commands that should never pay for networking or interactive UI imports
+COMMANDS = [
+    ["--help"],
+    ["context", "--show"],
+    ["feature", "new", "--help"],
+    ["status", "--help"],
+]
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC), env.get("PYTHONPATH")]))
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def parse_importtime(stderr: str) -> dict:
+    """Map module name -> (self_us, cumulative_us) from `-X importtime` output."""
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def measure_import(runs: int) -> tuple[list[float], dict]:
+    """Return per-run cumulative import times (ms) and the last run's table."""
+    samples = []
+    timings = {}
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {ENTRY_MODULE}"],
+            capture_output=True,
+            text=True,
+            env=_env(),
+            check=True,
+        )
+        timings = parse_importtime(result.stderr)
+        samples.append(timings[ENTRY_MODULE][1] / 1000)
+    return samples, timings
+
+
+def loaded_modules(code: str) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}; import json, sys; print(json.dumps(sorted(sys.modules)))"],
+        capture_output=True,
+        text=True,
+        env=_env(),
+        check=True,
+    )
+    return set(json.loads(result.stdout))
+
+
+# Runs the CLI, then reports peak RSS (KiB on Linux, bytes on macOS) on the last stderr line
+COMMAND_RUNNER = """
+import resource, sys, specify_cli
+try:
+    specify_cli.main()
+except SystemExit:
+    pass
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, file=sys.stderr)
+"""
+
+
+def time_command(args: list[str], runs: int) -> tuple[float, int]:
+    """Median wall time (ms) and peak RSS (KiB) of `specify <args>` in an empty directory."""
+    samples = []
+    rss = 0
+    with tempfile.TemporaryDirectory() as cwd:
+        for _ in range(runs):
+            start = time.perf_counter()
+            result = subprocess.run(
+                [sys.executable, "-c", COMMAND_RUNNER, *args],
+                capture_output=True,
+                text=True,
+                env=_env(),
+                cwd=cwd,
+            )
+            samples.append((time.perf_counter() - start) * 1000)
+            rss = int(result.stderr.strip().splitlines()[-1])
+    if sys.platform == "darwin":
+        rss //= 1024
+    return statistics.median(samples), rss
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Interpreter launches per measurement")
+    parser.add_argument("--budget-ms", type=float, default=120.0, help=f"Maximum median import time of {ENTRY_MODULE}")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest imports to list")
+    args = parser.parse_args()
+
+    # Warm the bytecode cache so the first sample is not an outlier
+    subprocess.run([sys.executable, "-c", f"import {ENTRY_MODULE}"], env=_env(), check=True)
+
+    samples, timings = measure_import(args.runs)
+    median = statistics.median(samples)
+    print(f"import {ENTRY_MODULE}: median {median:.1f} ms, min {min(samples):.1f} ms over {args.runs} runs")
+
+    print("\nSlowest imports (cumulative, last run):")
+    ranked = sorted(timings.items(), key=lambda item: item[1][1], reverse=True)
+    for name, (self_us, cumulative_us) in ranked[: args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {self_us / 1000:7.1f} ms self  {name}")
+
+    print("\nCommands (median wall time including interpreter start-up, peak RSS):")
+    for command in COMMANDS:
+        wall_ms, rss_kib = time_command(command, args.runs)
+        print(f"  {wall_ms:8.1f} ms  {rss_kib / 1024:6.1f} MiB  specify {' '.join(command)}")
+
+    failures = []
+    if median > args.budget_ms:
+        failures.append(f"median import time {median:.1f} ms exceeds budget of {args.budget_ms:.0f} ms")
+    # Ignore modules the bare interpreter already loads (e.g. via site-packages .pth files)
+    baseline = loaded_modules("pass")
+    eager = sorted((set(DEFERRED_MODULES) & loaded_modules(f"import {ENTRY_MODULE}")) - baseline)
+    if eager:
+        failures.append(f"imported eagerly by {ENTRY_MODULE}: {', '.join(eager)}")
+
+    if failures:
+        print("\nFAIL")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    print(f"\nOK (budget {args.budget_ms:.0f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,49 @@
 #!/usr/bin/env bash
 # Common functions and variables for all scripts
 
+# Resolve the git facts for the current directory with a single git process.
+# `git rev-parse --show-toplevel --git-path HEAD` gives the work tree root and
+# the HEAD file; the branch is then read from HEAD with the `read` builtin on
+# every call, so it stays right after a checkout. The results are memoized for
+# the directory they were resolved in and exported, so functions run in
+# subshells and child scripts reuse them instead of forking git again.
+#   SPECIFY_GIT_PROBE_DIR  directory the probe ran in (unset it to probe again)
+#   SPECIFY_GIT_TOPLEVEL   work tree root, empty outside a repository or without git
+#   SPECIFY_GIT_HEAD_FILE  absolute path of HEAD
+load_git_state() {
+    [[ "${SPECIFY_GIT_PROBE_DIR:-}" == "$PWD" ]] && return 0
+    local output=""
+    SPECIFY_GIT_TOPLEVEL=""
+    SPECIFY_GIT_HEAD_FILE=""
+    if output=$(git rev-parse --show-toplevel --git-path HEAD 2>/dev/null); then
+        SPECIFY_GIT_TOPLEVEL="${output%%$'\n'*}"
+        SPECIFY_GIT_HEAD_FILE="${output#*$'\n'}"
+        [[ "$SPECIFY_GIT_HEAD_FILE" == /* || "$SPECIFY_GIT_HEAD_FILE" =~ ^[A-Za-z]: ]] || SPECIFY_GIT_HEAD_FILE="$PWD/$SPECIFY_GIT_HEAD_FILE"
+    fi
+    SPECIFY_GIT_PROBE_DIR="$PWD"
+    export SPECIFY_GIT_PROBE_DIR SPECIFY_GIT_TOPLEVEL SPECIFY_GIT_HEAD_FILE
+}
+
+# Print what `git rev-parse --abbrev-ref HEAD` would ("HEAD" when detached),
+# read from the HEAD file; fails outside a repository. Only unusual HEADs
+# (the reftable placeholder) cost a git process.
+git_head_branch() {
+    local head=""
+    load_git_state
+    [[ -n "$SPECIFY_GIT_HEAD_FILE" ]] || return 1
+    IFS= read -r head < "$SPECIFY_GIT_HEAD_FILE" 2>/dev/null || [[ -n "$head" ]] || return 1
+    case "$head" in
+        "ref: refs/heads/.invalid") git rev-parse --abbrev-ref HEAD 2>/dev/null ;;
+        "ref: refs/heads/"*) echo "${head#ref: refs/heads/}" ;;
+        *) echo "HEAD" ;;
+    esac
+}
+
 # Get repository root, with fallback for non-git repositories
 get_repo_root() {
-    if git rev-parse --show-toplevel >/dev/null 2>&1; then
-        git rev-parse --show-toplevel
+    load_git_state
+    if [[ -n "$SPECIFY_GIT_TOPLEVEL" ]]; then
+        echo "$SPECIFY_GIT_TOPLEVEL"
     else
         # Fall back to script location for non-git repos
         local script_dir="$(CDPATH="" cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
@@ -12,6 +51,31 @@ get_repo_root() {
     fi
 }
 
+# Print "number<TAB>directory" for each numbered directory in <repo_root>/specs.
+# Read from the index the specify CLI keeps in .specify/cache/features.tsv while
+# it is strictly newer than specs/ (any added, removed or renamed feature makes
+# it stale); otherwise specs/ is listed directly. Equal timestamps count as
+# stale: bash 3.2 and one-second file systems compare whole seconds, so a
+# directory created in the second the index was written would be missed.
+spec_features() {
+    local specs_dir="$1/specs"
+    local index="$1/.specify/cache/features.tsv"
+    local line dir name
+    [[ -d "$specs_dir" ]] || return 0
+    if [[ -f "$index" && "$index" -nt "$specs_dir" ]]; then
+        while IFS= read -r line; do
+            [[ "$line" == \#* ]] || printf '%s\n' "$line"
+        done < "$index"
+        return 0
+    fi
+    for dir in "$specs_dir"/*/; do
+        name="${dir%/}"
+        name="${name##*/}"
+        [[ "$name" =~ ^([0-9]+) ]] && printf '%s\t%s\n' "$((10#${BASH_REMATCH[1]}))" "$name"
+    done
+    return 0
+}
+
 # Get current branch, with fallback for non-git repositories
 get_current_branch() {
     # First check if SPECIFY_FEATURE environment variable is set
@@ -21,37 +85,28 @@ get_current_branch() {
     fi
 
     # Then check git if available
-    if git rev-parse --abbrev-ref HEAD >/dev/null 2>&1; then
-        git rev-parse --abbrev-ref HEAD
+    local branch
+    if branch=$(git_head_branch) && [[ -n "$branch" ]]; then
+        echo "$branch"
         return
     fi
 
     # For non-git repos, try to find the latest feature directory
     local repo_root=$(get_repo_root)
-    local specs_dir="$repo_root/specs"
-
-    if [[ -d "$specs_dir" ]]; then
-        local latest_feature=""
-        local highest=0
-
-        for dir in "$specs_dir"/*; do
-            if [[ -d "$dir" ]]; then
-                local dirname=$(basename "$dir")
-                if [[ "$dirname" =~ ^([0-9]{3})- ]]; then
-                    local number=${BASH_REMATCH[1]}
-                    number=$((10#$number))
-                    if [[ "$number" -gt "$highest" ]]; then
-                        highest=$number
-                        latest_feature=$dirname
-                    fi
-                fi
-            fi
-        done
-
-        if [[ -n "$latest_feature" ]]; then
-            echo "$latest_feature"
-            return
+    local latest_feature=""
+    local highest=0
+    local number dirname
+
+    while IFS=$'\t' read -r number dirname; do
+        if [[ "$dirname" =~ ^[0-9]{3}- && "$number" -gt "$highest" ]]; then
+            highest=$number
+            latest_feature=$dirname
         fi
+    done < <(spec_features "$repo_root")
+
+    if [[ -n "$latest_feature" ]]; then
+        echo "$latest_feature"
+        return
     fi
 
     echo "main"  # Final fallback
@@ -59,7 +114,8 @@ get_current_branch() {
 
 # Check if we have git available
 has_git() {
-    git rev-parse --show-toplevel >/dev/null 2>&1
+    load_git_state
+    [[ -n "$SPECIFY_GIT_TOPLEVEL" ]]
 }
 
 check_feature_branch() {
@@ -99,15 +155,12 @@ find_feature_dir_by_prefix() {
 
     local prefix="${BASH_REMATCH[1]}"
 
-    # Search for directories in specs/ that start with this prefix
+    # Search the feature index for directories that start with this prefix
     local matches=()
-    if [[ -d "$specs_dir" ]]; then
-        for dir in "$specs_dir"/"$prefix"-*; do
-            if [[ -d "$dir" ]]; then
-                matches+=("$(basename "$dir")")
-            fi
-        done
-    fi
+    local number dirname
+    while IFS=$'\t' read -r number dirname; do
+        [[ "$dirname" == "$prefix"-* ]] && matches+=("$dirname")
+    done < <(spec_features "$repo_root")
 
     # Handle results
     if [[ ${#matches[@]} -eq 0 ]]; then
@@ -125,6 +178,8 @@ find_feature_dir_by_prefix() {
 }
 
 get_feature_paths() {
+    # Probe once here; the command substitutions below inherit the result
+    load_git_state
     local repo_root=$(get_repo_root)
     local current_branch=$(get_current_branch)
     local has_git_repo="false"
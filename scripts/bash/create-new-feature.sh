@@ -5,6 +5,7 @@ set -e
 JSON_MODE=false
 SHORT_NAME=""
 BRANCH_NUMBER=""
+FETCH=false
 ARGS=()
 i=1
 while [ $i -le $# ]; do
@@ -40,13 +41,17 @@ while [ $i -le $# ]; do
             fi
             BRANCH_NUMBER="$next_arg"
             ;;
+        --fetch)
+            FETCH=true
+            ;;
         --help|-h) 
-            echo "Usage: $0 [--json] [--short-name <name>] [--number N] <feature_description>"
+            echo "Usage: $0 [--json] [--short-name <name>] [--number N] [--fetch] <feature_description>"
             echo ""
             echo "Options:"
             echo "  --json              Output in JSON format"
             echo "  --short-name <name> Provide a custom short name (2-4 words) for the branch"
             echo "  --number N          Specify branch number manually (overrides auto-detection)"
+            echo "  --fetch             Fetch all remotes before numbering (default: use known branches)"
             echo "  --help, -h          Show this help message"
             echo ""
             echo "Examples:"
@@ -63,7 +68,7 @@ done
 
 FEATURE_DESCRIPTION="${ARGS[*]}"
 if [ -z "$FEATURE_DESCRIPTION" ]; then
-    echo "Usage: $0 [--json] [--short-name <name>] [--number N] <feature_description>" >&2
+    echo "Usage: $0 [--json] [--short-name <name>] [--number N] [--fetch] <feature_description>" >&2
     exit 1
 fi
 
@@ -80,23 +85,18 @@ find_repo_root() {
     return 1
 }
 
-# Function to get highest number from specs directory
+# Function to get highest number from specs directory (via the feature index in common.sh)
 get_highest_from_specs() {
     local specs_dir="$1"
     local highest=0
-    
-    if [ -d "$specs_dir" ]; then
-        for dir in "$specs_dir"/*; do
-            [ -d "$dir" ] || continue
-            dirname=$(basename "$dir")
-            number=$(echo "$dirname" | grep -o '^[0-9]\+' || echo "0")
-            number=$((10#$number))
-            if [ "$number" -gt "$highest" ]; then
-                highest=$number
-            fi
-        done
-    fi
-    
+    local number dirname
+
+    while IFS=$'\t' read -r number dirname; do
+        if [ "$number" -gt "$highest" ]; then
+            highest=$number
+        fi
+    done < <(spec_features "${specs_dir%/specs}")
+
     echo "$highest"
 }
 
@@ -104,24 +104,20 @@ get_highest_from_specs() {
 get_highest_from_branches() {
     local highest=0
     
-    # Get all branches (local and remote)
-    branches=$(git branch -a 2>/dev/null || echo "")
-    
-    if [ -n "$branches" ]; then
-        while IFS= read -r branch; do
-            # Clean branch name: remove leading markers and remote prefixes
-            clean_branch=$(echo "$branch" | sed 's/^[* ]*//; s|^remotes/[^/]*/||')
-            
-            # Extract feature number if branch matches pattern ###-*
-            if echo "$clean_branch" | grep -q '^[0-9]\{3\}-'; then
-                number=$(echo "$clean_branch" | grep -o '^[0-9]\{3\}' || echo "0")
-                number=$((10#$number))
-                if [ "$number" -gt "$highest" ]; then
-                    highest=$number
-                fi
+    # All local and remote-tracking branches in one call, matched without subprocesses
+    while IFS= read -r ref; do
+        case "$ref" in
+            refs/heads/*) branch="${ref#refs/heads/}" ;;
+            *) branch="${ref#refs/remotes/*/}" ;;
+        esac
+        # Extract feature number if branch matches pattern ###-*
+        if [[ "$branch" =~ ^([0-9]{3})- ]]; then
+            number=$((10#${BASH_REMATCH[1]}))
+            if [ "$number" -gt "$highest" ]; then
+                highest=$number
             fi
-        done <<< "$branches"
-    fi
+        fi
+    done < <(git for-each-ref --format='%(refname)' refs/heads refs/remotes 2>/dev/null)
     
     echo "$highest"
 }
@@ -130,8 +126,10 @@ get_highest_from_branches() {
 check_existing_branches() {
     local specs_dir="$1"
 
-    # Fetch all remotes to get latest branch info (suppress errors if no remotes)
-    git fetch --all --prune 2>/dev/null || true
+    # Fetching is opt-in (--fetch): it needs the network and can take seconds on large remotes
+    if [ "$FETCH" = true ]; then
+        git fetch --all --prune 2>/dev/null || true
+    fi
 
     # Get highest number from ALL branches (not just matching short name)
     local highest_branch=$(get_highest_from_branches)
@@ -149,6 +147,10 @@ check_existing_branches() {
     echo $((max_num + 1))
 }
 
+# Shared helpers (spec_features, load_git_state); only functions are defined, nothing runs
+SCRIPT_DIR="$(CDPATH="" cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+source "$SCRIPT_DIR/common.sh"
+
 # Function to clean and format a branch name
 clean_branch_name() {
     local name="$1"
@@ -158,10 +160,9 @@ clean_branch_name() {
 # Resolve repository root. Prefer git information when available, but fall back
 # to searching for repository markers so the workflow still functions in repositories that
 # were initialised with --no-git.
-SCRIPT_DIR="$(CDPATH="" cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
-
-if git rev-parse --show-toplevel >/dev/null 2>&1; then
-    REPO_ROOT=$(git rev-parse --show-toplevel)
+load_git_state
+if [[ -n "$SPECIFY_GIT_TOPLEVEL" ]]; then
+    REPO_ROOT="$SPECIFY_GIT_TOPLEVEL"
     HAS_GIT=true
 else
     REPO_ROOT="$(find_repo_root "$SCRIPT_DIR")"
@@ -278,7 +279,16 @@ else
 fi
 
 FEATURE_DIR="$SPECS_DIR/$BRANCH_NAME"
+FEATURE_INDEX="$REPO_ROOT/.specify/cache/features.tsv"
+# Keep the feature index current: if it was up to date, record the new directory in it
+INDEX_CURRENT=false
+if [[ -f "$FEATURE_INDEX" && "$FEATURE_INDEX" -nt "$SPECS_DIR" && ! -d "$FEATURE_DIR" ]]; then
+    INDEX_CURRENT=true
+fi
 mkdir -p "$FEATURE_DIR"
+if $INDEX_CURRENT; then
+    printf '%s\t%s\n' "$((10#$FEATURE_NUM))" "$BRANCH_NAME" >> "$FEATURE_INDEX"
+fi
 
 TEMPLATE="$REPO_ROOT/.specify/templates/spec-template.md"
 SPEC_FILE="$FEATURE_DIR/spec.md"
@@ -79,7 +79,15 @@ done
 
 # Get current branch name
 get_branch_name() {
-    if git rev-parse --is-inside-work-tree &>/dev/null; then
+    local branch
+    # common.sh resolves the branch from one cached git probe
+    if declare -F git_head_branch >/dev/null; then
+        if branch=$(git_head_branch) && [[ "$branch" != "HEAD" ]]; then
+            echo "$branch"
+        else
+            echo "main"
+        fi
+    elif git rev-parse --is-inside-work-tree &>/dev/null; then
         git branch --show-current 2>/dev/null || echo "main"
     else
         echo "main"
@@ -93,29 +101,17 @@ BRANCH_NAME="$(get_branch_name)"
 get_feature_dir() {
     local branch="$1"
     local specs_dir="$REPO_ROOT/specs"
-    
-    # If specs directory exists, look for matching feature
-    if [[ -d "$specs_dir" ]]; then
-        # Try exact match first
-        if [[ -d "$specs_dir/$branch" ]]; then
-            echo "$specs_dir/$branch"
-            return 0
-        fi
-        
-        # Try to find feature by branch prefix (N-name pattern)
-        local feature_dirs=("$specs_dir"/*/)
-        for dir in "${feature_dirs[@]}"; do
-            local dirname=$(basename "$dir")
-            if [[ "$dirname" == "$branch" ]]; then
-                echo "$dir"
-                return 0
-            fi
-        done
-        
-        # If no match, return expected path
+
+    # Exact match first
+    if [[ -d "$specs_dir/$branch" ]]; then
         echo "$specs_dir/$branch"
+        return 0
+    fi
+
+    # Then by numeric prefix through the feature index (common.sh), else the expected path
+    if declare -F find_feature_dir_by_prefix >/dev/null; then
+        find_feature_dir_by_prefix "$REPO_ROOT" "$branch"
     else
-        # No specs dir, create expected path
         echo "$specs_dir/$branch"
     fi
 }
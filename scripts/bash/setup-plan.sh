@@ -28,6 +28,7 @@ SCRIPT_DIR="$(CDPATH="" cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 source "$SCRIPT_DIR/common.sh"
 
 # Get all paths and variables from common functions
+load_git_state  # once, in this shell: subshells and child scripts reuse it
 eval $(get_feature_paths)
 
 # Check if we're on a proper feature branch (only for git repos)
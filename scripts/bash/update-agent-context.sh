@@ -37,6 +37,11 @@
 # Usage: ./update-agent-context.sh [agent_type]
 # Agent types: claude|gemini|copilot|cursor-agent|qwen|opencode|codex|windsurf|kilocode|auggie|shai|q|bob|qoder
 # Leave empty to update all existing agent files
+#
+# When the specify CLI is installed and provides `specify agent-context update`
+# (which parses plan.md once and rewrites only files whose content changes),
+# this script hands over to it. Set SPECIFY_AGENT_CONTEXT_SHELL=1 to always use
+# the shell implementation below.
 
 set -e
 
@@ -48,11 +53,21 @@ set -o pipefail
 # Configuration and Global Variables
 #==============================================================================
 
+# Hand over to the CLI engine; exit status 2 means this specify has no such command
+if [[ -z "${SPECIFY_AGENT_CONTEXT_SHELL:-}" ]] && command -v specify >/dev/null 2>&1; then
+    specify_status=0
+    specify agent-context update ${1:+"$1"} || specify_status=$?
+    if [[ $specify_status -ne 2 ]]; then
+        exit $specify_status
+    fi
+fi
+
 # Get script directory and load common functions
 SCRIPT_DIR="$(CDPATH="" cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 source "$SCRIPT_DIR/common.sh"
 
 # Get all paths and variables from common functions
+load_git_state  # once, in this shell: subshells and child scripts reuse it
 eval $(get_feature_paths)
 
 NEW_PLAN="$IMPL_PLAN"  # Alias for compatibility with existing code
@@ -1,20 +1,89 @@
 #!/usr/bin/env pwsh
 # Common PowerShell functions analogous to common.sh
 
-function Get-RepoRoot {
+# Resolve the git facts for the current directory with a single git process,
+# as load_git_state in common.sh does: `git rev-parse --show-toplevel
+# --git-path HEAD` gives the work tree root and the HEAD file, and the branch is
+# read from HEAD on every call. The results are kept in script scope for the
+# directory they were resolved in. Scripts run inside the caller's PowerShell
+# process, so session-wide environment variables would outlive the run (and
+# miss a later `git init`); script scope ends with it.
+function Initialize-GitState {
+    $here = (Get-Location).ProviderPath
+    if ($script:SpecifyGitProbeDir -eq $here) { return }
+    $script:SpecifyGitTopLevel = $null
+    $script:SpecifyGitHeadFile = $null
     try {
-        $result = git rev-parse --show-toplevel 2>$null
-        if ($LASTEXITCODE -eq 0) {
-            return $result
+        $output = @(git rev-parse --show-toplevel --git-path HEAD 2>$null)
+        if ($LASTEXITCODE -eq 0 -and $output.Count -ge 2) {
+            $headFile = $output[1]
+            if (-not [System.IO.Path]::IsPathRooted($headFile)) {
+                $headFile = Join-Path $here $headFile
+            }
+            $script:SpecifyGitTopLevel = $output[0]
+            $script:SpecifyGitHeadFile = $headFile
         }
     } catch {
-        # Git command failed
+        # Git not installed
     }
-    
+    $script:SpecifyGitProbeDir = $here
+}
+
+# What `git rev-parse --abbrev-ref HEAD` would return ("HEAD" when detached),
+# read from the HEAD file; $null outside a repository.
+function Get-GitHeadBranch {
+    Initialize-GitState
+    if (-not $script:SpecifyGitHeadFile) { return $null }
+    try {
+        $head = [System.IO.File]::ReadAllText($script:SpecifyGitHeadFile).Trim()
+    } catch {
+        return $null
+    }
+    if ($head -eq 'ref: refs/heads/.invalid') {
+        # reftable repositories keep the real HEAD elsewhere
+        $result = git rev-parse --abbrev-ref HEAD 2>$null
+        if ($LASTEXITCODE -eq 0) { return $result }
+        return $null
+    }
+    if ($head.StartsWith('ref: refs/heads/')) {
+        return $head.Substring('ref: refs/heads/'.Length)
+    }
+    return 'HEAD'
+}
+
+function Get-RepoRoot {
+    Initialize-GitState
+    if ($script:SpecifyGitTopLevel) {
+        return $script:SpecifyGitTopLevel
+    }
+
     # Fall back to script location for non-git repos
     return (Resolve-Path (Join-Path $PSScriptRoot "../../..")).Path
 }
 
+# Numbered directories in <RepoRoot>/specs as objects with Number and Name.
+# Read from the index the specify CLI keeps in .specify/cache/features.tsv while
+# it is strictly newer than specs/ (any added, removed or renamed feature makes
+# it stale; equal timestamps too, as on one-second file systems); otherwise
+# specs/ is listed directly.
+function Get-SpecFeatures {
+    param([string]$RepoRoot)
+
+    $specsDir = Join-Path $RepoRoot 'specs'
+    if (-not (Test-Path $specsDir -PathType Container)) { return @() }
+    $index = Join-Path $RepoRoot '.specify/cache/features.tsv'
+    if ((Test-Path $index -PathType Leaf) -and
+        (Get-Item $specsDir).LastWriteTimeUtc -lt (Get-Item $index).LastWriteTimeUtc) {
+        return @(Get-Content $index | Where-Object { $_ -and -not $_.StartsWith('#') } | ForEach-Object {
+            $fields = $_ -split "`t", 2
+            [PSCustomObject]@{ Number = [int]$fields[0]; Name = $fields[1] }
+        })
+    }
+    return @(Get-ChildItem -Path $specsDir -Directory | Where-Object { $_.Name -match '^(\d+)' } | ForEach-Object {
+        [PSCustomObject]@{ Number = [int]($_.Name -replace '^(\d+).*$', '$1'); Name = $_.Name }
+    })
+}
+
 function Get-CurrentBranch {
     # First check if SPECIFY_FEATURE environment variable is set
     if ($env:SPECIFY_FEATURE) {
@@ -22,49 +91,34 @@ function Get-CurrentBranch {
     }
     
     # Then check git if available
-    try {
-        $result = git rev-parse --abbrev-ref HEAD 2>$null
-        if ($LASTEXITCODE -eq 0) {
-            return $result
-        }
-    } catch {
-        # Git command failed
+    $branch = Get-GitHeadBranch
+    if ($branch) {
+        return $branch
     }
     
     # For non-git repos, try to find the latest feature directory
     $repoRoot = Get-RepoRoot
-    $specsDir = Join-Path $repoRoot "specs"
-    
-    if (Test-Path $specsDir) {
-        $latestFeature = ""
-        $highest = 0
-        
-        Get-ChildItem -Path $specsDir -Directory | ForEach-Object {
-            if ($_.Name -match '^(\d{3})-') {
-                $num = [int]$matches[1]
-                if ($num -gt $highest) {
-                    $highest = $num
-                    $latestFeature = $_.Name
-                }
-            }
-        }
-        
-        if ($latestFeature) {
-            return $latestFeature
+    $latestFeature = ""
+    $highest = 0
+
+    foreach ($feature in (Get-SpecFeatures -RepoRoot $repoRoot)) {
+        if ($feature.Name -match '^\d{3}-' -and $feature.Number -gt $highest) {
+            $highest = $feature.Number
+            $latestFeature = $feature.Name
         }
     }
+
+    if ($latestFeature) {
+        return $latestFeature
+    }
     
     # Final fallback
     return "main"
 }
 
 function Test-HasGit {
-    try {
-        git rev-parse --show-toplevel 2>$null | Out-Null
-        return ($LASTEXITCODE -eq 0)
-    } catch {
-        return $false
-    }
+    Initialize-GitState
+    return [bool]$script:SpecifyGitTopLevel
 }
 
 function Test-FeatureBranch {
@@ -5,20 +5,25 @@ param(
     [switch]$Json,
     [string]$ShortName,
     [int]$Number = 0,
+    [switch]$Fetch,
     [switch]$Help,
     [Parameter(ValueFromRemainingArguments = $true)]
     [string[]]$FeatureDescription
 )
 $ErrorActionPreference = 'Stop'
 
+# Shared helpers (Get-SpecFeatures); only functions are defined, nothing runs
+. "$PSScriptRoot/common.ps1"
+
 # Show help if requested
 if ($Help) {
-    Write-Host "Usage: ./create-new-feature.ps1 [-Json] [-ShortName <name>] [-Number N] <feature description>"
+    Write-Host "Usage: ./create-new-feature.ps1 [-Json] [-ShortName <name>] [-Number N] [-Fetch] <feature description>"
     Write-Host ""
     Write-Host "Options:"
     Write-Host "  -Json               Output in JSON format"
     Write-Host "  -ShortName <name>   Provide a custom short name (2-4 words) for the branch"
     Write-Host "  -Number N           Specify branch number manually (overrides auto-detection)"
+    Write-Host "  -Fetch              Fetch all remotes before numbering (default: use known branches)"
     Write-Host "  -Help               Show this help message"
     Write-Host ""
     Write-Host "Examples:"
@@ -62,14 +67,10 @@ function Find-RepositoryRoot {
 function Get-HighestNumberFromSpecs {
     param([string]$SpecsDir)
     
+    # Read through the feature index (see Get-SpecFeatures in common.ps1)
     $highest = 0
-    if (Test-Path $SpecsDir) {
-        Get-ChildItem -Path $SpecsDir -Directory | ForEach-Object {
-            if ($_.Name -match '^(\d+)') {
-                $num = [int]$matches[1]
-                if ($num -gt $highest) { $highest = $num }
-            }
-        }
+    foreach ($feature in (Get-SpecFeatures -RepoRoot (Split-Path $SpecsDir -Parent))) {
+        if ($feature.Number -gt $highest) { $highest = $feature.Number }
     }
     return $highest
 }
@@ -79,14 +80,14 @@ function Get-HighestNumberFromBranches {
     
     $highest = 0
     try {
-        $branches = git branch -a 2>$null
+        # All local and remote-tracking branches in one call
+        $refs = git for-each-ref --format='%(refname)' refs/heads refs/remotes 2>$null
         if ($LASTEXITCODE -eq 0) {
-            foreach ($branch in $branches) {
-                # Clean branch name: remove leading markers and remote prefixes
-                $cleanBranch = $branch.Trim() -replace '^\*?\s+', '' -replace '^remotes/[^/]+/', ''
+            foreach ($ref in $refs) {
+                $cleanBranch = $ref -replace '^refs/heads/', '' -replace '^refs/remotes/[^/]+/', ''
                 
                 # Extract feature number if branch matches pattern ###-*
-                if ($cleanBranch -match '^(\d+)-') {
+                if ($cleanBranch -match '^(\d{3})-') {
                     $num = [int]$matches[1]
                     if ($num -gt $highest) { $highest = $num }
                 }
@@ -104,11 +105,13 @@ function Get-NextBranchNumber {
         [string]$SpecsDir
     )
 
-    # Fetch all remotes to get latest branch info (suppress errors if no remotes)
-    try {
-        git fetch --all --prune 2>$null | Out-Null
-    } catch {
-        # Ignore fetch errors
+    # Fetching is opt-in (-Fetch): it needs the network and can take seconds on large remotes
+    if ($Fetch) {
+        try {
+            git fetch --all --prune 2>$null | Out-Null
+        } catch {
+            # Ignore fetch errors
+        }
     }
 
     # Get highest number from ALL branches (not just matching short name)
@@ -135,14 +138,10 @@ if (-not $fallbackRoot) {
     exit 1
 }
 
-try {
-    $repoRoot = git rev-parse --show-toplevel 2>$null
-    if ($LASTEXITCODE -eq 0) {
-        $hasGit = $true
-    } else {
-        throw "Git not available"
-    }
-} catch {
+if (Test-HasGit) {
+    $repoRoot = (Get-RepoRoot)
+    $hasGit = $true
+} else {
     $repoRoot = $fallbackRoot
     $hasGit = $false
 }
@@ -252,7 +251,14 @@ if ($hasGit) {
 }
 
 $featureDir = Join-Path $specsDir $branchName
+# Keep the feature index current: if it was up to date, record the new directory in it
+$featureIndex = Join-Path $repoRoot '.specify/cache/features.tsv'
+$indexCurrent = (Test-Path $featureIndex -PathType Leaf) -and -not (Test-Path $featureDir) -and
+    (Get-Item $specsDir).LastWriteTimeUtc -lt (Get-Item $featureIndex).LastWriteTimeUtc
 New-Item -ItemType Directory -Path $featureDir -Force | Out-Null
+if ($indexCurrent) {
+    Add-Content -Path $featureIndex -Value "$Number`t$branchName"
+}
 
 $template = Join-Path $repoRoot '.specify/templates/spec-template.md'
 $specFile = Join-Path $featureDir 'spec.md'
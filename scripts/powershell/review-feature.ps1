@@ -41,11 +41,9 @@ $RepoRoot = Find-RepoRoot
 # Get current branch name
 function Get-BranchName {
     try {
-        $isGitRepo = & git rev-parse --is-inside-work-tree 2>$null
-        if ($isGitRepo) {
-            $branch = & git branch --show-current 2>$null
-            if ($branch) { return $branch }
-        }
+        # Fails outside a work tree and prints nothing when detached
+        $branch = & git branch --show-current 2>$null
+        if ($LASTEXITCODE -eq 0 -and $branch) { return $branch }
     } catch {}
     return "main"
 }
@@ -59,19 +57,11 @@ function Get-FeatureDir {
     $specsDir = Join-Path $RepoRoot "specs"
     
     if (Test-Path $specsDir) {
-        # Try exact match first
+        # Exact match
         $exactPath = Join-Path $specsDir $Branch
         if (Test-Path $exactPath) {
             return $exactPath
         }
-        
-        # Try to find feature by branch prefix
-        $featureDirs = Get-ChildItem -Path $specsDir -Directory -ErrorAction SilentlyContinue
-        foreach ($dir in $featureDirs) {
-            if ($dir.Name -eq $Branch) {
-                return $dir.FullName
-            }
-        }
     }
     
     # Return expected path
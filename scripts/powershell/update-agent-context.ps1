@@ -22,6 +22,11 @@ Optional agent key to update a single agent. If omitted, updates all existing ag
 
 .NOTES
 Relies on common helper functions in common.ps1
+
+When the specify CLI is installed and provides `specify agent-context update`
+(which parses plan.md once and rewrites only files whose content changes),
+this script hands over to it. Set SPECIFY_AGENT_CONTEXT_SHELL=1 to always use
+the PowerShell implementation below.
 #>
 param(
     [Parameter(Position=0)]
@@ -31,6 +36,12 @@ param(
 
 $ErrorActionPreference = 'Stop'
 
+# Hand over to the CLI engine; exit code 2 means this specify has no such command
+if (-not $env:SPECIFY_AGENT_CONTEXT_SHELL -and (Get-Command specify -ErrorAction SilentlyContinue)) {
+    if ($AgentType) { specify agent-context update $AgentType } else { specify agent-context update }
+    if ($LASTEXITCODE -ne 2) { exit $LASTEXITCODE }
+}
+
 # Import common helpers
 $ScriptDir = Split-Path -Parent $MyInvocation.MyCommand.Path
 . (Join-Path $ScriptDir 'common.ps1')
@@ -0,0 +1,5 @@
+"""Allow `python -m specify_cli`."""
+
+from . import main
+
+main()
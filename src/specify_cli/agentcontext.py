@@ -0,0 +1,256 @@
+"""Agent context files (CLAUDE.md, AGENTS.md, ...) kept in step with a feature's plan.md.
+
+This is the engine behind `specify agent-context update`, the Python
+counterpart of ``scripts/bash/update-agent-context.sh``. plan.md is parsed
+once, the new Active Technologies and Recent Changes entries are built once,
+and every target file is edited in memory in a single pass. Agents that share
+a file (AGENTS.md) are handled once. A file is written (atomically) only if
+its content changes; the "Last updated" date moves only together with a real
+edit, and an entry that is already listed is not added again, so running the
+update twice leaves the files untouched.
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import date
+from pathlib import Path
+
+from .config import AGENT_CONFIG
+from .errors import ConfigurationError
+from .projectcontext import write_text_atomic
+
+# Context file of each agent, relative to the repository root
+AGENT_CONTEXT_FILES = {
+    "claude": "CLAUDE.md",
+    "gemini": "GEMINI.md",
+    "copilot": ".github/agents/copilot-instructions.md",
+    "cursor-agent": ".cursor/rules/specify-rules.mdc",
+    "qwen": "QWEN.md",
+    "opencode": "AGENTS.md",
+    "codex": "AGENTS.md",
+    "windsurf": ".windsurf/rules/specify-rules.md",
+    "kilocode": ".kilocode/rules/specify-rules.md",
+    "auggie": ".augment/rules/specify-rules.md",
+    "roo": ".roo/rules/specify-rules.md",
+    "codebuddy": "CODEBUDDY.md",
+    "qoder": "QODER.md",
+    "amp": "AGENTS.md",
+    "shai": "SHAI.md",
+    "q": "AGENTS.md",
+    "bob": "AGENTS.md",
+}
+# Created when no agent file exists yet and no agent is named
+DEFAULT_AGENT = "claude"
+AGENT_FILE_TEMPLATE = Path(".specify") / "templates" / "agent-file-template.md"
+
+# plan.md "**Field**: value" lines read by the update, by result key
+PLAN_FIELDS = {
+    "Language/Version": "language",
+    "Primary Dependencies": "framework",
+    "Storage": "storage",
+    "Project Type": "project_type",
+}
+_PLAN_FIELD_RE = re.compile(r"^\*\*(" + "|".join(re.escape(field) for field in PLAN_FIELDS) + r")\*\*: (.*)$", re.MULTILINE)
+_SECTION_RE = re.compile(r"^##\s")
+_LAST_UPDATED_RE = re.compile(r"\*\*Last updated\*\*:.*\d{4}-\d{2}-\d{2}")
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+TECH_HEADING = "## Active Technologies"
+CHANGES_HEADING = "## Recent Changes"
+# Recent Changes keeps this many entries, newest first
+MAX_RECENT_CHANGES = 3
+
+
+def parse_plan(text: str) -> dict:
+    """Return the PLAN_FIELDS values of a plan.md (first occurrence of each).
+
+    Values that are empty, ``N/A`` or still say ``NEEDS CLARIFICATION`` are
+    returned as empty strings.
+    """
+    plan = dict.fromkeys(PLAN_FIELDS.values(), "")
+    seen = set()
+    for match in _PLAN_FIELD_RE.finditer(text):
+        field, value = match.group(1), match.group(2).strip()
+        if field in seen:
+            continue
+        seen.add(field)
+        if value != "N/A" and "NEEDS CLARIFICATION" not in value:
+            plan[PLAN_FIELDS[field]] = value
+    return plan
+
+
+def technology_stack(plan: dict) -> str:
+    """``language + framework``, whichever of the two are known."""
+    return " + ".join(value for value in (plan["language"], plan["framework"]) if value)
+
+
+def _project_structure(plan: dict) -> str:
+    return "backend/\nfrontend/\ntests/" if "web" in plan["project_type"] else "src/\ntests/"
+
+
+def _language_commands(language: str) -> str:
+    if "Python" in language:
+        return "cd src && pytest && ruff check ."
+    if "Rust" in language:
+        return "cargo test && cargo clippy"
+    if "JavaScript" in language or "TypeScript" in language:
+        return "npm test && npm run lint"
+    return f"# Add commands for {language}"
+
+
+def render_agent_file(template: str, plan: dict, branch: str, project_name: str, today: str) -> str:
+    """Fill in the agent-file template for a project whose first feature is ``branch``.
+
+    The technology and change entries are those of plan_entries(), so a
+    following update_agent_text() with the same plan changes nothing.
+    """
+    technologies, change = plan_entries(plan, branch)
+    replacements = {
+        "[PROJECT NAME]": project_name,
+        "[DATE]": today,
+        "[EXTRACTED FROM ALL PLAN.MD FILES]": "\n".join(line for _, line in technologies) or f"- ({branch})",
+        "[ACTUAL STRUCTURE FROM PLANS]": _project_structure(plan),
+        "[ONLY COMMANDS FOR ACTIVE TECHNOLOGIES]": _language_commands(plan["language"]),
+        "[LANGUAGE-SPECIFIC, ONLY FOR LANGUAGES IN USE]": f"{plan['language']}: Follow standard conventions",
+        "[LAST 3 FEATURES AND WHAT THEY ADDED]": change or f"- {branch}: Added",
+    }
+    pattern = re.compile("|".join(re.escape(placeholder) for placeholder in replacements))
+    return pattern.sub(lambda match: replacements[match.group(0)], template)
+
+
+def plan_entries(plan: dict, branch: str) -> tuple[list[tuple[str, str]], str]:
+    """Return the candidate technology entries (as ``(needle, line)``) and the Recent Changes line.
+
+    A technology entry is added to a file only if its needle does not occur
+    in it yet.
+    """
+    stack = technology_stack(plan)
+    technologies = [(value, f"- {value} ({branch})") for value in (stack, plan["storage"]) if value]
+    change = f"- {branch}: Added {stack or plan['storage']}" if stack or plan["storage"] else ""
+    return technologies, change
+
+
+def update_agent_text(text: str, technologies: list[tuple[str, str]], change: str, today: str) -> str:
+    """Apply the plan's entries to the text of an existing agent file in one pass.
+
+    New technologies go at the end of the Active Technologies list, the change
+    goes first under Recent Changes (which is trimmed to MAX_RECENT_CHANGES
+    entries) and missing sections are appended. Returns ``text`` itself when
+    nothing needs to change.
+    """
+    lines = text.splitlines()
+    new_tech = [line for needle, line in technologies if needle not in text]
+    if change in lines:
+        change = ""
+    keep_changes = MAX_RECENT_CHANGES - 1 if change else MAX_RECENT_CHANGES
+
+    out: list[str] = []
+    in_tech = in_changes = tech_added = False
+    kept_changes = 0
+    for line in lines:
+        if in_tech and (not line or _SECTION_RE.match(line)):
+            # New technologies go before the first blank line or the next heading
+            if not tech_added:
+                out.extend(new_tech)
+                tech_added = True
+            if not line:
+                out.append(line)
+                continue
+            in_tech = False  # and the heading is handled below (it may be Recent Changes)
+        if line == TECH_HEADING:
+            in_tech = True
+        elif line == CHANGES_HEADING:
+            out.append(line)
+            if change:
+                out.append(change)
+            in_changes = True
+            continue
+        elif in_changes and _SECTION_RE.match(line):
+            in_changes = False
+        elif in_changes and line.startswith("- "):
+            if kept_changes < keep_changes:
+                out.append(line)
+            kept_changes += 1
+            continue
+        out.append(line)
+    if in_tech and not tech_added:
+        out.extend(new_tech)
+    if not any(line.startswith(TECH_HEADING) for line in lines) and new_tech:
+        out.extend(["", TECH_HEADING, *new_tech])
+    if not any(line.startswith(CHANGES_HEADING) for line in lines) and change:
+        out.extend(["", CHANGES_HEADING, change])
+
+    if out == lines:
+        return text
+    return "\n".join(
+        _DATE_RE.sub(today, line, count=1) if _LAST_UPDATED_RE.search(line) else line for line in out
+    ) + "\n"
+
+
+def agent_context_targets(repo_root: Path, agent: str | None = None) -> list[tuple[Path, list[str]]]:
+    """Return ``(file, agents)`` pairs to update, one per distinct file.
+
+    With ``agent`` only its file is returned (created if missing). Otherwise
+    every existing agent file is returned, or the default agent's file when
+    there is none. Raises ConfigurationError for an unknown agent.
+    """
+    if agent is not None:
+        if agent not in AGENT_CONTEXT_FILES:
+            raise ConfigurationError(f"Unknown agent type '{agent}'. Choose from: {', '.join(AGENT_CONTEXT_FILES)}")
+        return [(repo_root / AGENT_CONTEXT_FILES[agent], [agent])]
+    targets: dict[str, list[str]] = {}
+    for name, relative in AGENT_CONTEXT_FILES.items():
+        targets.setdefault(relative, []).append(name)
+    existing = [(repo_root / relative, agents) for relative, agents in targets.items() if (repo_root / relative).is_file()]
+    return existing or [(repo_root / AGENT_CONTEXT_FILES[DEFAULT_AGENT], [DEFAULT_AGENT])]
+
+
+def update_agent_context(
+    repo_root: Path,
+    plan_file: Path,
+    branch: str,
+    *,
+    agent: str | None = None,
+    today: str | None = None,
+    dry_run: bool = False,
+) -> dict:
+    """Update (or create) the agent context files of ``repo_root`` from ``plan_file``.
+
+    Returns ``{"plan": parsed fields, "files": [...]}`` where each file
+    record has ``path``, ``agents``, ``status`` (``created``, ``updated``,
+    ``unchanged`` or ``error``) and ``detail``. With ``dry_run`` nothing is
+    written. Raises ConfigurationError if plan.md is missing or the agent is
+    unknown.
+    """
+    try:
+        plan = parse_plan(plan_file.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        raise ConfigurationError(f"No plan.md found at {plan_file}") from None
+    today = today or date.today().isoformat()
+    technologies, change = plan_entries(plan, branch)
+    template_path = repo_root / AGENT_FILE_TEMPLATE
+    template = None
+
+    files = []
+    for path, agents in agent_context_targets(repo_root, agent):
+        record = {"path": str(path), "agents": [AGENT_CONFIG.get(name, {}).get("name", name) for name in agents], "status": "unchanged", "detail": ""}
+        files.append(record)
+        try:
+            if path.is_file():
+                current = path.read_text(encoding="utf-8")
+                updated = update_agent_text(current, technologies, change, today)
+                if updated is current:
+                    continue
+                record["status"] = "updated"
+            else:
+                if template is None:
+                    template = template_path.read_text(encoding="utf-8")
+                updated = render_agent_file(template, plan, branch, repo_root.name, today)
+                record["status"] = "created"
+            if not dry_run:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                write_text_atomic(path, updated)
+        except OSError as e:
+            record.update(status="error", detail=str(e))
+    return {"plan": plan, "files": files}
@@ -0,0 +1,493 @@
+"""Programmatic project initialization, independent of the Typer commands.
+
+Initializer does what ``specify init`` does: it fetches the template, extracts
+it, creates the project context and initializes git. It never prompts, prints,
+raises typer.Exit, or reads or changes the process working directory, and it
+is safe to share between threads::
+
+    from specify_cli import Initializer
+
+    with Initializer(progress=print) as initializer:
+        result = initializer.create(Path("/srv/projects/billing"), ai="claude", script="sh")
+
+Release metadata is fetched once per Initializer, and each agent/script
+template is downloaded (or taken from the template cache) once. Downloads up
+to TEMPLATE_SPOOL_MAX_BYTES are spooled in memory and extracted from there;
+larger ones go through a ``.part`` file in a fixed directory, so an
+interrupted download is resumed by the next run. Concurrent
+``create`` calls that need the same template wait for the first download
+instead of repeating it. ``prefetch_async`` fetches several templates
+concurrently over one pooled AsyncClient (HTTP/2 when ``h2`` is installed), and
+``create_async`` uses it before running the rest of ``create`` in a worker
+thread, so an asyncio event loop is never blocked.
+
+Errors are raised as specify_cli.errors.SpecifyError subclasses. A project
+directory created by a failed call is removed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable
+
+from .archive import extract_template, resolve_local_template
+from .cache import TemplateCache
+from .config import AGENT_CONFIG, PROJECT_TYPE_CHOICES, SCRIPT_TYPE_CHOICES
+from .errors import (
+    ConfigurationError,
+    ProjectExistsError,
+    SpecifyError,
+    TemplateDownloadError,
+    TemplateExtractError,
+    TemplateNotFoundError,
+)
+from .github import (
+    TEMPLATE_SPOOL_MAX_BYTES,
+    _asset_sha256,
+    _template_asset_pattern,
+    download_release_asset,
+    download_release_asset_async,
+    fetch_latest_release,
+    fetch_latest_release_async,
+    find_template_asset,
+    get_async_http_client,
+    get_http_client,
+    stream_release_asset,
+    stream_release_asset_async,
+)
+from .project import create_greenfield_scaffolding, create_instructions_file, create_project_context, ensure_executable_scripts
+from .system import check_tool, init_git_repo, is_git_repo
+
+if TYPE_CHECKING:
+    import httpx
+
+# progress(project_path, step, status, detail, **metrics); status is one of the
+# StepTracker states: "running", "done", "error" or "skipped", and metrics are
+# the step's counters (e.g. files=..., bytes=...) as StepTracker records them
+ProgressCallback = Callable[..., None]
+
+def _default_script() -> str:
+    return "ps" if os.name == "nt" else "sh"
+
+class _CallbackSteps:
+    """StepTracker stand-in that forwards step updates to a progress callback."""
+
+    def __init__(self, progress: ProgressCallback | None, project_path: Path):
+        self._progress = progress
+        self._project_path = project_path
+
+    def _emit(self, key: str, status: str, detail: str, metrics: dict) -> None:
+        if self._progress is not None:
+            self._progress(self._project_path, key, status, detail, **metrics)
+
+    def add(self, key: str, label: str):
+        pass
+
+    def start(self, key: str, detail: str = "", **metrics):
+        self._emit(key, "running", detail, metrics)
+
+    def complete(self, key: str, detail: str = "", **metrics):
+        self._emit(key, "done", detail, metrics)
+
+    def error(self, key: str, detail: str = "", **metrics):
+        self._emit(key, "error", detail, metrics)
+
+    def skip(self, key: str, detail: str = "", **metrics):
+        self._emit(key, "skipped", detail, metrics)
+
+    def percent(self, key: str) -> Callable[[int, int], None]:
+        """Return an ``on_progress(done, total)`` reporting ``key`` as running at N%, once per percent."""
+        last = -1
+
+        def report(done: int, total: int) -> None:
+            nonlocal last
+            if total and done * 100 // total != last:
+                last = done * 100 // total
+                self.start(key, f"{last}%")
+        return report
+
+class Initializer:
+    """Create Specify projects in-process.
+
+    Args:
+        client: HTTP client for GitHub requests (default: the shared pooled
+            client from get_http_client). Async prefetches use their own
+            AsyncClient from get_async_http_client.
+        github_token: token for GitHub API requests (falls back to GH_TOKEN /
+            GITHUB_TOKEN).
+        use_cache: read and populate the local template cache.
+        template_source: local template zip, directory or mirror; when set,
+            no network access is made.
+        progress: optional ``progress(project_path, step, status, detail,
+            **metrics)`` callback. It is called from the thread running ``create``.
+        skip_tls: skip TLS verification when creating the client.
+        debug: include response bodies in HTTP error messages.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: httpx.Client | None = None,
+        github_token: str | None = None,
+        use_cache: bool = True,
+        template_source: Path | None = None,
+        progress: ProgressCallback | None = None,
+        skip_tls: bool = False,
+        debug: bool = False,
+    ):
+        self.github_token = github_token
+        self.template_source = template_source
+        self.progress = progress
+        self.debug = debug
+        self._client = client
+        self._skip_tls = skip_tls
+        self._cache = TemplateCache() if use_cache and template_source is None else None
+        self._lock = threading.Lock()
+        self._release: dict | None = None
+        self._release_lock = threading.Lock()
+        # (ai, script) -> (archive, asset name); the archive is a zip path, an unpacked directory or the zip's bytes
+        self._templates: dict[tuple[str, str], tuple[Path | bytes, str]] = {}
+        self._template_locks: dict[tuple[str, str], threading.Lock] = {}
+        self._inflight: dict[tuple[str, str], asyncio.Task] = {}
+        self._staging: Path | None = None
+        self._git_available: bool | None = None
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def close(self) -> None:
+        """Release spooled templates and remove downloaded archives that did not go into the template cache."""
+        with self._lock:
+            staging, self._staging = self._staging, None
+            self._templates.clear()
+        if staging is not None:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def __enter__(self) -> Initializer:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def client(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None:
+                self._client = get_http_client(skip_tls=self._skip_tls)
+            return self._client
+
+    def _download_dir(self) -> Path:
+        """Fixed directory for large downloads, so a ``.part`` file left by an interrupted run is resumed."""
+        path = self._cache.root / "downloads" if self._cache is not None else Path(tempfile.gettempdir()) / "specify-downloads"
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def _staging_dir(self) -> Path:
+        with self._lock:
+            if self._staging is None:
+                self._staging = Path(tempfile.mkdtemp(prefix="specify-templates-"))
+            return self._staging
+
+    # -- templates ---------------------------------------------------------
+
+    def release(self) -> dict:
+        """Return the latest release metadata, fetched once per Initializer."""
+        with self._release_lock:
+            if self._release is None:
+                try:
+                    self._release = fetch_latest_release(self.client, github_token=self.github_token, debug=self.debug)
+                except Exception as e:
+                    raise TemplateDownloadError(f"Could not fetch release information: {e}") from e
+            return self._release
+
+    def template(self, ai: str, script: str) -> Path | bytes:
+        """Return the template for an agent/script variant.
+
+        That is a local zip or directory, or the zip's bytes when the download
+        was spooled in memory. The first call for a variant downloads it (or
+        resolves it in the cache or local source). Later calls, from any
+        thread, reuse that result.
+        """
+        return self._template(ai, script, _CallbackSteps(None, Path()))[0]
+
+    def _template(self, ai: str, script: str, steps: _CallbackSteps) -> tuple[Path | bytes, str]:
+        key = (ai, script)
+        with self._lock:
+            variant_lock = self._template_locks.setdefault(key, threading.Lock())
+        with variant_lock:
+            if key in self._templates:
+                steps.skip("download", "already fetched")
+            else:
+                self._templates[key] = self._resolve_template(ai, script, steps)
+            return self._templates[key]
+
+    def _resolve_template(self, ai: str, script: str, steps: _CallbackSteps) -> tuple[Path | bytes, str]:
+        """Return (local archive or zip bytes, asset name) for a variant, reporting the "download" step."""
+        if self.template_source is not None:
+            try:
+                archive, meta = resolve_local_template(Path(self.template_source), ai, script)
+            except FileNotFoundError as e:
+                raise TemplateNotFoundError(str(e)) from e
+            steps.skip("download", "offline")
+            return archive, meta["filename"]
+
+        release = self.release()
+        asset, cached = self._lookup_asset(release, ai, script)
+        size = asset.get("size") or 0
+        if cached is not None:
+            steps.complete("download", f"{asset['name']} (cached)", bytes=size)
+            return cached, asset["name"]
+        steps.start("download", asset["name"])
+        try:
+            if 0 < size <= TEMPLATE_SPOOL_MAX_BYTES:
+                spool = io.BytesIO()
+                sha256 = stream_release_asset(self.client, asset, spool, on_progress=steps.percent("download"), github_token=self.github_token, debug=self.debug)
+                self._store_asset(release, asset, spool, sha256)
+                archive = spool.getvalue()
+            else:
+                target = self._download_dir() / asset["name"]
+                sha256 = download_release_asset(self.client, asset, target, on_progress=steps.percent("download"), github_token=self.github_token, debug=self.debug)
+                archive = self._keep_download(target, self._store_asset(release, asset, target, sha256))
+        except Exception as e:
+            steps.error("download", str(e))
+            if isinstance(e, SpecifyError):
+                raise
+            raise TemplateDownloadError(f"Could not download {asset['name']}: {e}") from e
+        steps.complete("download", asset["name"], bytes=size)
+        return archive, asset["name"]
+
+    def _keep_download(self, target: Path, stored: Path) -> Path:
+        """Return the archive to extract from, moving an uncached download into the staging directory."""
+        if stored != target:
+            target.unlink(missing_ok=True)
+            return stored
+        # Private to this Initializer, so another run resuming into the download directory cannot touch it
+        kept = Path(tempfile.mkdtemp(dir=self._staging_dir())) / target.name
+        shutil.move(target, kept)
+        return kept
+
+    def _lookup_asset(self, release: dict, ai: str, script: str) -> tuple[dict, Path | None]:
+        """Return the release asset for a variant and its cached archive, if any."""
+        asset = find_template_asset(release, ai, script)
+        if asset is None:
+            raise TemplateNotFoundError(f"Release {release.get('tag_name', '')} has no asset matching {_template_asset_pattern(ai, script)}")
+        cached = None
+        if self._cache is not None:
+            try:
+                cached = self._cache.lookup(release.get("tag_name", ""), asset["name"], _asset_sha256(asset))
+            except OSError:
+                pass
+        return asset, cached
+
+    def _store_asset(self, release: dict, asset: dict, source: Path | io.BytesIO, sha256: str) -> Path | io.BytesIO:
+        """Add a download to the template cache; return the cached path, or ``source`` if it was not cached."""
+        if self._cache is not None:
+            try:
+                return self._cache.store(release.get("tag_name", ""), asset["name"], source, sha256=sha256)
+            except OSError:
+                pass
+        return source
+
+    async def prefetch_async(self, variants: list[tuple[str, str]]) -> None:
+        """Resolve several (ai, script) templates concurrently on one AsyncClient.
+
+        The release lookup and all asset downloads share the client's
+        connections (multiplexed over one connection per host with HTTP/2).
+        Variants that are already resolved, or being resolved by another
+        prefetch on the same event loop, are not fetched again. Raises the
+        first SpecifyError encountered.
+        """
+        with self._lock:
+            missing = [variant for variant in dict.fromkeys(variants) if variant not in self._templates]
+        if not missing:
+            return
+        if self.template_source is not None:
+            for variant in missing:
+                self.template(*variant)
+            return
+
+        loop = asyncio.get_running_loop()
+        async with get_async_http_client(skip_tls=self._skip_tls) as client:
+            release = self._release
+            if release is None:
+                try:
+                    release = await fetch_latest_release_async(client, github_token=self.github_token, debug=self.debug)
+                except Exception as e:
+                    raise TemplateDownloadError(f"Could not fetch release information: {e}") from e
+                with self._release_lock:
+                    if self._release is None:
+                        self._release = release
+                    release = self._release
+
+            async def resolve(variant: tuple[str, str]) -> None:
+                asset, archive = self._lookup_asset(release, *variant)
+                if archive is None:
+                    try:
+                        if 0 < (asset.get("size") or 0) <= TEMPLATE_SPOOL_MAX_BYTES:
+                            spool = io.BytesIO()
+                            sha256 = await stream_release_asset_async(client, asset, spool, github_token=self.github_token, debug=self.debug)
+                            self._store_asset(release, asset, spool, sha256)
+                            archive = spool.getvalue()
+                        else:
+                            # A private directory, so a concurrent template() call for the same asset cannot collide
+                            target = Path(tempfile.mkdtemp(dir=self._staging_dir())) / asset["name"]
+                            sha256 = await download_release_asset_async(client, asset, target, github_token=self.github_token, debug=self.debug)
+                            archive = self._store_asset(release, asset, target, sha256)
+                    except SpecifyError:
+                        raise
+                    except Exception as e:
+                        raise TemplateDownloadError(f"Could not download {asset['name']}: {e}") from e
+                with self._lock:
+                    self._templates.setdefault(variant, (archive, asset["name"]))
+
+            tasks = []
+            with self._lock:
+                for variant in missing:
+                    task = self._inflight.get(variant)
+                    if task is None or task.get_loop() is not loop or (task.done() and variant not in self._templates):
+                        task = self._inflight[variant] = loop.create_task(resolve(variant))
+                    tasks.append(task)
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    # -- projects ----------------------------------------------------------
+
+    def create(
+        self,
+        project_path: Path,
+        *,
+        ai: str,
+        script: str | None = None,
+        project_type: str = "greenfield",
+        description: str = "",
+        merge: bool = False,
+        git: bool = True,
+        instructions: bool = False,
+        scaffolding: bool = False,
+        verify_permissions: bool = False,
+    ) -> dict:
+        """Initialize one project at ``project_path`` (an absolute path).
+
+        With ``merge`` the template is merged into an existing directory (like
+        ``init --here``). Otherwise the directory must not exist yet. A git
+        failure does not fail the call; it is reported in the result. Script
+        permissions are set during extraction; ``verify_permissions`` re-scans
+        the scripts afterwards and fixes any that were missed.
+
+        Returns a dict with ``path``, ``ai``, ``script``, ``project_type``,
+        ``template``, ``files``, ``git`` (``initialized``, ``existing repo``,
+        ``skipped``, ``git not available`` or ``init failed``), ``git_error``
+        and ``elapsed_ms``.
+        """
+        script = script or _default_script()
+        project_path = Path(project_path)
+        if not project_path.is_absolute():
+            raise ConfigurationError(f"project_path must be absolute, got {project_path}")
+        if ai not in AGENT_CONFIG:
+            raise ConfigurationError(f"Invalid AI assistant '{ai}'. Choose from: {', '.join(AGENT_CONFIG)}")
+        if script not in SCRIPT_TYPE_CHOICES:
+            raise ConfigurationError(f"Invalid script type '{script}'. Choose from: {', '.join(SCRIPT_TYPE_CHOICES)}")
+        if project_type not in PROJECT_TYPE_CHOICES:
+            raise ConfigurationError(f"Invalid project type '{project_type}'. Choose from: {', '.join(PROJECT_TYPE_CHOICES)}")
+        if not merge and project_path.exists():
+            raise ProjectExistsError(f"Directory {project_path} already exists")
+
+        steps = _CallbackSteps(self.progress, project_path)
+        started = time.perf_counter()
+        steps.start("fetch", f"{ai} ({script})")
+        try:
+            archive, template_name = self._template(ai, script, steps)
+        except SpecifyError as e:
+            steps.error("fetch", str(e))
+            raise
+        steps.complete("fetch", template_name)
+
+        created = False
+        try:
+            if not merge:
+                try:
+                    project_path.mkdir(parents=True)
+                except FileExistsError:
+                    raise ProjectExistsError(f"Directory {project_path} already exists") from None
+                created = True
+
+            steps.start("extract")
+            try:
+                stats = extract_template(
+                    io.BytesIO(archive) if isinstance(archive, bytes) else archive,
+                    project_path, merge=merge, verbose=False, tracker=steps, on_progress=steps.percent("extract"),
+                )
+            except Exception as e:
+                steps.error("extract", str(e))
+                raise TemplateExtractError(f"Could not extract {template_name}: {e}") from e
+            if stats["bytes"] is not None:
+                steps.complete("extract", f"{stats['files']} files, {stats['bytes']:,} bytes", bytes=stats["bytes"], files=stats["files"])
+            else:
+                steps.complete("extract")
+
+            if verify_permissions:
+                ensure_executable_scripts(project_path, tracker=steps, verify=True)
+            create_project_context(project_path, project_type, description, tracker=steps)
+            if instructions:
+                create_instructions_file(project_path, tracker=steps)
+            if scaffolding:
+                create_greenfield_scaffolding(project_path, tracker=steps)
+
+            git_status, git_error = self._init_git(project_path, git, steps)
+        except BaseException:
+            if created:
+                shutil.rmtree(project_path, ignore_errors=True)
+            raise
+
+        steps.complete("final", "project ready")
+        return {
+            "path": str(project_path),
+            "ai": ai,
+            "script": script,
+            "project_type": project_type,
+            "template": template_name,
+            "files": stats["files"],
+            "git": git_status,
+            "git_error": git_error,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+
+    def _init_git(self, project_path: Path, git: bool, steps: _CallbackSteps) -> tuple[str, str | None]:
+        if not git:
+            steps.skip("git", "disabled")
+            return "skipped", None
+        if is_git_repo(project_path):
+            steps.complete("git", "existing repo detected")
+            return "existing repo", None
+        # The in-process writer needs no git binary; only a failed fallback to it does
+        steps.start("git")
+        success, error_msg = init_git_repo(project_path, quiet=True)
+        if success:
+            steps.complete("git", "initialized")
+            return "initialized", None
+        with self._lock:
+            if self._git_available is None:
+                self._git_available = check_tool("git")
+        if not self._git_available:
+            steps.skip("git", "git not available")
+            return "git not available", None
+        steps.error("git", "init failed")
+        return "init failed", error_msg
+
+    async def create_async(self, project_path: Path, *, ai: str, script: str | None = None, **options) -> dict:
+        """Async create(): fetch the template with prefetch_async, then set up the project in a worker thread.
+
+        Takes the same keyword arguments as create().
+        """
+        script = script or _default_script()
+        if ai in AGENT_CONFIG and script in SCRIPT_TYPE_CHOICES:
+            await self.prefetch_async([(ai, script)])
+        return await asyncio.to_thread(self.create, project_path, ai=ai, script=script, **options)
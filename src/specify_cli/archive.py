@@ -0,0 +1,479 @@
+"""Template archives: local sources, single-pass extraction and settings merging."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Callable, Tuple
+
+import typer
+from rich.panel import Panel
+
+from .github import MIRROR_RELEASE_FILE, _template_asset_pattern, download_template_from_github, find_template_asset
+from .project import ensure_executable_scripts, executable_mode, is_template_script
+from .ui import StepTracker, _progress_bar, console
+
+if TYPE_CHECKING:
+    import zipfile
+
+    import httpx
+
+EXTRACT_CHUNK_SIZE = 1024 * 1024
+
+def handle_vscode_settings(sub_item, dest_file, rel_path, verbose=False, tracker=None) -> None:
+    """Handle merging or copying of .vscode/settings.json files."""
+    def log(message, color="green"):
+        if verbose and not tracker:
+            console.print(f"[{color}]{message}[/] {rel_path}")
+
+    try:
+        with open(sub_item, 'r', encoding='utf-8') as f:
+            new_settings = json.load(f)
+
+        if dest_file.exists():
+            merged = merge_json_files(dest_file, new_settings, verbose=verbose and not tracker)
+            with open(dest_file, 'w', encoding='utf-8') as f:
+                json.dump(merged, f, indent=4)
+                f.write('\n')
+            log("Merged:", "green")
+        else:
+            shutil.copy2(sub_item, dest_file)
+            log("Copied (no existing settings.json):", "blue")
+
+    except Exception as e:
+        log(f"Warning: Could not merge, copying instead: {e}", "yellow")
+        shutil.copy2(sub_item, dest_file)
+
+def merge_json_files(existing_path: Path, new_content: dict, verbose: bool = False) -> dict:
+    """Merge new JSON content into existing JSON file.
+
+    Performs a deep merge where:
+    - New keys are added
+    - Existing keys are preserved unless overwritten by new content
+    - Nested dictionaries are merged recursively
+    - Lists and other values are replaced (not merged)
+
+    Args:
+        existing_path: Path to existing JSON file
+        new_content: New JSON content to merge in
+        verbose: Whether to print merge details
+
+    Returns:
+        Merged JSON content as dict
+    """
+    try:
+        with open(existing_path, 'r', encoding='utf-8') as f:
+            existing_content = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        # If file doesn't exist or is invalid, just use new content
+        return new_content
+
+    def deep_merge(base: dict, update: dict) -> dict:
+        """Recursively merge update dict into base dict."""
+        result = base.copy()
+        for key, value in update.items():
+            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
+                # Recursively merge nested dictionaries
+                result[key] = deep_merge(result[key], value)
+            else:
+                # Add new key or replace existing value
+                result[key] = value
+        return result
+
+    merged = deep_merge(existing_content, new_content)
+
+    if verbose:
+        console.print(f"[cyan]Merged JSON file:[/cyan] {existing_path.name}")
+
+    return merged
+
+def resolve_local_template(source: Path, ai_assistant: str, script_type: str) -> Tuple[Path, dict]:
+    """Locate the template for an agent/script variant in a local source.
+
+    ``source`` may be a template zip, an unpacked template directory, or a mirror
+    root created by ``specify templates pull`` (a directory holding
+    ``release.json`` next to the downloaded assets). Raises FileNotFoundError if
+    nothing usable is found. Local results are flagged with ``metadata["local"]``
+    and must not be deleted by the caller.
+    """
+    import zipfile
+    source = source.expanduser().resolve()
+    if not source.exists():
+        raise FileNotFoundError(f"Template source not found: {source}")
+
+    if source.is_file():
+        if not zipfile.is_zipfile(source):
+            raise FileNotFoundError(f"Template source is not a zip archive: {source}")
+        return source, {"filename": source.name, "size": source.stat().st_size, "release": "local", "local": True}
+
+    release_file = source / MIRROR_RELEASE_FILE
+    if release_file.is_file():
+        with open(release_file, "r", encoding="utf-8") as f:
+            release_data = json.load(f)
+        asset = find_template_asset(release_data, ai_assistant, script_type)
+        if asset is None or not (source / asset["name"]).is_file():
+            pattern = _template_asset_pattern(ai_assistant, script_type)
+            raise FileNotFoundError(f"Mirror {source} has no asset matching {pattern} (run 'specify templates pull' to fetch it)")
+        zip_path = source / asset["name"]
+        return zip_path, {"filename": asset["name"], "size": zip_path.stat().st_size, "release": release_data.get("tag_name", "local"), "local": True}
+
+    candidates = sorted(source.glob(f"{_template_asset_pattern(ai_assistant, script_type)}*.zip"))
+    if candidates:
+        zip_path = candidates[-1]
+        return zip_path, {"filename": zip_path.name, "size": zip_path.stat().st_size, "release": "local", "local": True}
+
+    # Anything else is treated as an already unpacked template tree
+    return source, {"filename": source.name, "size": 0, "release": "local", "local": True}
+
+def _fetch_template_archive(download_dir: Path | None, ai_assistant: str, script_type: str, *, verbose: bool = True, tracker: StepTracker | None = None, client: httpx.Client = None, debug: bool = False, github_token: str = None, use_cache: bool = True, on_progress: Callable[[int, int], None] | None = None) -> Tuple[Path | IO[bytes], dict]:
+    """Download (or reuse a cached copy of) the release template, updating tracker keys fetch/download."""
+    if tracker:
+        tracker.start("fetch", "contacting GitHub API")
+    try:
+        zip_path, meta = download_template_from_github(
+            ai_assistant,
+            download_dir,
+            script_type=script_type,
+            verbose=verbose and tracker is None,
+            show_progress=(tracker is None),
+            client=client,
+            debug=debug,
+            github_token=github_token,
+            use_cache=use_cache,
+            on_progress=on_progress,
+        )
+        if tracker:
+            tracker.complete("fetch", f"release {meta['release']} ({meta['size']:,} bytes)")
+            tracker.add("download", "Download template")
+            tracker.complete("download", f"{meta['filename']} (cached)" if meta.get("cached") else meta['filename'], bytes=meta["size"])
+    except Exception as e:
+        if tracker:
+            tracker.error("fetch", str(e))
+        else:
+            if verbose:
+                console.print(f"[red]Error downloading template:[/red] {e}")
+        raise
+    return zip_path, meta
+
+def _merge_template_dir(source_dir: Path, project_path: Path, *, verbose: bool = True, tracker: StepTracker | None = None) -> None:
+    """Copy an unpacked template tree into project_path, merging into existing directories."""
+    for item in source_dir.iterdir():
+        dest_path = project_path / item.name
+        if item.is_dir():
+            if dest_path.exists():
+                if verbose and not tracker:
+                    console.print(f"[yellow]Merging directory:[/yellow] {item.name}")
+                for sub_item in item.rglob('*'):
+                    if sub_item.is_file():
+                        rel_path = sub_item.relative_to(item)
+                        dest_file = dest_path / rel_path
+                        dest_file.parent.mkdir(parents=True, exist_ok=True)
+                        # Special handling for .vscode/settings.json - merge instead of overwrite
+                        if dest_file.name == "settings.json" and dest_file.parent.name == ".vscode":
+                            handle_vscode_settings(sub_item, dest_file, rel_path, verbose, tracker)
+                        else:
+                            shutil.copy2(sub_item, dest_file)
+            else:
+                shutil.copytree(item, dest_path)
+        else:
+            if dest_path.exists() and verbose and not tracker:
+                console.print(f"[yellow]Overwriting file:[/yellow] {item.name}")
+            shutil.copy2(item, dest_path)
+
+def _template_zip_prefix(names: list[str]) -> str:
+    """Return the single top-level directory shared by all member names ("" if none).
+
+    Mirrors the old extract-then-flatten behaviour: a template whose only
+    top-level item is a directory has that directory stripped. ``names`` use
+    ``/`` as the separator.
+    """
+    names = [name.lstrip("/") for name in names if name.strip("/")]
+    top_levels = {name.split("/", 1)[0] for name in names}
+    if len(top_levels) != 1:
+        return ""
+    top = next(iter(top_levels))
+    if all(name.startswith(f"{top}/") for name in names):
+        return f"{top}/"
+    return ""
+
+def _stored_mode(info: zipfile.ZipInfo) -> int:
+    """Permission bits stored for a zip member by a Unix archiver (0 otherwise)."""
+    return (info.external_attr >> 16) & 0o777 if info.create_system == 3 else 0
+
+def extract_template_zip(zip_ref: zipfile.ZipFile, project_path: Path, *, merge: bool = False, verbose: bool = True, tracker: StepTracker | None = None, on_progress: Callable[[int, int], None] | None = None) -> dict:
+    """Extract a template archive straight into project_path in a single pass.
+
+    Members are streamed directly to their final location with the shared
+    top-level directory (if any) stripped, so no temporary tree is written or
+    walked. With ``merge`` (``init --here``) an existing ``.vscode/settings.json``
+    is deep-merged with the template's copy instead of being overwritten.
+
+    Execute permissions are applied on the open file as it is written: a
+    member is made executable when its stored Unix mode has any execute bit,
+    or when it is a ``.specify/scripts/**/*.sh`` file starting with ``#!``, so
+    no separate chmod walk over the project is needed afterwards.
+
+    ``on_progress(extracted_bytes, total_bytes)`` is called after each file.
+    Returns counts of extracted files, bytes, top-level items and files made
+    executable (``executable`` is None where permissions are not supported).
+    """
+    members = zip_ref.infolist()
+    # Some Windows archivers store "\\" separators; normalize them once for every use below
+    names = [m.filename.replace("\\", "/") for m in members]
+    prefix = _template_zip_prefix(names)
+    total_bytes = sum(m.file_size for m in members)
+    root = project_path.resolve()
+    created_dirs: set[Path] = set()
+    top_level: set[str] = set()
+    files = 0
+    written = 0
+    set_modes = hasattr(os, "fchmod")
+    executable = 0
+
+    def ensure_dir(path: Path) -> None:
+        if path not in created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            created_dirs.add(path)
+
+    for info, name in zip(members, names):
+        parts = [p for p in name.split("/") if p and p != "."]
+        if ".." in parts or (parts and ":" in parts[0]):
+            raise ValueError(f"Unsafe path in template archive: {info.filename}")
+        parts = [p for p in name.lstrip("/")[len(prefix):].split("/") if p and p != "."]
+        if not parts:
+            continue
+        dest = root.joinpath(*parts)
+        is_dir = name.endswith("/")
+
+        if parts[0] not in top_level:
+            top_level.add(parts[0])
+            if merge and verbose and not tracker and (root / parts[0]).exists():
+                if len(parts) > 1 or is_dir:
+                    console.print(f"[yellow]Merging directory:[/yellow] {parts[0]}")
+                else:
+                    console.print(f"[yellow]Overwriting file:[/yellow] {parts[0]}")
+
+        if is_dir:
+            ensure_dir(dest)
+            continue
+        ensure_dir(dest.parent)
+
+        # Special handling for .vscode/settings.json - merge instead of overwrite
+        if merge and dest.name == "settings.json" and dest.parent.name == ".vscode" and dest.exists():
+            data = zip_ref.read(info)
+            rel_path = Path(*parts[1:]) if len(parts) > 1 else Path(parts[0])
+            try:
+                merged = merge_json_files(dest, json.loads(data), verbose=verbose and not tracker)
+                with open(dest, 'w', encoding='utf-8') as f:
+                    json.dump(merged, f, indent=4)
+                    f.write('\n')
+                if verbose and not tracker:
+                    console.print(f"[green]Merged:[/] {rel_path}")
+            except Exception as e:
+                if verbose and not tracker:
+                    console.print(f"[yellow]Warning: Could not merge, copying instead: {e}[/] {rel_path}")
+                dest.write_bytes(data)
+        else:
+            with zip_ref.open(info) as src, open(dest, 'wb') as dst:
+                head = src.read(EXTRACT_CHUNK_SIZE)
+                dst.write(head)
+                shutil.copyfileobj(src, dst, EXTRACT_CHUNK_SIZE)
+                if set_modes and (_stored_mode(info) & 0o111 or (is_template_script(parts) and head.startswith(b"#!"))):
+                    os.fchmod(dst.fileno(), executable_mode(os.fstat(dst.fileno()).st_mode & 0o7777))
+                    executable += 1
+        files += 1
+        written += info.file_size
+        if on_progress:
+            on_progress(written, total_bytes)
+
+    return {
+        "files": files, "bytes": written, "top_level": len(top_level), "flattened": bool(prefix),
+        "executable": executable if set_modes else None,
+    }
+
+def extract_template(archive: Path | IO[bytes], project_path: Path, *, merge: bool = False, verbose: bool = True, tracker: StepTracker | None = None, on_progress: Callable[[int, int], None] | None = None) -> dict:
+    """Copy a template zip (path or file object) or unpacked template directory into an existing project_path.
+
+    Updates tracker keys zip-list/extracted-summary/flatten/chmod. Returns the
+    counts from extract_template_zip; ``bytes`` is None for an unpacked
+    directory, whose scripts are fixed up by ensure_executable_scripts instead.
+    Raises on unsafe or unreadable archives; the caller cleans up project_path.
+    """
+    import zipfile
+    if isinstance(archive, Path) and archive.is_dir():
+        # Unpacked template directory (offline --from): copy instead of extracting
+        extracted_items = list(archive.iterdir())
+        if tracker:
+            tracker.skip("zip-list", "unpacked directory")
+            tracker.start("extracted-summary")
+            tracker.complete("extracted-summary", f"{len(extracted_items)} top-level items")
+        source_dir = archive
+        flattened = len(extracted_items) == 1 and extracted_items[0].is_dir()
+        if flattened:
+            source_dir = extracted_items[0]
+            if tracker:
+                tracker.add("flatten", "Flatten nested directory")
+                tracker.complete("flatten")
+        _merge_template_dir(source_dir, project_path, verbose=verbose, tracker=tracker)
+        ensure_executable_scripts(project_path, tracker=tracker)
+        return {"files": None, "bytes": None, "top_level": len(extracted_items), "flattened": flattened, "executable": None}
+
+    with zipfile.ZipFile(archive, 'r') as zip_ref:
+        if tracker:
+            tracker.start("zip-list")
+            tracker.complete("zip-list", f"{len(zip_ref.infolist())} entries")
+        elif verbose:
+            console.print(f"[cyan]ZIP contains {len(zip_ref.infolist())} items[/cyan]")
+
+        stats = extract_template_zip(zip_ref, project_path, merge=merge, verbose=verbose, tracker=tracker, on_progress=on_progress)
+
+    if tracker:
+        tracker.start("extracted-summary")
+        tracker.complete("extracted-summary", f"{stats['top_level']} top-level items, {stats['files']} files")
+        if stats["flattened"]:
+            tracker.add("flatten", "Flatten nested directory")
+            tracker.complete("flatten")
+        if stats["executable"] is not None:
+            tracker.add("chmod", "Set script permissions")
+            tracker.complete("chmod", f"{stats['executable']} set during extraction", files=stats["executable"])
+    elif verbose:
+        console.print(f"[cyan]Extracted {stats['files']} files ({stats['bytes']:,} bytes) into {project_path}[/cyan]")
+        if stats["flattened"]:
+            console.print(f"[cyan]Flattened nested directory structure[/cyan]")
+    return stats
+
+def download_and_extract_template(project_path: Path, ai_assistant: str, script_type: str, is_current_dir: bool = False, *, verbose: bool = True, tracker: StepTracker | None = None, client: httpx.Client = None, debug: bool = False, github_token: str = None, use_cache: bool = True, template_source: Path | None = None) -> Path:
+    """Download the latest release and extract it to create a new project.
+    Returns project_path. Uses tracker if provided (with keys: fetch, download, extract, cleanup)
+
+    The download is spooled in memory (see TEMPLATE_SPOOL_MAX_BYTES) and
+    extracted from there, so no archive is written to the working directory.
+    Progress for both phases is shown on one Rich progress display, or as
+    percentages on the tracker's download/extract steps.
+
+    With ``template_source`` the template comes from a local zip, unpacked
+    directory or mirror root (see resolve_local_template) and no network access
+    is made.
+    """
+    progress = _progress_bar() if tracker is None else None
+    progress_tasks: dict[str, int] = {}
+    last_percent: dict[str, int] = {}
+
+    def report(step: str, done: int, total: int) -> None:
+        if progress is not None:
+            if step not in progress_tasks:
+                label = "Downloading..." if step == "download" else "Extracting..."
+                progress_tasks[step] = progress.add_task(label, total=total or None)
+            progress.update(progress_tasks[step], completed=done, total=total or None)
+        elif total:
+            percent = done * 100 // total
+            if last_percent.get(step) != percent:  # one tracker refresh per percent
+                last_percent[step] = percent
+                tracker.start(step, f"{percent}%")
+
+    if progress is not None:
+        progress.start()
+    try:
+        return _download_and_extract(
+            project_path, ai_assistant, script_type, is_current_dir,
+            verbose=verbose, tracker=tracker, client=client, debug=debug,
+            github_token=github_token, use_cache=use_cache,
+            template_source=template_source, report=report,
+        )
+    finally:
+        if progress is not None:
+            progress.stop()
+
+def _download_and_extract(project_path: Path, ai_assistant: str, script_type: str, is_current_dir: bool, *, verbose: bool, tracker: StepTracker | None, client: httpx.Client, debug: bool, github_token: str, use_cache: bool, template_source: Path | None, report: Callable[[str, int, int], None]) -> Path:
+    if template_source is not None:
+        if tracker:
+            tracker.start("fetch", "local template")
+        try:
+            archive, meta = resolve_local_template(template_source, ai_assistant, script_type)
+        except Exception as e:
+            if tracker:
+                tracker.error("fetch", str(e))
+            else:
+                console.print(f"[red]Error resolving local template:[/red] {e}")
+            raise typer.Exit(1)
+        if tracker:
+            release_label = "template" if meta["release"] == "local" else meta["release"]
+            tracker.complete("fetch", f"local {release_label} ({archive.name})")
+            tracker.add("download", "Download template")
+            tracker.skip("download", "offline")
+        elif verbose:
+            console.print(f"[cyan]Using local template:[/cyan] {archive}")
+    else:
+        archive, meta = _fetch_template_archive(
+            None,
+            ai_assistant,
+            script_type,
+            verbose=verbose,
+            tracker=tracker,
+            client=client,
+            debug=debug,
+            github_token=github_token,
+            use_cache=use_cache,
+            on_progress=lambda done, total: report("download", done, total),
+        )
+
+    if tracker:
+        tracker.add("extract", "Extract template")
+        tracker.start("extract")
+    elif verbose:
+        console.print("Extracting template...")
+
+    extract_detail = ""
+    extract_metrics = {}
+    try:
+        if not is_current_dir:
+            project_path.mkdir(parents=True)
+
+        stats = extract_template(
+            archive,
+            project_path,
+            merge=is_current_dir,
+            verbose=verbose,
+            tracker=tracker,
+            on_progress=lambda done, total: report("extract", done, total),
+        )
+        if stats["bytes"] is not None:
+            extract_detail = f"{stats['bytes']:,} bytes"
+            extract_metrics = {"bytes": stats["bytes"], "files": stats["files"]}
+    except Exception as e:
+        if tracker:
+            tracker.error("extract", str(e))
+        else:
+            if verbose:
+                console.print(f"[red]Error extracting template:[/red] {e}")
+                if debug:
+                    console.print(Panel(str(e), title="Extraction Error", border_style="red"))
+
+        if not is_current_dir and project_path.exists():
+            shutil.rmtree(project_path)
+        raise typer.Exit(1)
+    else:
+        if tracker:
+            tracker.complete("extract", extract_detail, **extract_metrics)
+    finally:
+        if tracker:
+            tracker.add("cleanup", "Remove temporary archive")
+
+        if meta.get("cached") or meta.get("local"):
+            # Archive lives in the template cache or a local mirror; leave it in place
+            if tracker:
+                tracker.skip("cleanup", "local template kept" if meta.get("local") else "cached archive kept")
+        elif meta.get("spooled"):
+            archive.close()
+            if tracker:
+                tracker.complete("cleanup", "in-memory archive released")
+        elif archive.exists():
+            archive.unlink()
+            if tracker:
+                tracker.complete("cleanup")
+            elif verbose:
+                console.print(f"Cleaned up: {archive.name}")
+
+    return project_path
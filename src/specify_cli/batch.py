@@ -0,0 +1,306 @@
+"""`specify init --batch`: initialize many projects from one manifest.
+
+The manifest lists the projects to create. Release metadata is fetched once,
+and each distinct template asset is downloaded (or taken from the template
+cache) once, concurrently over one pooled async HTTP client. The projects are
+then extracted and initialized in parallel on a thread pool. Progress is shown as one StepTracker line per project.
+
+Manifest format (the YAML subset of ``yamldoc``, or JSON when the file ends in ``.json``)::
+
+    defaults:
+      ai: claude
+      script: sh
+    projects:
+      - name: billing-service
+        project_type: brownfield
+        description: Invoicing and payment reconciliation
+      - name: auth-service
+        ai: copilot
+        git: false
+      - search-service          # a bare name uses the defaults
+
+Project keys: ``name`` (required), ``path`` (defaults to the name, relative to
+the working directory), ``ai``, ``script``, ``project_type``, ``description``,
+``git``, ``instructions`` and ``scaffolding``. Any of them except name/path can
+also appear under ``defaults``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import typer
+from rich.panel import Panel
+
+from .api import Initializer
+from .config import AGENT_CONFIG, PROJECT_TYPE_CHOICES, SCRIPT_TYPE_CHOICES
+from .errors import ConfigurationError, SpecifyError
+from .system import check_tool
+from .ui import StepTracker, console, report_timings
+from .yamldoc import YamlError, parse_yaml
+
+BATCH_MAX_WORKERS = 8
+
+PROJECT_KEYS = {"name", "path", "ai", "script", "project_type", "description", "git", "instructions", "scaffolding"}
+DEFAULT_KEYS = PROJECT_KEYS - {"name", "path"}
+
+# ---------------------------------------------------------------------------
+# Manifest parsing
+# ---------------------------------------------------------------------------
+
+class ManifestError(ConfigurationError):
+    """The batch manifest is malformed or describes invalid projects."""
+
+def parse_manifest(text: str) -> Any:
+    """Parse a manifest written in the YAML subset of ``specify_cli.yamldoc``."""
+    try:
+        return parse_yaml(text)
+    except YamlError as e:
+        raise ManifestError(str(e)) from None
+
+def load_manifest(path: Path) -> list[dict]:
+    """Read a manifest file and return its normalized project entries.
+
+    Every entry holds all PROJECT_KEYS; unset values are None. Raises
+    ManifestError for syntax errors, unknown keys and duplicate names.
+    """
+    text = path.read_text(encoding="utf-8")
+    if path.suffix.lower() == ".json":
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ManifestError(str(e)) from None
+    else:
+        data = parse_manifest(text)
+
+    defaults: dict = {}
+    if isinstance(data, dict):
+        unknown = set(data) - {"defaults", "projects"}
+        if unknown:
+            raise ManifestError(f"unknown top-level key(s): {', '.join(sorted(unknown))}")
+        defaults = data.get("defaults") or {}
+        data = data.get("projects")
+    if not isinstance(data, list) or not data:
+        raise ManifestError("manifest must contain a non-empty 'projects' list")
+    if not isinstance(defaults, dict):
+        raise ManifestError("'defaults' must be a mapping")
+    unknown = set(defaults) - DEFAULT_KEYS
+    if unknown:
+        raise ManifestError(f"unknown key(s) in defaults: {', '.join(sorted(unknown))}")
+
+    projects = []
+    for index, entry in enumerate(data, 1):
+        if isinstance(entry, (str, int)):
+            entry = {"name": str(entry)}
+        if not isinstance(entry, dict) or not entry.get("name"):
+            raise ManifestError(f"project #{index} needs a name")
+        unknown = set(entry) - PROJECT_KEYS
+        if unknown:
+            raise ManifestError(f"project {entry['name']!r}: unknown key(s) {', '.join(sorted(unknown))}")
+        project = {key: defaults.get(key) for key in PROJECT_KEYS}
+        project.update({key: value for key, value in entry.items() if value is not None})
+        project["name"] = str(project["name"])
+        projects.append(project)
+
+    names = [project["name"] for project in projects]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ManifestError(f"duplicate project name(s): {', '.join(duplicates)}")
+    return projects
+
+# ---------------------------------------------------------------------------
+# Planning and execution
+# ---------------------------------------------------------------------------
+
+# Tracker labels for the steps Initializer reports through its progress callback
+STEP_LABELS = {
+    "fetch": "fetching template",
+    "download": "downloading template",
+    "extract": "extracting",
+    "zip-list": "extracting",
+    "extracted-summary": "extracting",
+    "chmod": "setting script permissions",
+    "chmod-verify": "verifying script permissions",
+    "context": "writing project context",
+    "instructions": "writing instructions.md",
+    "scaffolding": "writing docs/",
+    "git": "initializing git",
+}
+
+def plan_batch(projects: list[dict], *, ai: str | None, script: str | None, no_git: bool) -> list[str]:
+    """Fill in CLI and built-in defaults and resolve target paths; return validation errors."""
+    errors = []
+    default_script = "ps" if os.name == "nt" else "sh"
+    for project in projects:
+        name = project["name"]
+        project["ai"] = project["ai"] or ai
+        project["script"] = project["script"] or script or default_script
+        project["project_type"] = project["project_type"] or "greenfield"
+        project["description"] = str(project["description"] or "")
+        project["git"] = not no_git and project["git"] is not False
+        project["path"] = Path(project["path"] or name).expanduser().resolve()
+        if not project["ai"]:
+            errors.append(f"{name}: no AI assistant (set 'ai' in the manifest or pass --ai)")
+        elif project["ai"] not in AGENT_CONFIG:
+            errors.append(f"{name}: invalid AI assistant '{project['ai']}'. Choose from: {', '.join(AGENT_CONFIG)}")
+        if project["script"] not in SCRIPT_TYPE_CHOICES:
+            errors.append(f"{name}: invalid script type '{project['script']}'. Choose from: {', '.join(SCRIPT_TYPE_CHOICES)}")
+        if project["project_type"] not in PROJECT_TYPE_CHOICES:
+            errors.append(f"{name}: invalid project type '{project['project_type']}'. Choose from: {', '.join(PROJECT_TYPE_CHOICES)}")
+        if project["path"].exists():
+            errors.append(f"{name}: directory {project['path']} already exists")
+    paths = [project["path"] for project in projects]
+    for path in sorted({path for path in paths if paths.count(path) > 1}):
+        errors.append(f"several projects target {path}")
+    return errors
+
+def _initialize_project(initializer: Initializer, project: dict, *, tracker: StepTracker, lock: threading.Lock, verify_permissions: bool = False) -> dict:
+    """Create one project; never raises. Returns its summary record."""
+    key = f"project:{project['name']}"
+    result = {"name": project["name"], "path": str(project["path"]), "status": "error", "detail": "", "git": None, "elapsed_ms": 0.0}
+    started = time.perf_counter()
+    try:
+        created = initializer.create(
+            project["path"],
+            ai=project["ai"],
+            script=project["script"],
+            project_type=project["project_type"],
+            description=project["description"],
+            git=project["git"],
+            instructions=bool(project["instructions"]),
+            scaffolding=bool(project["scaffolding"]),
+            verify_permissions=verify_permissions,
+        )
+    except Exception as e:
+        result["detail"] = str(e) or type(e).__name__
+    else:
+        result.update(status="done", git=created["git"], detail=created["git_error"] or "")
+    result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+    summary = f"{project['ai']}/{project['script']}, {project['project_type']}, {result['elapsed_ms'] / 1000:.1f}s"
+    with lock:
+        if result["status"] == "done":
+            tracker.complete(key, summary + (f", git {result['git']}" if result["git"] not in ("initialized", "skipped") else ""))
+        else:
+            tracker.error(key, result["detail"].splitlines()[0])
+    return result
+
+def run_batch(
+    manifest: Path,
+    *,
+    ai: str | None = None,
+    script: str | None = None,
+    ignore_agent_tools: bool = False,
+    no_git: bool = False,
+    skip_tls: bool = False,
+    debug: bool = False,
+    github_token: str | None = None,
+    use_cache: bool = True,
+    template_source: Path | None = None,
+    jobs: int | None = None,
+    timings: bool = False,
+    trace_file: Path | None = None,
+    verify_permissions: bool = False,
+) -> list[dict]:
+    """Initialize every project listed in ``manifest`` and print a summary.
+
+    Raises typer.Exit(1) if the manifest is invalid, a template cannot be
+    fetched, or any project fails.
+    """
+    from rich.table import Table
+
+    try:
+        projects = load_manifest(manifest)
+    except (OSError, ManifestError) as e:
+        console.print(f"[red]Error:[/red] Invalid batch manifest {manifest}: {e}")
+        raise typer.Exit(1)
+
+    errors = plan_batch(projects, ai=ai, script=script, no_git=no_git)
+    if not ignore_agent_tools:
+        for agent in sorted({project["ai"] for project in projects if project["ai"] in AGENT_CONFIG}):
+            if AGENT_CONFIG[agent]["requires_cli"] and not check_tool(agent):
+                errors.append(f"{agent} not found (install from {AGENT_CONFIG[agent]['install_url']} or use --ignore-agent-tools)")
+    if errors:
+        console.print(Panel("\n".join(errors), title="[red]Batch Manifest Errors[/red]", border_style="red", padding=(1, 2)))
+        raise typer.Exit(1)
+
+    variants = sorted({(project["ai"], project["script"]) for project in projects})
+    workers = max(1, min(jobs or BATCH_MAX_WORKERS, len(projects)))
+
+    console.print(Panel(
+        f"[cyan]Specify Batch Setup[/cyan]\n\n"
+        f"{'Manifest':<15} [dim]{manifest}[/dim]\n"
+        f"{'Projects':<15} [green]{len(projects)}[/green]\n"
+        f"{'Templates':<15} {len(variants)} distinct\n"
+        f"{'Workers':<15} {workers}",
+        border_style="cyan",
+        padding=(1, 2),
+    ))
+
+    tracker = StepTracker(f"Initialize {len(projects)} Specify projects")
+    lock = threading.Lock()
+    tracker.add("fetch", "Fetch templates")
+    for project in projects:
+        tracker.add(f"project:{project['name']}", project["name"])
+
+    project_keys = {project["path"]: f"project:{project['name']}" for project in projects}
+
+    def progress(project_path: Path, step: str, status: str, detail: str, **metrics) -> None:
+        if status == "running" and step in STEP_LABELS:
+            with lock:
+                tracker.start(project_keys[project_path], f"{STEP_LABELS[step]} {detail}".strip())
+
+    started = time.perf_counter()
+    results: list[dict] = []
+    with tracker.live():
+        with Initializer(
+            github_token=github_token, use_cache=use_cache, template_source=template_source,
+            progress=progress, skip_tls=skip_tls, debug=debug,
+        ) as initializer:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                tracker.start("fetch", f"{len(variants)} template(s)")
+                try:
+                    asyncio.run(initializer.prefetch_async(variants))
+                except SpecifyError as e:
+                    with lock:
+                        tracker.error("fetch", str(e).splitlines()[0])
+                        for key in project_keys.values():
+                            tracker.skip(key, "not started")
+                else:
+                    release = "local template" if template_source is not None else f"release {initializer.release().get('tag_name', '')}"
+                    tracker.complete("fetch", f"{release}, {len(variants)} template(s)")
+                    results = list(pool.map(
+                        lambda project: _initialize_project(initializer, project, tracker=tracker, lock=lock, verify_permissions=verify_permissions),
+                        projects,
+                    ))
+    wall = time.perf_counter() - started
+
+    console.print(tracker.render())
+    report_timings(tracker, timings=timings, trace_file=trace_file)
+    if not results:
+        raise typer.Exit(1)
+
+    table = Table(title="Batch Summary", title_justify="left", show_lines=False)
+    for column in ("Project", "Agent", "Script", "Type", "Git", "Time", "Result"):
+        table.add_column(column, justify="right" if column == "Time" else "left")
+    for project, result in zip(projects, results):
+        table.add_row(
+            project["name"], project["ai"], project["script"], project["project_type"],
+            result["git"] or "-", f"{result['elapsed_ms'] / 1000:.1f}s",
+            "[green]ready[/green]" if result["status"] == "done" else f"[red]failed[/red] {result['detail']}",
+        )
+    console.print()
+    console.print(table)
+
+    failed = sum(1 for result in results if result["status"] != "done")
+    console.print(f"\n{len(results) - failed} of {len(results)} projects ready in {wall:.1f}s")
+    if failed:
+        raise typer.Exit(1)
+    return results
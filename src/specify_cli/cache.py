@@ -0,0 +1,226 @@
+"""Content-addressed on-disk cache for template archives."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+# Default upper bound for the on-disk template cache (override with SPECIFY_CACHE_MAX_MB)
+TEMPLATE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Serializes index updates between threads; index.lock does the same between processes
+_INDEX_LOCK = threading.RLock()
+
+def _cache_root() -> Path:
+    """Return the per-user cache directory for Specify (SPECIFY_CACHE_DIR overrides)."""
+    import platformdirs
+    override = (os.getenv("SPECIFY_CACHE_DIR") or "").strip()
+    if override:
+        return Path(override).expanduser()
+    return Path(platformdirs.user_cache_dir("specify-cli"))
+
+def _sha256_file(path: Path) -> str:
+    """Return the hex SHA-256 digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class TemplateCache:
+    """Content-addressed on-disk cache for release template archives.
+
+    Archives are stored once under ``blobs/<sha256>.zip`` and indexed by
+    ``<release tag>/<asset name>`` in ``index.json``. When the cache grows past
+    ``max_bytes`` the least recently used archives are evicted. Every read,
+    update and write-back of the index (and every blob write) happens under a
+    lock held across threads and processes, so concurrent lookups and stores
+    from parallel ``Initializer.create`` calls never lose index entries.
+    """
+
+    def __init__(self, root: Path | None = None, max_bytes: int | None = None):
+        self.root = (root or _cache_root()) / "templates"
+        self.blobs_dir = self.root / "blobs"
+        self.index_path = self.root / "index.json"
+        self.lock_path = self.root / "index.lock"
+        if max_bytes is None:
+            try:
+                max_bytes = int(float(os.getenv("SPECIFY_CACHE_MAX_MB", "")) * 1024 * 1024)
+            except ValueError:
+                max_bytes = TEMPLATE_CACHE_MAX_BYTES
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def _key(tag: str, asset_name: str) -> str:
+        return f"{tag}/{asset_name}"
+
+    def _load_index(self) -> dict:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            return index if isinstance(index, dict) else {}
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            return {}
+
+    def _save_index(self, index: dict) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.root, prefix=".index-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(index, f, indent=2, sort_keys=True)
+            os.replace(tmp, self.index_path)
+        except Exception:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the index lock (threads and, through index.lock, processes)."""
+        with _INDEX_LOCK:
+            try:
+                self.root.mkdir(parents=True, exist_ok=True)
+                lock_file = open(self.lock_path, "a+b")
+            except OSError:
+                # Read-only cache location: nothing can be written, so nothing can race
+                yield
+                return
+            with lock_file:
+                _lock_file(lock_file)
+                try:
+                    yield
+                finally:
+                    _unlock_file(lock_file)
+
+    def lookup(self, tag: str, asset_name: str, sha256: str | None = None) -> Path | None:
+        """Return the cached archive for a release asset, or None on a miss.
+
+        If ``sha256`` is given the cached entry must carry the same digest.
+        """
+        if not self.index_path.exists():
+            return None
+        with self._locked():
+            index = self._load_index()
+            entry = index.get(self._key(tag, asset_name))
+            if not entry:
+                return None
+            if sha256 and entry.get("sha256") != sha256.lower():
+                return None
+            blob = self.blobs_dir / f"{entry['sha256']}.zip"
+            try:
+                if blob.stat().st_size != entry.get("size"):
+                    return None
+            except OSError:
+                index.pop(self._key(tag, asset_name), None)
+                self._save_index(index)
+                return None
+            entry["last_used"] = time.time()
+            self._save_index(index)
+            return blob
+
+    def store(self, tag: str, asset_name: str, source: Path | IO[bytes], sha256: str | None = None) -> Path:
+        """Add a downloaded archive (a path or a readable file object) to the cache and return the cached path."""
+        if sha256 is None:
+            if not isinstance(source, Path):
+                raise ValueError("sha256 is required when storing a file object")
+            sha256 = _sha256_file(source)
+        sha256 = sha256.lower()
+        with self._locked():
+            self.blobs_dir.mkdir(parents=True, exist_ok=True)
+            blob = self.blobs_dir / f"{sha256}.zip"
+            if not blob.exists():
+                self._write_blob(blob, source)
+            index = self._load_index()
+            index[self._key(tag, asset_name)] = {
+                "sha256": sha256,
+                "size": blob.stat().st_size,
+                "last_used": time.time(),
+            }
+            self._evict(index, keep=sha256)
+            self._save_index(index)
+        return blob
+
+    def _write_blob(self, blob: Path, source: Path | IO[bytes]) -> None:
+        if isinstance(source, Path):
+            try:
+                os.link(source, blob)
+                return
+            except FileExistsError:
+                return
+            except OSError:
+                pass  # Different file system or no hard links: copy instead
+        fd, tmp = tempfile.mkstemp(dir=self.blobs_dir, prefix=f".{blob.stem}-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                if isinstance(source, Path):
+                    with open(source, "rb") as src:
+                        shutil.copyfileobj(src, f, 1024 * 1024)
+                else:
+                    source.seek(0)
+                    shutil.copyfileobj(source, f, 1024 * 1024)
+            os.replace(tmp, blob)
+        finally:
+            Path(tmp).unlink(missing_ok=True)
+
+    def _evict(self, index: dict, keep: str | None = None) -> None:
+        """Drop unindexed blobs, then least recently used ones until the cache fits in max_bytes.
+
+        Called with the index lock held, so a blob missing from the index is
+        an orphan (from an interrupted or older unlocked store), never one
+        being added.
+        """
+        indexed = {entry.get("sha256") for entry in index.values()}
+        try:
+            for path in self.blobs_dir.glob("*.zip"):
+                if path.stem not in indexed:
+                    path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        blobs: dict[str, dict] = {}
+        for key, entry in index.items():
+            sha = entry.get("sha256")
+            current = blobs.setdefault(sha, {"size": entry.get("size", 0), "last_used": 0.0, "keys": []})
+            current["last_used"] = max(current["last_used"], entry.get("last_used", 0.0))
+            current["keys"].append(key)
+
+        total = sum(b["size"] for b in blobs.values())
+        for sha, blob in sorted(blobs.items(), key=lambda item: item[1]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            if sha == keep:
+                continue
+            (self.blobs_dir / f"{sha}.zip").unlink(missing_ok=True)
+            for key in blob["keys"]:
+                index.pop(key, None)
+            total -= blob["size"]
+
+def _lock_file(f: IO[bytes]) -> None:
+    """Block until this process holds an exclusive lock on ``f``."""
+    if os.name == "nt":
+        f.seek(0)
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue  # LK_LOCK gives up after ten seconds; keep waiting
+    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+def _unlock_file(f: IO[bytes]) -> None:
+    if os.name == "nt":
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
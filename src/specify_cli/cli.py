@@ -0,0 +1,85 @@
+"""The `specify` Typer application.
+
+Commands are registered lazily: LAZY_COMMANDS maps each command name to the
+module and attribute implementing it, and the module is imported only when
+the command is dispatched (or when help needs its signature). Running
+`specify context --show` therefore never loads the networking, archive or
+template code used by `specify init`.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+
+import typer
+from rich.align import Align
+from typer.core import TyperCommand, TyperGroup
+
+from .ui import console, show_banner
+
+# command name -> (module relative to this package, attribute). The attribute is
+# either a plain command function or a typer.Typer holding sub-commands.
+LAZY_COMMANDS = {
+    "init": (".commands.init", "init"),
+    "check": (".commands.check", "check"),
+    "templates": (".commands.templates", "app"),
+    "version": (".commands.version", "version"),
+    "context": (".commands.context", "context"),
+    "feature": (".commands.feature", "app"),
+    "agent-context": (".commands.agent_context", "app"),
+    "status": (".commands.status", "status"),
+}
+
+def load_command(name: str) -> TyperCommand | TyperGroup | None:
+    """Import the module implementing ``name`` and build its Click command."""
+    try:
+        module_name, attr = LAZY_COMMANDS[name]
+    except KeyError:
+        return None
+    target = getattr(importlib.import_module(module_name, __package__), attr)
+    if isinstance(target, typer.Typer):
+        command = typer.main.get_group(target)
+    else:
+        wrapper = typer.Typer(add_completion=False)
+        wrapper.command(name)(target)
+        command = typer.main.get_command(wrapper)
+    command.name = name
+    return command
+
+
+class BannerGroup(TyperGroup):
+    """Custom group that shows banner before help and loads commands on demand."""
+
+    def list_commands(self, ctx):
+        return list(LAZY_COMMANDS) + [name for name in super().list_commands(ctx) if name not in LAZY_COMMANDS]
+
+    def get_command(self, ctx, cmd_name):
+        command = super().get_command(ctx, cmd_name)
+        if command is None:
+            command = load_command(cmd_name)
+            if command is not None:
+                self.add_command(command, cmd_name)
+        return command
+
+    def format_help(self, ctx, formatter):
+        # Show banner before help
+        show_banner()
+        super().format_help(ctx, formatter)
+
+
+app = typer.Typer(
+    name="specify",
+    help="Setup tool for Specify spec-driven development projects",
+    add_completion=False,
+    invoke_without_command=True,
+    cls=BannerGroup,
+)
+
+@app.callback()
+def callback(ctx: typer.Context):
+    """Show banner when no subcommand is provided."""
+    if ctx.invoked_subcommand is None and "--help" not in sys.argv and "-h" not in sys.argv:
+        show_banner()
+        console.print(Align.center("[dim]Run 'specify --help' for usage information[/dim]"))
+        console.print()
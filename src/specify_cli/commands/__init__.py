@@ -0,0 +1 @@
+"""Typer command implementations, imported only when their command is dispatched (see specify_cli.cli)."""
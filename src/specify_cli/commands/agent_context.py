@@ -0,0 +1,66 @@
+"""`specify agent-context` sub-commands."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import typer
+
+from ..errors import SpecifyError
+from ..ui import console
+
+app = typer.Typer(
+    name="agent-context",
+    help="Keep AI agent context files (CLAUDE.md, AGENTS.md, ...) in step with feature plans",
+    add_completion=False,
+)
+
+STATUS_STYLES = {"created": "green", "updated": "green", "unchanged": "dim", "error": "red"}
+
+@app.command("update")
+def agent_context_update(
+    agent: str = typer.Argument(None, help="Only update this agent's file (default: every existing agent file, or CLAUDE.md if there is none)"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Report what would change without writing any file"),
+    as_json: bool = typer.Option(False, "--json", help="Print the parsed plan fields and per-file results as JSON"),
+):
+    """
+    Update agent context files from the current feature's plan.md.
+
+    plan.md is parsed once and every agent file is edited in a single pass;
+    files whose content would not change are left untouched. Drop-in
+    replacement for scripts/bash/update-agent-context.sh.
+
+    Examples:
+        specify agent-context update
+        specify agent-context update claude
+        specify agent-context update --dry-run --json
+    """
+    from ..agentcontext import update_agent_context
+    from ..features import current_feature_branch, find_feature_dir, find_repo_root
+
+    try:
+        repo_root, has_git = find_repo_root(Path.cwd())
+        branch = current_feature_branch(repo_root, has_git)
+        plan_file = find_feature_dir(repo_root, branch) / "plan.md"
+        result = update_agent_context(repo_root, plan_file, branch, agent=agent, dry_run=dry_run)
+    except SpecifyError as e:
+        console.print(f"[red]Error:[/red] {e}", highlight=False)
+        raise typer.Exit(1)
+
+    failed = any(record["status"] == "error" for record in result["files"])
+    if as_json:
+        sys.stdout.write(json.dumps({"branch": branch, "plan_file": str(plan_file), "dry_run": dry_run, **result}, indent=2) + "\n")
+    else:
+        fields = ", ".join(f"{key} {value}" for key, value in result["plan"].items() if value) or "no technology fields"
+        console.print(f"Feature [cyan]{branch}[/cyan]: {fields}", highlight=False)
+        for record in result["files"]:
+            style = STATUS_STYLES[record["status"]]
+            path = Path(record["path"]).relative_to(repo_root)
+            detail = f" ({record['detail']})" if record["detail"] else ""
+            console.print(f"  [{style}]{record['status']:<9}[/{style}] {path} [dim]{', '.join(record['agents'])}[/dim]{detail}", highlight=False)
+        if dry_run:
+            console.print("[dim]Dry run: no files written[/dim]")
+    if failed:
+        raise typer.Exit(1)
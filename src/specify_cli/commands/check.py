@@ -0,0 +1,148 @@
+"""`specify check`."""
+
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+
+import typer
+
+from ..config import AGENT_CONFIG
+from ..system import TOOL_VERSION_TIMEOUT_SECONDS, find_tool, get_cli_version, get_path_index, probe_tool_versions
+from ..ui import StepTracker, console, show_banner
+
+# Version of the --json / --ndjson record layout; bump when fields change meaning
+CHECK_SCHEMA_VERSION = 1
+
+def _tools() -> list[dict]:
+    """Every tool `check` looks for, in display order."""
+    tools = [{"tool": "git", "name": "Git version control", "kind": "vcs", "requires_cli": True}]
+    for agent_key, agent_config in AGENT_CONFIG.items():
+        tools.append({"tool": agent_key, "name": agent_config["name"], "kind": "agent", "requires_cli": agent_config["requires_cli"]})
+    tools.append({"tool": "code", "name": "Visual Studio Code", "kind": "editor", "requires_cli": True})
+    tools.append({"tool": "code-insiders", "name": "Visual Studio Code Insiders", "kind": "editor", "requires_cli": True})
+    return tools
+
+def run_checks(*, versions: bool, timeout: float) -> dict:
+    """Resolve every tool and optionally probe versions, timing each step.
+
+    Returns a report with host metadata and one record per tool: ``status``
+    (``found``, ``missing`` or ``skipped`` for IDE-based agents), ``path``,
+    ``version``, ``lookup_ms`` and ``version_ms`` (None when not probed).
+    """
+    started = time.perf_counter()
+    index = get_path_index()
+    index_start = time.perf_counter()
+    index.build()
+    index_ms = (time.perf_counter() - index_start) * 1000
+
+    records = []
+    found = {}
+    for tool in _tools():
+        record = {
+            "tool": tool["tool"],
+            "name": tool["name"],
+            "kind": tool["kind"],
+            "status": "skipped",
+            "path": None,
+            "version": None,
+            "lookup_ms": None,
+            "version_ms": None,
+            "timed_out": False,
+        }
+        if tool["requires_cli"]:
+            lookup_start = time.perf_counter()
+            path = find_tool(tool["tool"])
+            record["lookup_ms"] = round((time.perf_counter() - lookup_start) * 1000, 3)
+            record["status"] = "found" if path else "missing"
+            record["path"] = path
+            if path:
+                found[tool["tool"]] = path
+        records.append(record)
+
+    if versions:
+        probed = probe_tool_versions(found, timeout=timeout)
+        for record in records:
+            result = probed.get(record["tool"])
+            if result:
+                record["version"] = result["version"]
+                record["version_ms"] = round(result["elapsed_ms"], 3)
+                record["timed_out"] = result["timed_out"]
+
+    return {
+        "schema": CHECK_SCHEMA_VERSION,
+        "host": platform.node(),
+        "platform": sys.platform,
+        "specify_version": get_cli_version(),
+        "checked_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "path_entries": len(index.directories),
+        "path_index_ms": round(index_ms, 3),
+        "wall_ms": round((time.perf_counter() - started) * 1000, 3),
+        "tools": records,
+    }
+
+def _write_ndjson(report: dict) -> None:
+    """One self-contained line per tool, then a summary line, for log pipelines."""
+    host_fields = {key: report[key] for key in ("schema", "host", "platform", "specify_version", "checked_at")}
+    for record in report["tools"]:
+        sys.stdout.write(json.dumps({"type": "tool", **host_fields, **record}) + "\n")
+    summary = {key: value for key, value in report.items() if key != "tools"}
+    summary["found"] = sum(1 for record in report["tools"] if record["status"] == "found")
+    slowest = max(report["tools"], key=lambda record: (record["version_ms"] or 0) + (record["lookup_ms"] or 0))
+    summary["slowest_tool"] = slowest["tool"]
+    sys.stdout.write(json.dumps({"type": "summary", **summary}) + "\n")
+
+def check(
+    versions: bool = typer.Option(False, "--versions", help="Also run '<tool> --version' for every tool found (probed in parallel; always on with --json/--ndjson)"),
+    timeout: float = typer.Option(TOOL_VERSION_TIMEOUT_SECONDS, "--timeout", help="Seconds to wait for each --version probe"),
+    as_json: bool = typer.Option(False, "--json", help="Print a JSON report (tool, path, version, probe timings) instead of the tree"),
+    as_ndjson: bool = typer.Option(False, "--ndjson", help="Print one JSON object per tool plus a summary line"),
+    no_versions: bool = typer.Option(False, "--no-versions", help="With --json/--ndjson, skip the --version probes"),
+):
+    """Check that all required tools are installed."""
+    if as_json and as_ndjson:
+        console.print("[red]Error:[/red] --json and --ndjson are mutually exclusive")
+        raise typer.Exit(1)
+
+    if as_json or as_ndjson:
+        report = run_checks(versions=not no_versions, timeout=timeout)
+        if as_json:
+            sys.stdout.write(json.dumps(report, indent=2) + "\n")
+        else:
+            _write_ndjson(report)
+        return
+
+    show_banner()
+    console.print("[bold]Checking for installed tools...[/bold]\n")
+
+    if versions:
+        with console.status("Probing tool versions..."):
+            report = run_checks(versions=True, timeout=timeout)
+    else:
+        report = run_checks(versions=False, timeout=timeout)
+
+    tracker = StepTracker("Check Available Tools")
+    for record in report["tools"]:
+        key = record["tool"]
+        tracker.add(key, record["name"])
+        if record["status"] == "skipped":
+            # IDE-based agent - skip CLI check and mark as optional
+            tracker.skip(key, "IDE-based, no CLI check")
+        elif record["status"] == "missing":
+            tracker.error(key, "not found")
+        elif versions:
+            tracker.complete(key, record["version"] or "available (version unknown)")
+        else:
+            tracker.complete(key, "available")
+
+    console.print(tracker.render())
+
+    console.print("\n[bold green]Specify CLI is ready to use![/bold green]")
+
+    found = {record["tool"] for record in report["tools"] if record["status"] == "found"}
+    if "git" not in found:
+        console.print("[dim]Tip: Install git for repository management[/dim]")
+
+    if not any(key in found for key in AGENT_CONFIG):
+        console.print("[dim]Tip: Install an AI assistant for the best experience[/dim]")
@@ -0,0 +1,217 @@
+"""`specify context`."""
+
+from __future__ import annotations
+
+import json
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List
+
+import typer
+from rich.panel import Panel
+
+from ..config import PROJECT_TYPE_CHOICES
+from ..project import generate_context_reference
+from ..errors import ConfigurationError
+from ..projectcontext import load_context, normalize_context, plan_context_edit, read_context_document, write_context
+from ..ui import console
+from ..yamldoc import YamlError
+
+def context(
+    show: bool = typer.Option(False, "--show", help="Display current project context"),
+    set_type: str = typer.Option(None, "--set-type", help="Update project type (greenfield, brownfield, bluefield)"),
+    set_description: str = typer.Option(None, "--set-description", help="Update project description"),
+    add_constraint: List[str] = typer.Option(None, "--add-constraint", help="Add a constraint to the project (repeatable)"),
+    remove_constraint: List[str] = typer.Option(None, "--remove-constraint", help="Remove a constraint by index (1-based) or exact text (repeatable)"),
+    patch: str = typer.Option(None, "--patch", help="Apply a JSON object of edits from a file, or '-' for stdin"),
+    check: bool = typer.Option(False, "--check", help="Exit 1 if memory/context.md is out of date with context.yaml (writes nothing)"),
+    refresh: bool = typer.Option(False, "--refresh", help="Regenerate memory/context.md from context.yaml if it is out of date"),
+    as_json: bool = typer.Option(False, "--json", help="Print the parsed context as JSON (served from .specify/cache when context.yaml is unchanged)"),
+):
+    """
+    View or update project context settings.
+    
+    Project context helps AI assistants understand your project type and provide
+    more accurate, realistic specifications and implementations.
+
+    All edits in one invocation are validated first and then applied together:
+    context.yaml is written once (atomically) and memory/context.md is
+    regenerated once, only if its content changes. --patch accepts the keys
+    project_type, description, constraints (replaces the list),
+    remove_constraints, add_constraints and linked_artifacts; flags are applied
+    on top of the patch.
+    
+    Examples:
+        specify context --show                                    # View current context
+        specify context --set-type brownfield                     # Change to brownfield project
+        specify context --set-description "API service"           # Update description
+        specify context --add-constraint "Must not change API"    # Add a constraint
+        specify context --remove-constraint 1                     # Remove first constraint
+        specify context --add-constraint A --add-constraint B --remove-constraint 1
+        echo '{"add_constraints": ["A", "B"]}' | specify context --patch -
+        specify context --json                                    # Machine-readable context
+        specify context --check                                   # CI: is memory/context.md current?
+    """
+    from rich.table import Table
+
+    project_path = Path.cwd()
+    context_file = project_path / ".specify" / "context.yaml"
+    
+    if not context_file.exists():
+        console.print("[red]Error:[/red] No context.yaml found in current directory")
+        console.print("[dim]Run 'specify init .' in a Spec Kit project, or create .specify/context.yaml manually[/dim]")
+        raise typer.Exit(1)
+    
+    editing = bool(set_type or set_description or add_constraint or remove_constraint or patch)
+    try:
+        # Reads are served from the compiled cache (--check never writes it); edits re-parse the file itself
+        document = read_context_document(project_path) if editing else None
+        current = load_context(project_path, use_cache=not check) if document is None else normalize_context(document.data)
+    except (OSError, YamlError) as e:
+        console.print(f"[red]Error:[/red] Cannot read {context_file}: {e}")
+        raise typer.Exit(1)
+
+    if check or refresh:
+        if editing or as_json:
+            console.print("[red]Error:[/red] --check/--refresh cannot be combined with edits or --json")
+            raise typer.Exit(1)
+        stale = generate_context_reference(
+            project_path=project_path,
+            project_type=current["project_type"],
+            description=current["description"],
+            constraints=current["constraints"],
+            linked_artifacts=current["linked_artifacts"],
+            timestamp=current["updated"],
+            version=current["version"],
+            check=check,
+        )
+        if not stale:
+            console.print("[green]✓[/green] memory/context.md is up to date")
+        elif check:
+            console.print("[yellow]memory/context.md is out of date with .specify/context.yaml[/yellow]")
+            console.print("[dim]Run 'specify context --refresh' to regenerate it[/dim]")
+            raise typer.Exit(1)
+        else:
+            console.print("[green]✓[/green] memory/context.md regenerated")
+        return
+
+    if as_json:
+        if editing:
+            console.print("[red]Error:[/red] --json cannot be combined with edits")
+            raise typer.Exit(1)
+        sys.stdout.write(json.dumps(current, indent=2) + "\n")
+        return
+
+    current_type = current["project_type"]
+    current_description = current["description"]
+    current_constraints = current["constraints"]
+    current_version = current["version"]
+    
+    if show or not editing:
+        # Display current context
+        console.print()
+        context_table = Table(show_header=False, box=None, padding=(0, 2))
+        context_table.add_column("Key", style="cyan", justify="right")
+        context_table.add_column("Value", style="white")
+        
+        type_display = current_type
+        if current_type in PROJECT_TYPE_CHOICES:
+            type_display = f"{current_type} - {PROJECT_TYPE_CHOICES[current_type]}"
+        
+        context_table.add_row("Project Type", type_display)
+        context_table.add_row("Description", current_description or "[dim](not set)[/dim]")
+        
+        # Display constraints
+        if current_constraints:
+            for i, constraint in enumerate(current_constraints, 1):
+                label = "Constraints" if i == 1 else ""
+                context_table.add_row(label, f"[yellow]{i}.[/yellow] {constraint}")
+        else:
+            context_table.add_row("Constraints", "[dim](none)[/dim]")
+        
+        context_table.add_row("Context File", str(context_file))
+        
+        panel = Panel(
+            context_table,
+            title="[bold cyan]Project Context[/bold cyan]",
+            border_style="cyan",
+            padding=(1, 2)
+        )
+        console.print(panel)
+        
+        # Show available types
+        console.print()
+        console.print("[dim]Available project types:[/dim]")
+        for key, desc in PROJECT_TYPE_CHOICES.items():
+            marker = "●" if key == current_type else "○"
+            console.print(f"  {marker} [cyan]{key}[/cyan] - {desc}")
+        console.print()
+        return
+    
+    # Collect every requested edit, then validate and apply them together
+    edits = {}
+    if patch:
+        try:
+            raw = sys.stdin.read() if patch == "-" else Path(patch).read_text(encoding="utf-8")
+            edits = json.loads(raw)
+        except (OSError, json.JSONDecodeError) as e:
+            console.print(f"[red]Error:[/red] Cannot read patch {patch}: {e}")
+            raise typer.Exit(1)
+        if not isinstance(edits, dict):
+            console.print("[red]Error:[/red] The patch must be a JSON object")
+            raise typer.Exit(1)
+    if set_type:
+        edits["project_type"] = set_type
+    if set_description:
+        edits["description"] = set_description
+    for key, values in (("remove_constraints", remove_constraint), ("add_constraints", add_constraint)):
+        if values:
+            existing = edits.get(key) or []
+            edits[key] = [*([existing] if isinstance(existing, str) else existing), *values]
+
+    try:
+        changes = plan_context_edit(current, edits)
+    except ConfigurationError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        console.print("[dim]Nothing was changed[/dim]")
+        raise typer.Exit(1)
+
+    if not changes:
+        console.print("[dim]No changes; context left untouched[/dim]")
+        return
+
+    if "project_type" in changes:
+        console.print(f"[green]✓[/green] Project type updated to: [cyan]{changes['project_type']}[/cyan]")
+    if "description" in changes:
+        console.print("[green]✓[/green] Description updated")
+    if "constraints" in changes:
+        for removed in (item for item in current_constraints if item not in changes["constraints"]):
+            console.print(f"[green]✓[/green] Constraint removed: [yellow]{removed}[/yellow]")
+        for added in (item for item in changes["constraints"] if item not in current_constraints):
+            console.print(f"[green]✓[/green] Constraint added: [yellow]{added}[/yellow]")
+    if "linked_artifacts" in changes:
+        console.print("[green]✓[/green] Linked artifacts updated")
+
+    # Update the updated timestamp and version, then write everything in one pass
+    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    document.update({**changes, "updated": now, "version": current_version + 1})
+    try:
+        updated = write_context(project_path, document)
+    except OSError as e:
+        console.print(f"[red]Error:[/red] Cannot write {context_file}: {e}")
+        raise typer.Exit(1)
+    console.print(f"[dim]Context saved to {context_file}[/dim]")
+
+    # Regenerate the AI reference file
+    written = generate_context_reference(
+        project_path=project_path,
+        project_type=updated["project_type"],
+        description=updated["description"],
+        constraints=updated["constraints"],
+        linked_artifacts=updated["linked_artifacts"],
+        timestamp=now,
+        version=updated["version"]
+    )
+    if written:
+        console.print(f"[dim]AI reference updated at memory/context.md[/dim]")
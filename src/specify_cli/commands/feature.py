@@ -0,0 +1,103 @@
+"""`specify feature` sub-commands."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from typing import List
+
+import typer
+from rich.console import Console
+
+from ..errors import SpecifyError
+from ..ui import console
+from ..features import SPECS_DIR, create_feature, find_repo_root, load_feature_index
+
+app = typer.Typer(
+    name="feature",
+    help="Create and manage spec-driven feature branches",
+    add_completion=False,
+)
+
+@app.command("new")
+def feature_new(
+    description: List[str] = typer.Argument(..., help="Feature description"),
+    short_name: str = typer.Option(None, "--short-name", help="Custom short name (2-4 words) for the branch"),
+    number: int = typer.Option(None, "--number", help="Feature number to use (overrides auto-detection)"),
+    fetch: bool = typer.Option(False, "--fetch", help="Run 'git fetch --all --prune' before numbering so remote branches are current"),
+    as_json: bool = typer.Option(False, "--json", help="Print BRANCH_NAME, SPEC_FILE and FEATURE_NUM as JSON"),
+):
+    """
+    Create a numbered feature branch and its specs/<branch>/spec.md.
+
+    The number is one more than the highest used by any local or
+    remote-tracking branch or specs/ directory. Branches are read with one
+    'git for-each-ref' call and the specs/ listing is cached in
+    .specify/cache, so numbering needs no network access unless --fetch is
+    given. Drop-in replacement for scripts/bash/create-new-feature.sh.
+
+    Examples:
+        specify feature new "Add user authentication system" --short-name user-auth
+        specify feature new "Implement OAuth2 integration for API" --number 5 --json
+        specify feature new "Payment retries" --fetch
+    """
+    # Errors and warnings go to stderr so --json output stays parseable
+    warn = Console(stderr=True)
+    try:
+        feature = create_feature(Path.cwd(), " ".join(description), short_name=short_name, number=number, fetch=fetch)
+    except SpecifyError as e:
+        warn.print(f"[red]Error:[/red] {e}", highlight=False)
+        raise typer.Exit(1)
+
+    if feature["truncated_from"]:
+        warn.print(f"[yellow]Warning:[/yellow] Branch name exceeded GitHub's 244-byte limit; truncated to {feature['BRANCH_NAME']}", highlight=False)
+    if not feature["has_git"]:
+        warn.print(f"[yellow]Warning:[/yellow] Git repository not detected; skipped branch creation for {feature['BRANCH_NAME']}", highlight=False)
+
+    fields = {key: feature[key] for key in ("BRANCH_NAME", "SPEC_FILE", "FEATURE_NUM")}
+    if as_json:
+        sys.stdout.write(json.dumps(fields) + "\n")
+    else:
+        for key, value in fields.items():
+            sys.stdout.write(f"{key}: {value}\n")
+
+@app.command("list")
+def feature_list(
+    as_json: bool = typer.Option(False, "--json", help="Print the feature index as JSON"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Rescan specs/ instead of using .specify/cache/features.json"),
+):
+    """
+    List the numbered features in specs/ and the artifacts each one has.
+
+    This also refreshes .specify/cache/features.json and features.tsv, the
+    index the helper scripts read instead of rescanning specs/.
+
+    Examples:
+        specify feature list
+        specify feature list --json
+    """
+    from rich.table import Table
+
+    try:
+        repo_root, _ = find_repo_root(Path.cwd())
+    except SpecifyError as e:
+        console.print(f"[red]Error:[/red] {e}", highlight=False)
+        raise typer.Exit(1)
+    index = load_feature_index(repo_root, use_cache=not no_cache)
+    ordered = sorted(index.items(), key=lambda item: (item[1]["number"], item[0]))
+
+    if as_json:
+        features = [{"number": feature["number"], "dir": f"{SPECS_DIR}/{name}", "artifacts": feature["artifacts"]} for name, feature in ordered]
+        sys.stdout.write(json.dumps({"repo_root": str(repo_root), "features": features}, indent=2) + "\n")
+        return
+    if not ordered:
+        console.print(f"No numbered features in {repo_root / SPECS_DIR}")
+        return
+    table = Table(show_header=True, box=None, padding=(0, 2))
+    table.add_column("#", justify="right", style="cyan")
+    table.add_column("Directory")
+    table.add_column("Artifacts", style="dim")
+    for name, feature in ordered:
+        table.add_row(f"{feature['number']:03d}", f"{SPECS_DIR}/{name}", ", ".join(feature["artifacts"]) or "-")
+    console.print(table)
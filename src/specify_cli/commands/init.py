@@ -0,0 +1,434 @@
+"""`specify init`."""
+
+from __future__ import annotations
+
+import os
+import shlex
+import sys
+from pathlib import Path
+
+import typer
+from rich.panel import Panel
+
+from ..api import Initializer
+from ..config import AGENT_CONFIG, PROJECT_TYPE_CHOICES, SCRIPT_TYPE_CHOICES
+from ..project import DESCRIPTION_HINTS
+from ..system import check_tool
+from ..ui import StepTracker, console, report_timings, select_with_arrows, show_banner
+
+# Tracker labels for the steps Initializer.create reports, in the order it runs them
+STEP_LABELS = {
+    "fetch": "Fetch latest release",
+    "download": "Download template",
+    "extract": "Extract template",
+    "zip-list": "Archive contents",
+    "extracted-summary": "Extraction summary",
+    "flatten": "Flatten nested directory",
+    "chmod": "Set script permissions",
+    "chmod-verify": "Verify script permissions",
+    "context": "Create project context",
+    "instructions": "Create instructions.md",
+    "scaffolding": "Create greenfield scaffolding",
+    "git": "Initialize git repository",
+    "final": "Finalize",
+}
+
+def init(
+    project_name: str = typer.Argument(None, help="Name for your new project directory (optional if using --here, or use '.' for current directory)"),
+    ai_assistant: str = typer.Option(None, "--ai", help="AI assistant to use: claude, gemini, copilot, cursor-agent, qwen, opencode, codex, windsurf, kilocode, auggie, codebuddy, amp, shai, q, bob, or qoder "),
+    script_type: str = typer.Option(None, "--script", help="Script type to use: sh or ps"),
+    ignore_agent_tools: bool = typer.Option(False, "--ignore-agent-tools", help="Skip checks for AI agent tools like Claude Code"),
+    no_git: bool = typer.Option(False, "--no-git", help="Skip git repository initialization"),
+    here: bool = typer.Option(False, "--here", help="Initialize project in the current directory instead of creating a new one"),
+    force: bool = typer.Option(False, "--force", help="Force merge/overwrite when using --here (skip confirmation)"),
+    skip_tls: bool = typer.Option(False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"),
+    debug: bool = typer.Option(False, "--debug", help="Show verbose diagnostic output for network and extraction failures"),
+    github_token: str = typer.Option(None, "--github-token", help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Always download the template instead of using the local template cache"),
+    from_source: Path = typer.Option(None, "--from", help="Initialize offline from a template zip, unpacked template directory, or mirror created by 'specify templates pull'"),
+    batch: Path = typer.Option(None, "--batch", help="Initialize every project listed in a YAML/JSON manifest (templates fetched once, projects set up in parallel)"),
+    jobs: int = typer.Option(None, "--jobs", min=1, help="Worker threads for --batch (default: up to 8)"),
+    timings: bool = typer.Option(False, "--timings", help="Print how long each step took (and bytes/files handled)"),
+    trace_file: Path = typer.Option(None, "--trace-file", help="Write step timings as a Chrome trace-event JSON file"),
+    verify_permissions: bool = typer.Option(False, "--verify-permissions", help="After extraction, re-scan .specify/scripts and fix any script left without execute bits"),
+):
+    """
+    Initialize a new Specify project from the latest template.
+    
+    This command will:
+    1. Check that required tools are installed (git is optional)
+    2. Let you choose your AI assistant
+    3. Download the appropriate template from GitHub
+    4. Extract the template to a new project directory or current directory
+    5. Initialize a fresh git repository (if not --no-git and no existing repo)
+    6. Optionally set up AI assistant commands
+    
+    Examples:
+        specify init my-project
+        specify init my-project --ai claude
+        specify init my-project --ai copilot --no-git
+        specify init --ignore-agent-tools my-project
+        specify init . --ai claude         # Initialize in current directory
+        specify init .                     # Initialize in current directory (interactive AI selection)
+        specify init --here --ai claude    # Alternative syntax for current directory
+        specify init --here --ai codex
+        specify init --here --ai codebuddy
+        specify init --here
+        specify init --here --force  # Skip confirmation when current directory not empty
+        specify init my-project --no-cache  # Bypass the local template cache
+        specify init my-project --ai claude --from ./mirror  # Offline, from a local mirror
+        specify init --batch services.yaml --ai claude  # One project per manifest entry
+        specify init my-project --timings --trace-file init-trace.json
+    """
+
+    show_banner()
+
+    if batch is not None:
+        if project_name or here:
+            console.print("[red]Error:[/red] --batch cannot be combined with a project name or --here")
+            raise typer.Exit(1)
+        from ..batch import run_batch
+        run_batch(
+            batch,
+            ai=ai_assistant,
+            script=script_type,
+            ignore_agent_tools=ignore_agent_tools,
+            no_git=no_git,
+            skip_tls=skip_tls,
+            debug=debug,
+            github_token=github_token,
+            use_cache=not no_cache,
+            template_source=from_source,
+            jobs=jobs,
+            timings=timings,
+            trace_file=trace_file,
+            verify_permissions=verify_permissions,
+        )
+        return
+
+    if project_name == ".":
+        here = True
+        project_name = None  # Clear project_name to use existing validation logic
+
+    if here and project_name:
+        console.print("[red]Error:[/red] Cannot specify both project name and --here flag")
+        raise typer.Exit(1)
+
+    if not here and not project_name:
+        console.print("[red]Error:[/red] Must specify either a project name, use '.' for current directory, or use --here flag")
+        raise typer.Exit(1)
+
+    if here:
+        project_name = Path.cwd().name
+        project_path = Path.cwd()
+
+        existing_items = list(project_path.iterdir())
+        if existing_items:
+            console.print(f"[yellow]Warning:[/yellow] Current directory is not empty ({len(existing_items)} items)")
+            console.print("[yellow]Template files will be merged with existing content and may overwrite existing files[/yellow]")
+            if force:
+                console.print("[cyan]--force supplied: skipping confirmation and proceeding with merge[/cyan]")
+            else:
+                response = typer.confirm("Do you want to continue?")
+                if not response:
+                    console.print("[yellow]Operation cancelled[/yellow]")
+                    raise typer.Exit(0)
+    else:
+        project_path = Path(project_name).resolve()
+        if project_path.exists():
+            error_panel = Panel(
+                f"Directory '[cyan]{project_name}[/cyan]' already exists\n"
+                "Please choose a different project name or remove the existing directory.",
+                title="[red]Directory Conflict[/red]",
+                border_style="red",
+                padding=(1, 2)
+            )
+            console.print()
+            console.print(error_panel)
+            raise typer.Exit(1)
+
+    current_dir = Path.cwd()
+
+    setup_lines = [
+        "[cyan]Specify Project Setup[/cyan]",
+        "",
+        f"{'Project':<15} [green]{project_path.name}[/green]",
+        f"{'Working Path':<15} [dim]{current_dir}[/dim]",
+    ]
+
+    if not here:
+        setup_lines.append(f"{'Target Path':<15} [dim]{project_path}[/dim]")
+
+    console.print(Panel("\n".join(setup_lines), border_style="cyan", padding=(1, 2)))
+
+    if ai_assistant:
+        if ai_assistant not in AGENT_CONFIG:
+            console.print(f"[red]Error:[/red] Invalid AI assistant '{ai_assistant}'. Choose from: {', '.join(AGENT_CONFIG.keys())}")
+            raise typer.Exit(1)
+        selected_ai = ai_assistant
+    else:
+        # Create options dict for selection (agent_key: display_name)
+        ai_choices = {key: config["name"] for key, config in AGENT_CONFIG.items()}
+        selected_ai = select_with_arrows(
+            ai_choices, 
+            "Choose your AI assistant:", 
+            "copilot"
+        )
+
+    if not ignore_agent_tools:
+        agent_config = AGENT_CONFIG.get(selected_ai)
+        if agent_config and agent_config["requires_cli"]:
+            install_url = agent_config["install_url"]
+            if not check_tool(selected_ai):
+                error_panel = Panel(
+                    f"[cyan]{selected_ai}[/cyan] not found\n"
+                    f"Install from: [cyan]{install_url}[/cyan]\n"
+                    f"{agent_config['name']} is required to continue with this project type.\n\n"
+                    "Tip: Use [cyan]--ignore-agent-tools[/cyan] to skip this check",
+                    title="[red]Agent Detection Error[/red]",
+                    border_style="red",
+                    padding=(1, 2)
+                )
+                console.print()
+                console.print(error_panel)
+                raise typer.Exit(1)
+
+    if script_type:
+        if script_type not in SCRIPT_TYPE_CHOICES:
+            console.print(f"[red]Error:[/red] Invalid script type '{script_type}'. Choose from: {', '.join(SCRIPT_TYPE_CHOICES.keys())}")
+            raise typer.Exit(1)
+        selected_script = script_type
+    else:
+        default_script = "ps" if os.name == "nt" else "sh"
+
+        if sys.stdin.isatty():
+            selected_script = select_with_arrows(SCRIPT_TYPE_CHOICES, "Choose script type (or press Enter)", default_script)
+        else:
+            selected_script = default_script
+
+    # Project context selection
+    if sys.stdin.isatty():
+        selected_project_type = select_with_arrows(
+            PROJECT_TYPE_CHOICES, 
+            "What type of project is this?", 
+            "greenfield"
+        )
+        
+        # Show context-specific description hints
+        console.print()
+        if selected_project_type in DESCRIPTION_HINTS:
+            console.print(f"[dim]{DESCRIPTION_HINTS[selected_project_type]}[/dim]")
+        
+        # Optional description prompt
+        project_description = typer.prompt(
+            "Brief project description (optional, press Enter to skip)",
+            default="",
+            show_default=False
+        )
+    else:
+        selected_project_type = "greenfield"
+        project_description = ""
+
+    # Check if first time (no .specify folder exists yet) - project-local detection
+    is_first_run = not (project_path / ".specify").exists()
+    create_instructions = False
+    create_scaffolding = False
+    
+    if sys.stdin.isatty():
+        # First-time onboarding prompt
+        if is_first_run:
+            console.print()
+            create_instructions = typer.confirm(
+                "Create instructions.md with Spec Kit getting started guide?",
+                default=True
+            )
+        
+        # Greenfield scaffolding prompt
+        if selected_project_type == "greenfield":
+            console.print()
+            create_scaffolding = typer.confirm(
+                "Create docs/ folder with architecture, roadmap, and ideas templates?",
+                default=True
+            )
+
+    console.print(f"[cyan]Selected AI assistant:[/cyan] {selected_ai}")
+    console.print(f"[cyan]Selected script type:[/cyan] {selected_script}")
+    console.print(f"[cyan]Project type:[/cyan] {selected_project_type}")
+    if project_description:
+        console.print(f"[cyan]Description:[/cyan] {project_description[:50]}{'...' if len(project_description) > 50 else ''}")
+
+    tracker = StepTracker("Initialize Specify Project")
+
+    sys._specify_tracker_active = True
+
+    tracker.add("precheck", "Check required tools")
+    tracker.complete("precheck", "ok")
+    tracker.add("ai-select", "Select AI assistant")
+    tracker.complete("ai-select", f"{selected_ai}")
+    tracker.add("script-select", "Select script type")
+    tracker.complete("script-select", selected_script)
+    tracker.add("context-select", "Select project context")
+    tracker.complete("context-select", selected_project_type)
+    # Steps that only happen in some runs are added when they are first reported
+    optional_steps = {"flatten": False, "chmod-verify": verify_permissions, "instructions": create_instructions, "scaffolding": create_scaffolding}
+    for key, label in STEP_LABELS.items():
+        if optional_steps.get(key, True):
+            tracker.add(key, label)
+
+    tracker_updates = {"running": tracker.start, "done": tracker.complete, "error": tracker.error, "skipped": tracker.skip}
+
+    def progress(project_path: Path, step: str, status: str, detail: str, **metrics) -> None:
+        tracker.add(step, STEP_LABELS.get(step, step))
+        tracker_updates[status](step, detail, **metrics)
+
+    with tracker.live():
+        try:
+            with Initializer(
+                github_token=github_token, use_cache=not no_cache, template_source=from_source,
+                progress=progress, skip_tls=skip_tls, debug=debug,
+            ) as initializer:
+                result = initializer.create(
+                    project_path,
+                    ai=selected_ai,
+                    script=selected_script,
+                    project_type=selected_project_type,
+                    description=project_description,
+                    merge=here,
+                    git=not no_git,
+                    instructions=create_instructions,
+                    scaffolding=create_scaffolding,
+                    verify_permissions=verify_permissions,
+                )
+        except Exception as e:
+            tracker.error("final", str(e))
+            console.print(Panel(f"Initialization failed: {e}", title="Failure", border_style="red"))
+            if debug:
+                _env_pairs = [
+                    ("Python", sys.version.split()[0]),
+                    ("Platform", sys.platform),
+                    ("CWD", str(Path.cwd())),
+                ]
+                _label_width = max(len(k) for k, _ in _env_pairs)
+                env_lines = [f"{k.ljust(_label_width)} → [bright_black]{v}[/bright_black]" for k, v in _env_pairs]
+                console.print(Panel("\n".join(env_lines), title="Debug Environment", border_style="magenta"))
+            report_timings(tracker, timings=timings, trace_file=trace_file)
+            raise typer.Exit(1)
+
+    console.print(tracker.render())
+    report_timings(tracker, timings=timings, trace_file=trace_file)
+    console.print("\n[bold green]Project ready.[/bold green]")
+    
+    # Show git error details if initialization failed
+    git_error_message = result["git_error"]
+    if git_error_message:
+        console.print()
+        git_error_panel = Panel(
+            f"[yellow]Warning:[/yellow] Git repository initialization failed\n\n"
+            f"{git_error_message}\n\n"
+            f"[dim]You can initialize git manually later with:[/dim]\n"
+            f"[cyan]cd {project_path if not here else '.'}[/cyan]\n"
+            f"[cyan]git init[/cyan]\n"
+            f"[cyan]git add .[/cyan]\n"
+            f"[cyan]git commit -m \"Initial commit\"[/cyan]",
+            title="[red]Git Initialization Failed[/red]",
+            border_style="red",
+            padding=(1, 2)
+        )
+        console.print(git_error_panel)
+
+    # Agent folder security notice
+    agent_config = AGENT_CONFIG.get(selected_ai)
+    if agent_config:
+        agent_folder = agent_config["folder"]
+        security_notice = Panel(
+            f"Some agents may store credentials, auth tokens, or other identifying and private artifacts in the agent folder within your project.\n"
+            f"Consider adding [cyan]{agent_folder}[/cyan] (or parts of it) to [cyan].gitignore[/cyan] to prevent accidental credential leakage.",
+            title="[yellow]Agent Folder Security[/yellow]",
+            border_style="yellow",
+            padding=(1, 2)
+        )
+        console.print()
+        console.print(security_notice)
+
+    steps_lines = []
+    if not here:
+        steps_lines.append(f"1. Go to the project folder: [cyan]cd {project_name}[/cyan]")
+        step_num = 2
+    else:
+        steps_lines.append("1. You're already in the project directory!")
+        step_num = 2
+
+    # Add Codex-specific setup step if needed
+    if selected_ai == "codex":
+        codex_path = project_path / ".codex"
+        quoted_path = shlex.quote(str(codex_path))
+        if os.name == "nt":  # Windows
+            cmd = f"setx CODEX_HOME {quoted_path}"
+        else:  # Unix-like systems
+            cmd = f"export CODEX_HOME={quoted_path}"
+        
+        steps_lines.append(f"{step_num}. Set [cyan]CODEX_HOME[/cyan] environment variable before running Codex: [cyan]{cmd}[/cyan]")
+        step_num += 1
+
+    steps_lines.append(f"{step_num}. Start using slash commands with your AI agent:")
+
+    # Show different first step for greenfield projects
+    if selected_project_type == "greenfield":
+        steps_lines.append("   2.1 [cyan]/speckit.initialize[/] - Bootstrap project vision, architecture & roadmap")
+        steps_lines.append("   2.2 [cyan]/speckit.constitution[/] - Establish project principles")
+        steps_lines.append("   2.3 [cyan]/speckit.specify[/] - Create baseline specification")
+        steps_lines.append("   2.4 [cyan]/speckit.plan[/] - Create implementation plan")
+        steps_lines.append("   2.5 [cyan]/speckit.tasks[/] - Generate actionable tasks")
+        steps_lines.append("   2.6 [cyan]/speckit.implement[/] - Execute implementation")
+    else:
+        steps_lines.append("   2.1 [cyan]/speckit.constitution[/] - Establish project principles")
+        steps_lines.append("   2.2 [cyan]/speckit.specify[/] - Create baseline specification")
+        steps_lines.append("   2.3 [cyan]/speckit.plan[/] - Create implementation plan")
+        steps_lines.append("   2.4 [cyan]/speckit.tasks[/] - Generate actionable tasks")
+        steps_lines.append("   2.5 [cyan]/speckit.implement[/] - Execute implementation")
+
+    steps_panel = Panel("\n".join(steps_lines), title="Next Steps", border_style="cyan", padding=(1,2))
+    console.print()
+    console.print(steps_panel)
+
+    enhancement_lines = [
+        "Optional commands that you can use for your specs [bright_black](improve quality & confidence)[/bright_black]",
+        "",
+        f"○ [cyan]/speckit.clarify[/] [bright_black](optional)[/bright_black] - Ask structured questions to de-risk ambiguous areas before planning (run before [cyan]/speckit.plan[/] if used)",
+        f"○ [cyan]/speckit.analyze[/] [bright_black](optional)[/bright_black] - Cross-artifact consistency & alignment report (after [cyan]/speckit.tasks[/], before [cyan]/speckit.implement[/])",
+        f"○ [cyan]/speckit.checklist[/] [bright_black](optional)[/bright_black] - Generate quality checklists to validate requirements completeness, clarity, and consistency (after [cyan]/speckit.plan[/])",
+        f"○ [cyan]/speckit.fix[/] [bright_black](optional)[/bright_black] - Diagnose and fix issues with targeted remediation"
+    ]
+    enhancements_panel = Panel("\n".join(enhancement_lines), title="Enhancement Commands", border_style="cyan", padding=(1,2))
+    console.print()
+    console.print(enhancements_panel)
+
+    review_lines = [
+        "Quality gates and release preparation [bright_black](run after implementation)[/bright_black]",
+        "",
+        f"○ [cyan]/speckit.review-implementation[/] - Audit code against spec with compliance matrix",
+        f"○ [cyan]/speckit.review-security[/] - CodeGuard-powered security review with language-aware rules",
+        f"○ [cyan]/speckit.review-readiness[/] - Production deployment gates with cutover/rollback runbooks",
+        f"○ [cyan]/speckit.review-uat[/] - Generate UAT plans and manual checklists from acceptance criteria",
+        f"○ [cyan]/speckit.review-summary[/] - Create documentation packs (technical, user, admin guides)",
+        f"○ [cyan]/speckit.release-notes[/] - Generate changelog entries and release notes"
+    ]
+    review_panel = Panel("\n".join(review_lines), title="Review Commands", border_style="magenta", padding=(1,2))
+    console.print()
+    console.print(review_panel)
+
+    # Greenfield-specific tip
+    if selected_project_type == "greenfield":
+        console.print()
+        greenfield_tip = Panel(
+            "Since this is a [bold]greenfield project[/bold], start by running [cyan]/speckit.initialize[/cyan] to have a conversation about your project vision.\n\n"
+            "This will populate your [cyan]docs/architecture.md[/cyan], [cyan]docs/roadmap.md[/cyan], and [cyan]docs/ideas.md[/cyan] files, "
+            "giving you a solid foundation before establishing your constitution and specifying features.\n\n"
+            "[dim]Tip: You can paste an initial idea or project description after the command:[/dim]\n"
+            "[cyan]/speckit.initialize I want to build a task management app with real-time collaboration...[/cyan]\n\n"
+            "[dim]Feel free to use AI to flesh out your idea first - the more context you provide, the better![/dim]",
+            title="[green]💡 Greenfield Tip[/green]",
+            border_style="green",
+            padding=(1, 2)
+        )
+        console.print(greenfield_tip)
@@ -0,0 +1,78 @@
+"""`specify status`."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from typing import List
+
+import typer
+from rich.console import Console
+
+from ..errors import SpecifyError
+from ..ui import console
+
+def status(
+    as_json: bool = typer.Option(False, "--json", help="Print the feature state as JSON"),
+    require: List[str] = typer.Option(None, "--require", help="Exit 1 unless the feature is on a NNN- branch and has this artifact, e.g. plan.md (repeatable)"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Rescan and rehash instead of using .specify/cache"),
+):
+    """
+    Show the current feature's branch, directory, project type and artifacts.
+
+    One invocation reports what check-prerequisites.sh and review-feature.sh
+    work out piecemeal: repository root, branch, feature directory, project
+    type and, for each artifact (spec.md, plan.md, tasks.md, contracts/, ...),
+    whether it exists, its size and a SHA-256 of its content. Unchanged files
+    are not re-read: their hashes are kept in .specify/cache/status.json.
+
+    Examples:
+        specify status
+        specify status --json
+        specify status --json --require plan.md --require tasks.md
+    """
+    from ..featurestatus import feature_status
+    from ..features import FEATURE_ARTIFACTS
+
+    # Errors go to stderr so --json output stays parseable
+    err = Console(stderr=True) if as_json else console
+    unknown = [name for name in require or [] if name not in FEATURE_ARTIFACTS]
+    if unknown:
+        err.print(f"[red]Error:[/red] Unknown artifact {', '.join(unknown)}. Choose from: {', '.join(FEATURE_ARTIFACTS)}", highlight=False)
+        raise typer.Exit(1)
+    try:
+        state = feature_status(Path.cwd(), use_cache=not no_cache)
+    except SpecifyError as e:
+        err.print(f"[red]Error:[/red] {e}", highlight=False)
+        raise typer.Exit(1)
+
+    if as_json:
+        sys.stdout.write(json.dumps(state, indent=2) + "\n")
+    else:
+        from rich.table import Table
+
+        console.print(f"Repository  {state['repo_root']}", highlight=False)
+        console.print(f"Branch      [cyan]{state['branch']}[/cyan]{'' if state['has_git'] else ' [dim](no git)[/dim]'}", highlight=False)
+        console.print(f"Feature     {state['feature_dir']}{'' if state['feature_dir_exists'] else ' [yellow](missing)[/yellow]'}", highlight=False)
+        console.print(f"Project     {state['project_type']}" + (f" - {state['project_description']}" if state["project_description"] else ""), highlight=False)
+        table = Table(show_header=True, box=None, padding=(0, 2))
+        table.add_column("Artifact")
+        table.add_column("Size", justify="right")
+        table.add_column("SHA-256", style="dim")
+        for name, artifact in state["artifacts"].items():
+            if artifact["exists"]:
+                files = f" ({artifact['files']} file{'' if artifact['files'] == 1 else 's'})" if "files" in artifact else ""
+                table.add_row(f"[green]✓[/green] {name}", f"{artifact['size']}{files}", artifact["sha256"][:12])
+            else:
+                table.add_row(f"[dim]✗ {name}[/dim]", "", "")
+        console.print(table)
+
+    if require:
+        missing = [name for name in require if not state["artifacts"][name]["exists"]]
+        if not state["feature_branch"] and state["has_git"]:
+            err.print(f"[red]Error:[/red] Not on a feature branch. Current branch: {state['branch']}", highlight=False)
+            raise typer.Exit(1)
+        if missing:
+            err.print(f"[red]Error:[/red] {', '.join(missing)} not found in {state['feature_dir']}", highlight=False)
+            raise typer.Exit(1)
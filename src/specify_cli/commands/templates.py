@@ -0,0 +1,109 @@
+"""`specify templates` sub-commands."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import typer
+from rich.panel import Panel
+
+from ..cache import _sha256_file
+from ..config import AGENT_CONFIG, SCRIPT_TYPE_CHOICES
+from ..github import MIRROR_RELEASE_FILE, _asset_sha256, download_release_asset, fetch_latest_release, find_template_asset, get_http_client
+from ..ui import StepTracker, console
+
+app = typer.Typer(
+    name="templates",
+    help="Manage local template mirrors for offline and air-gapped initialization",
+    add_completion=False,
+)
+
+def _mirror_up_to_date(target: Path, asset: dict) -> bool:
+    """True if ``target`` matches the asset's size and, when GitHub publishes one, its SHA-256."""
+    try:
+        if not target.is_file() or target.stat().st_size != asset.get("size"):
+            return False
+        expected = _asset_sha256(asset)
+        return expected is None or _sha256_file(target) == expected
+    except OSError:
+        return False
+
+@app.command("pull")
+def templates_pull(
+    dest: Path = typer.Argument(..., help="Mirror directory to create or refresh"),
+    ai_assistants: list[str] = typer.Option(None, "--ai", help="Only pull templates for this AI assistant (repeatable; default: all)"),
+    script_types: list[str] = typer.Option(None, "--script", help="Only pull this script type (repeatable; default: sh and ps)"),
+    skip_tls: bool = typer.Option(False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"),
+    debug: bool = typer.Option(False, "--debug", help="Show verbose diagnostic output for network failures"),
+    github_token: str = typer.Option(None, "--github-token", help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)"),
+):
+    """
+    Prefetch template variants of the latest release into a local mirror.
+
+    The mirror holds release.json plus one zip per agent/script variant and can be
+    used later with 'specify init --from <mirror>' without any network access.
+    Assets already present with the expected size are not downloaded again.
+
+    Examples:
+        specify templates pull ./spec-kit-mirror
+        specify templates pull ./spec-kit-mirror --ai claude --ai copilot --script sh
+    """
+    agents = ai_assistants or list(AGENT_CONFIG.keys())
+    scripts = script_types or list(SCRIPT_TYPE_CHOICES.keys())
+    for agent in agents:
+        if agent not in AGENT_CONFIG:
+            console.print(f"[red]Error:[/red] Invalid AI assistant '{agent}'. Choose from: {', '.join(AGENT_CONFIG.keys())}")
+            raise typer.Exit(1)
+    for script in scripts:
+        if script not in SCRIPT_TYPE_CHOICES:
+            console.print(f"[red]Error:[/red] Invalid script type '{script}'. Choose from: {', '.join(SCRIPT_TYPE_CHOICES.keys())}")
+            raise typer.Exit(1)
+
+    local_client = get_http_client(skip_tls=skip_tls)
+    try:
+        release_data = fetch_latest_release(local_client, github_token=github_token, debug=debug)
+    except Exception as e:
+        console.print("[red]Error fetching release information[/red]")
+        console.print(Panel(str(e), title="Fetch Error", border_style="red"))
+        raise typer.Exit(1)
+
+    dest = dest.expanduser().resolve()
+    dest.mkdir(parents=True, exist_ok=True)
+
+    tracker = StepTracker(f"Pull templates {release_data.get('tag_name', '')} into {dest}")
+    variants = [(agent, script) for agent in agents for script in scripts]
+    for agent, script in variants:
+        tracker.add(f"{agent}-{script}", f"{agent} ({script})")
+
+    failures = 0
+    with tracker.live():
+        for agent, script in variants:
+            key = f"{agent}-{script}"
+            asset = find_template_asset(release_data, agent, script)
+            if asset is None:
+                tracker.error(key, "no matching release asset")
+                failures += 1
+                continue
+            target = dest / asset["name"]
+            if _mirror_up_to_date(target, asset):
+                tracker.skip(key, f"{asset['name']} (up to date)")
+                continue
+            tracker.start(key, "downloading")
+            try:
+                download_release_asset(local_client, asset, target, show_progress=False, github_token=github_token, debug=debug)
+            except Exception as e:
+                tracker.error(key, str(e).splitlines()[0])
+                failures += 1
+                continue
+            tracker.complete(key, asset["name"])
+
+    with open(dest / MIRROR_RELEASE_FILE, "w", encoding="utf-8") as f:
+        json.dump(release_data, f, indent=2)
+        f.write("\n")
+
+    console.print(tracker.render())
+    if failures:
+        console.print(f"\n[yellow]{failures} variant(s) could not be pulled.[/yellow]")
+        raise typer.Exit(1)
+    console.print(f"\n[bold green]Mirror ready.[/bold green] Use [cyan]specify init <project> --from {dest}[/cyan]")
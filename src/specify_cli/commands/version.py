@@ -0,0 +1,63 @@
+"""`specify version`."""
+
+from datetime import datetime
+
+from rich.panel import Panel
+
+from ..github import fetch_latest_release, get_http_client
+from ..system import get_cli_version
+from ..ui import console, show_banner
+
+def version():
+    """Display version and system information."""
+    from rich.table import Table
+    import platform
+    
+    show_banner()
+    
+    # Get CLI version from package metadata
+    cli_version = get_cli_version()
+
+    # Fetch latest template release version
+    template_version = "unknown"
+    release_date = "unknown"
+    
+    try:
+        release_data = fetch_latest_release(get_http_client(), timeout=10)
+        template_version = release_data.get("tag_name", "unknown")
+        # Remove 'v' prefix if present
+        if template_version.startswith("v"):
+            template_version = template_version[1:]
+        release_date = release_data.get("published_at", "unknown")
+        if release_date != "unknown":
+            # Format the date nicely
+            try:
+                dt = datetime.fromisoformat(release_date.replace('Z', '+00:00'))
+                release_date = dt.strftime("%Y-%m-%d")
+            except Exception:
+                pass
+    except Exception:
+        pass
+
+    info_table = Table(show_header=False, box=None, padding=(0, 2))
+    info_table.add_column("Key", style="cyan", justify="right")
+    info_table.add_column("Value", style="white")
+
+    info_table.add_row("CLI Version", cli_version)
+    info_table.add_row("Template Version", template_version)
+    info_table.add_row("Released", release_date)
+    info_table.add_row("", "")
+    info_table.add_row("Python", platform.python_version())
+    info_table.add_row("Platform", platform.system())
+    info_table.add_row("Architecture", platform.machine())
+    info_table.add_row("OS Version", platform.version())
+
+    panel = Panel(
+        info_table,
+        title="[bold cyan]Specify CLI Information[/bold cyan]",
+        border_style="cyan",
+        padding=(1, 2)
+    )
+
+    console.print(panel)
+    console.print()
@@ -0,0 +1,31 @@
+"""Exceptions raised by the programmatic specify_cli API.
+
+Every error the API raises on purpose derives from SpecifyError, so callers
+can catch one type. Each class also derives from the closest built-in
+exception, so existing ``except ValueError`` / ``except RuntimeError``
+handlers keep working.
+"""
+
+class SpecifyError(Exception):
+    """Base class for specify_cli errors."""
+
+class ConfigurationError(SpecifyError, ValueError):
+    """An invalid agent, script type, project type, path or manifest."""
+
+class ProjectExistsError(SpecifyError, FileExistsError):
+    """The target project directory already exists."""
+
+class TemplateError(SpecifyError, RuntimeError):
+    """A template could not be located, downloaded or extracted."""
+
+class TemplateNotFoundError(TemplateError, LookupError):
+    """The release or local source has no template for the requested agent/script variant."""
+
+class TemplateDownloadError(TemplateError):
+    """Release metadata or a template asset could not be fetched."""
+
+class TemplateExtractError(TemplateError):
+    """A template archive could not be extracted into the project."""
+
+class FeatureError(SpecifyError, RuntimeError):
+    """A feature branch or spec directory could not be created."""
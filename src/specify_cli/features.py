@@ -0,0 +1,325 @@
+"""Feature numbering and creation for `specify feature new`.
+
+A new feature gets the next number after the highest one used by any branch
+(local or remote-tracking) or any ``specs/NNN-*`` directory. Branches are
+read with a single ``git for-each-ref`` call; nothing is fetched unless asked
+for.
+
+The numbered ``specs/`` directories are indexed in ``.specify/cache``:
+
+* ``features.json`` maps each directory to its feature number and the
+  artifacts it holds (FEATURE_ARTIFACTS). It is keyed by the size and mtime
+  of ``specs/`` (which change whenever an entry is added, removed or renamed)
+  and, per feature, of the feature directory, so only what changed is
+  rescanned. A key whose mtime falls in the same second the index was
+  written is not trusted: on file systems with one-second timestamps a
+  later change in that second would leave the key unchanged.
+* ``features.tsv`` holds ``number<TAB>directory`` lines for the shell
+  helpers in ``scripts/``. They use it while it is strictly newer than
+  ``specs/`` (``[[ index -nt specs ]]``) and list ``specs/`` themselves
+  otherwise.
+
+This is the Python counterpart of ``scripts/bash/create-new-feature.sh`` and
+produces the same branch names.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import shutil
+import subprocess
+import time
+from pathlib import Path
+
+from .errors import ConfigurationError, FeatureError
+from .gitrepo import head_branch
+from .projectcontext import load_cache_entry, stat_key, store_cache_entry, store_cache_text
+
+SPECS_DIR = "specs"
+SPEC_TEMPLATE = Path(".specify") / "templates" / "spec-template.md"
+FEATURES_CACHE_NAME = "features.json"
+FEATURES_INDEX_NAME = "features.tsv"
+# Bump when the cached layout changes
+FEATURES_CACHE_FORMAT = 3
+# Files and directories (trailing slash) recorded per feature in the index
+FEATURE_ARTIFACTS = ("spec.md", "plan.md", "tasks.md", "research.md", "data-model.md", "quickstart.md", "contracts/", "checklists/")
+# GitHub rejects branch names longer than this many bytes
+MAX_BRANCH_LENGTH = 244
+
+STOP_WORDS = frozenset(
+    "i a an the to for of in on at by with from is are was were be been being have has had "
+    "do does did will would should could can may might must shall this that these those "
+    "my your our their want need add get set".split()
+)
+
+_SPEC_NUMBER_RE = re.compile(r"^(\d+)")
+_BRANCH_NUMBER_RE = re.compile(r"^(\d{3})-")
+
+
+def find_repo_root(start: Path) -> tuple[Path, bool]:
+    """Return ``(root, has_git)`` for the repository containing ``start``.
+
+    The nearest directory with ``.git`` wins (like ``git rev-parse
+    --show-toplevel``); without one, the nearest directory with ``.specify``
+    is used. ``has_git`` is False when there is no repository or no git
+    binary. Raises ConfigurationError when neither marker is found.
+    """
+    start = start.resolve()
+    candidates = [start, *start.parents]
+    for directory in candidates:
+        if (directory / ".git").exists():
+            return directory, shutil.which("git") is not None
+    for directory in candidates:
+        if (directory / ".specify").is_dir():
+            return directory, False
+    raise ConfigurationError(f"Could not determine repository root from {start} (no .git or .specify found)")
+
+
+def branch_numbers(repo_root: Path, *, fetch: bool = False) -> list[int]:
+    """Return the feature numbers of every local and remote-tracking branch.
+
+    With ``fetch`` all remotes are fetched (and pruned) first; fetch errors
+    are ignored, as in the shell script.
+    """
+    if fetch:
+        subprocess.run(["git", "fetch", "--all", "--prune"], cwd=repo_root, capture_output=True)
+    try:
+        result = subprocess.run(
+            ["git", "for-each-ref", "--format=%(refname)", "refs/heads", "refs/remotes"],
+            cwd=repo_root, capture_output=True, text=True,
+        )
+    except OSError:
+        return []
+    numbers = []
+    for ref in result.stdout.splitlines():
+        if ref.startswith("refs/heads/"):
+            name = ref[len("refs/heads/"):]
+        else:
+            # refs/remotes/<remote>/<branch>
+            name = ref.split("/", 3)[-1]
+        match = _BRANCH_NUMBER_RE.match(name)
+        if match:
+            numbers.append(int(match.group(1)))
+    return numbers
+
+
+def _scan_specs(specs_dir: Path) -> dict[str, int]:
+    specs = {}
+    with os.scandir(specs_dir) as entries:
+        for entry in entries:
+            match = _SPEC_NUMBER_RE.match(entry.name)
+            if match and entry.is_dir():
+                specs[entry.name] = int(match.group(1))
+    return specs
+
+
+def _scan_artifacts(feature_dir: Path) -> list[str]:
+    try:
+        with os.scandir(feature_dir) as entries:
+            present = {entry.name + "/" if entry.is_dir() else entry.name for entry in entries}
+    except OSError:
+        return []
+    return [name for name in FEATURE_ARTIFACTS if name in present]
+
+
+def _store_feature_index(repo_root: Path, key: list[int], features: dict[str, dict]) -> None:
+    store_cache_entry(
+        repo_root, FEATURES_CACHE_NAME,
+        {"format": FEATURES_CACHE_FORMAT, "key": key, "written": time.time_ns(), "features": features},
+    )
+    ordered = sorted(features.items(), key=lambda item: (item[1]["number"], item[0]))
+    store_cache_text(
+        repo_root, FEATURES_INDEX_NAME,
+        "# number<TAB>directory for each numbered specs/ directory; written by specify\n"
+        + "".join(f"{feature['number']}\t{name}\n" for name, feature in ordered),
+    )
+
+
+def load_feature_index(repo_root: Path, *, use_cache: bool = True, artifacts: bool = True) -> dict[str, dict]:
+    """Return ``{directory name: {"number": int, "artifacts": [...]}}`` for the numbered ``specs/`` directories.
+
+    With ``artifacts`` each feature directory is stat'ed and rescanned only
+    if it changed since it was indexed; without it artifact lists may be
+    stale (used when only numbers are needed). The index is written back
+    when anything changed, inside Specify projects only.
+    """
+    specs_dir = repo_root / SPECS_DIR
+    try:
+        key = stat_key(specs_dir)
+    except OSError:
+        return {}
+    entry = load_cache_entry(repo_root, FEATURES_CACHE_NAME) if use_cache else None
+    if not entry or entry.get("format") != FEATURES_CACHE_FORMAT or not isinstance(entry.get("features"), dict):
+        entry = None
+    cached = entry["features"] if entry else {}
+    written = entry.get("written", 0) // 1_000_000_000 if entry else 0
+
+    def trusted(stored: list[int] | None, current: list[int]) -> bool:
+        # Whole seconds, as on the coarsest file systems
+        return stored == current and current[1] // 1_000_000_000 < written
+
+    changed = entry is None or not trusted(entry.get("key"), key)
+    if changed:
+        features = {
+            name: cached[name] if cached.get(name, {}).get("number") == number else {"number": number, "key": None, "artifacts": []}
+            for name, number in _scan_specs(specs_dir).items()
+        }
+    else:
+        features = cached
+    if artifacts:
+        for name, feature in features.items():
+            try:
+                feature_key = stat_key(specs_dir / name)
+            except OSError:
+                continue
+            if not trusted(feature.get("key"), feature_key):
+                feature.update(key=feature_key, artifacts=_scan_artifacts(specs_dir / name))
+                changed = True
+    # Only cache inside a Specify project, and not if specs/ changed during the scan
+    if changed and use_cache and (repo_root / ".specify").is_dir() and stat_key(specs_dir) == key:
+        _store_feature_index(repo_root, key, features)
+    return {name: {"number": feature["number"], "artifacts": feature["artifacts"]} for name, feature in features.items()}
+
+
+def spec_numbers(repo_root: Path, *, use_cache: bool = True) -> dict[str, int]:
+    """Return ``{directory name: feature number}`` for the numbered directories in ``specs/``."""
+    index = load_feature_index(repo_root, use_cache=use_cache, artifacts=False)
+    return {name: feature["number"] for name, feature in index.items()}
+
+
+def current_feature_branch(repo_root: Path, has_git: bool) -> str:
+    """Return the feature being worked on, resolved like ``get_current_branch`` in common.sh.
+
+    SPECIFY_FEATURE wins, then the checked-out git branch (read from
+    ``.git/HEAD`` when possible, otherwise from git), then (without git) the
+    highest-numbered ``specs/NNN-*`` directory, and finally ``main``.
+    """
+    feature = os.environ.get("SPECIFY_FEATURE")
+    if feature:
+        return feature
+    if has_git:
+        branch = head_branch(repo_root)
+        if branch:
+            return branch
+        try:
+            result = subprocess.run(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=repo_root, capture_output=True, text=True)
+        except OSError:
+            result = None
+        if result is not None and result.returncode == 0 and result.stdout.strip():
+            return result.stdout.strip()
+    numbered = [(number, name) for name, number in spec_numbers(repo_root).items() if re.match(r"\d{3}-", name)]
+    return max(numbered)[1] if numbered else "main"
+
+
+def find_feature_dir(repo_root: Path, branch: str, *, use_cache: bool = True) -> Path:
+    """Return the ``specs/`` directory for ``branch``, matched by its numeric prefix.
+
+    Like ``find_feature_dir_by_prefix`` in common.sh, this lets several
+    branches (``004-fix-bug``, ``004-add-feature``) share one spec. Without a
+    ``NNN-`` prefix or a matching directory, ``specs/<branch>`` is returned.
+    Raises ConfigurationError if several directories share the prefix.
+    """
+    specs_dir = repo_root / SPECS_DIR
+    match = re.match(r"(\d{3})-", branch)
+    if not match:
+        return specs_dir / branch
+    prefix = f"{match.group(1)}-"
+    matches = sorted(name for name in spec_numbers(repo_root, use_cache=use_cache) if name.startswith(prefix))
+    if len(matches) > 1:
+        raise ConfigurationError(f"Multiple spec directories found with prefix '{match.group(1)}': {', '.join(matches)}")
+    return specs_dir / (matches[0] if matches else branch)
+
+
+def next_feature_number(repo_root: Path, *, has_git: bool = True, fetch: bool = False, use_cache: bool = True) -> int:
+    """Return one more than the highest feature number used by a branch or spec directory."""
+    numbers = list(spec_numbers(repo_root, use_cache=use_cache).values())
+    if has_git:
+        numbers += branch_numbers(repo_root, fetch=fetch)
+    return max(numbers, default=0) + 1
+
+
+def clean_branch_name(name: str) -> str:
+    """Lowercase ``name`` and collapse every run of other characters into single hyphens."""
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def branch_suffix(description: str) -> str:
+    """Derive a short branch suffix from a feature description.
+
+    Stop words and words under three letters are dropped (short words are
+    kept when they appear in upper case in ``description``, as acronyms); the
+    first three meaningful words are used, or four if there are exactly four.
+    """
+    words = []
+    for word in re.sub(r"[^a-z0-9]", " ", description.lower()).split():
+        if word in STOP_WORDS:
+            continue
+        if len(word) >= 3 or re.search(rf"\b{re.escape(word.upper())}\b", description):
+            words.append(word)
+    if words:
+        return "-".join(words[:4 if len(words) == 4 else 3])
+    return "-".join(clean_branch_name(description).split("-")[:3])
+
+
+def create_feature(
+    start: Path,
+    description: str,
+    *,
+    short_name: str | None = None,
+    number: int | None = None,
+    fetch: bool = False,
+    use_cache: bool = True,
+) -> dict:
+    """Create the branch and ``specs/<branch>/spec.md`` for a new feature.
+
+    Returns a dict with ``BRANCH_NAME``, ``SPEC_FILE`` and ``FEATURE_NUM``
+    (the keys printed by the shell script) plus ``has_git`` and
+    ``truncated_from`` (the over-long branch name, or None). Raises
+    ConfigurationError for bad input and FeatureError if git cannot create
+    the branch.
+    """
+    description = description.strip()
+    if not description:
+        raise ConfigurationError("A feature description is required")
+    if number is not None and number < 1:
+        raise ConfigurationError(f"Feature number must be positive, got {number}")
+
+    repo_root, has_git = find_repo_root(start)
+    specs_dir = repo_root / SPECS_DIR
+    specs_dir.mkdir(parents=True, exist_ok=True)
+
+    suffix = clean_branch_name(short_name) if short_name else branch_suffix(description)
+    if number is None:
+        number = next_feature_number(repo_root, has_git=has_git, fetch=fetch, use_cache=use_cache)
+    feature_num = f"{number:03d}"
+    branch_name = f"{feature_num}-{suffix}"
+    truncated_from = None
+    if len(branch_name) > MAX_BRANCH_LENGTH:
+        truncated_from = branch_name
+        branch_name = f"{feature_num}-{suffix[:MAX_BRANCH_LENGTH - len(feature_num) - 1].rstrip('-')}"
+
+    if has_git:
+        result = subprocess.run(["git", "checkout", "-b", branch_name], cwd=repo_root, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise FeatureError(f"Could not create branch {branch_name}: {result.stderr.strip()}")
+
+    feature_dir = specs_dir / branch_name
+    feature_dir.mkdir(parents=True, exist_ok=True)
+    spec_file = feature_dir / "spec.md"
+    template = repo_root / SPEC_TEMPLATE
+    if template.is_file():
+        shutil.copyfile(template, spec_file)
+    else:
+        spec_file.touch()
+    if use_cache:
+        # Record the new directory so the shell helpers keep using the index
+        load_feature_index(repo_root)
+
+    return {
+        "BRANCH_NAME": branch_name,
+        "SPEC_FILE": str(spec_file),
+        "FEATURE_NUM": feature_num,
+        "has_git": has_git,
+        "truncated_from": truncated_from,
+    }
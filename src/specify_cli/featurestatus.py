@@ -0,0 +1,155 @@
+"""One-shot feature state for `specify status`.
+
+The slash commands learn where they are by running
+``check-prerequisites.sh`` (or ``review-feature.sh``), which re-sources
+``common.sh``, forks several ``git rev-parse`` calls and re-tests every
+artifact each time. feature_status() answers the same questions in one
+call: repository root, branch, feature directory, project type and, per
+FEATURE_ARTIFACTS entry, presence, size and a SHA-256 of the content (so a
+workflow can tell whether spec.md or plan.md changed since it last looked).
+
+Nothing here forks git when ``.git/HEAD`` can be read directly. The feature
+directory comes from the ``specs/`` index (keyed on directory mtimes) and the
+project type from the compiled context cache. Content hashes are remembered
+in ``.specify/cache/status.json`` by path, size and mtime, so only files that
+changed since the last call are read again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+from pathlib import Path
+
+from .errors import ConfigurationError
+from .features import FEATURE_ARTIFACTS, current_feature_branch, find_feature_dir, find_repo_root
+from .projectcontext import CONTEXT_DEFAULTS, load_cache_entry, load_context, stat_key, store_cache_entry
+from .yamldoc import YamlError
+
+STATUS_CACHE_NAME = "status.json"
+# Bump when the cached layout changes
+STATUS_CACHE_FORMAT = 1
+# Optional documents listed as AVAILABLE_DOCS by check-prerequisites.sh --include-tasks, in its order
+AVAILABLE_DOCS = ("research.md", "data-model.md", "contracts/", "quickstart.md", "tasks.md")
+HASH_CHUNK_SIZE = 1 << 16
+
+_FEATURE_BRANCH_RE = re.compile(r"^\d{3}-")
+
+
+def is_feature_branch(branch: str) -> bool:
+    """True for ``NNN-name`` branches, the naming check_feature_branch in common.sh enforces."""
+    return bool(_FEATURE_BRANCH_RE.match(branch))
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class _HashMemo:
+    """SHA-256 of files, reused from the previous call while their size and mtime are unchanged."""
+
+    def __init__(self, repo_root: Path, use_cache: bool):
+        self.repo_root = repo_root
+        self.use_cache = use_cache
+        entry = load_cache_entry(repo_root, STATUS_CACHE_NAME) if use_cache else None
+        hashes = entry.get("hashes") if entry and entry.get("format") == STATUS_CACHE_FORMAT else None
+        self.previous = hashes if isinstance(hashes, dict) else {}
+        self.current: dict[str, list] = {}
+
+    def file(self, path: Path, key: list[int]) -> str:
+        name = path.relative_to(self.repo_root).as_posix()
+        cached = self.previous.get(name)
+        if isinstance(cached, list) and len(cached) == 3 and cached[:2] == key:
+            digest = cached[2]
+        else:
+            digest = _sha256(path)
+            # A file rewritten while it was read is hashed again next time
+            if stat_key(path) != key:
+                return digest
+        self.current[name] = [*key, digest]
+        return digest
+
+    def save(self) -> None:
+        """Store the hashes of this call (entries for other features are dropped)."""
+        if self.use_cache and self.current != self.previous and (self.repo_root / ".specify").is_dir():
+            store_cache_entry(self.repo_root, STATUS_CACHE_NAME, {"format": STATUS_CACHE_FORMAT, "hashes": self.current})
+
+
+def _artifact(path: Path, is_dir: bool, memo: _HashMemo) -> dict:
+    record = {"path": str(path), "exists": False, "size": None, "sha256": None}
+    if not is_dir:
+        try:
+            key = stat_key(path)
+        except OSError:
+            return record
+        if not path.is_file():
+            return record
+        record.update(exists=True, size=key[0], sha256=memo.file(path, key))
+        return record
+
+    if not path.is_dir():
+        return {**record, "files": 0}
+    # A directory hashes as the sorted "relative path NUL file hash" lines of its files
+    files = []
+    for directory, dirnames, filenames in os.walk(path):
+        dirnames.sort()
+        for filename in filenames:
+            file_path = Path(directory) / filename
+            try:
+                files.append((file_path.relative_to(path).as_posix(), file_path, stat_key(file_path)))
+            except OSError:
+                continue
+    digest = hashlib.sha256()
+    for relative, file_path, key in sorted(files):
+        digest.update(f"{relative}\0{memo.file(file_path, key)}\n".encode("utf-8"))
+    record.update(exists=True, size=sum(key[0] for _, _, key in files), sha256=digest.hexdigest(), files=len(files))
+    return record
+
+
+def feature_status(start: Path, *, use_cache: bool = True) -> dict:
+    """Return the state of the feature being worked on in the repository containing ``start``.
+
+    The result has ``repo_root``, ``branch``, ``has_git``, ``feature_branch``
+    (whether the branch is named ``NNN-...``), ``feature_dir``,
+    ``feature_dir_exists``, ``project_type``, ``project_description``,
+    ``artifacts`` (FEATURE_ARTIFACTS name -> ``path``, ``exists``, ``size``,
+    ``sha256``, plus ``files`` for directories) and ``available_docs`` (as
+    check-prerequisites.sh reports them). Raises ConfigurationError when no
+    repository is found, several spec directories share the branch's prefix
+    or context.yaml cannot be parsed.
+    """
+    repo_root, has_git = find_repo_root(start)
+    branch = current_feature_branch(repo_root, has_git)
+    feature_dir = find_feature_dir(repo_root, branch, use_cache=use_cache)
+    try:
+        context = load_context(repo_root, use_cache=use_cache)
+    except FileNotFoundError:
+        context = CONTEXT_DEFAULTS
+    except YamlError as e:
+        raise ConfigurationError(f"Cannot parse .specify/context.yaml: {e}") from None
+
+    memo = _HashMemo(repo_root, use_cache)
+    artifacts = {
+        name: _artifact(feature_dir / name.rstrip("/"), name.endswith("/"), memo)
+        for name in FEATURE_ARTIFACTS
+    }
+    memo.save()
+
+    return {
+        "repo_root": str(repo_root),
+        "branch": branch,
+        "has_git": has_git,
+        "feature_branch": is_feature_branch(branch),
+        "feature_dir": str(feature_dir),
+        "feature_dir_exists": feature_dir.is_dir(),
+        "project_type": context.get("project_type") or "greenfield",
+        "project_description": context.get("description") or "",
+        "artifacts": artifacts,
+        # contracts/ counts only when it holds files, as in check-prerequisites.sh
+        "available_docs": [name for name in AVAILABLE_DOCS if artifacts[name]["exists"] and artifacts[name].get("files", 1)],
+    }
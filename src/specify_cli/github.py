@@ -0,0 +1,745 @@
+"""GitHub access: shared HTTP client, latest-release lookup and template downloads."""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, BinaryIO, Callable, Tuple
+
+import typer
+from rich.panel import Panel
+
+from .cache import TemplateCache, _cache_root
+from .errors import TemplateDownloadError
+from .ui import _progress_bar, console
+
+if TYPE_CHECKING:
+    import ssl
+
+    import httpx
+
+_ssl_context: ssl.SSLContext | None = None
+_http_clients: dict[bool, httpx.Client] = {}
+_http_clients_lock = threading.Lock()
+
+# Connection pool shared by every request a process makes to GitHub: release
+# metadata and asset downloads reuse kept-alive connections (one TLS handshake
+# per host) instead of opening a new one per request.
+HTTP_MAX_CONNECTIONS = 20
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 10
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 30.0
+
+def get_ssl_context() -> ssl.SSLContext:
+    """Return the shared truststore-backed SSL context, creating it on first use."""
+    global _ssl_context
+    if _ssl_context is None:
+        import ssl
+        import truststore
+        _ssl_context = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    return _ssl_context
+
+def http2_enabled() -> bool:
+    """True when the optional ``h2`` package is installed and SPECIFY_HTTP2 does not turn HTTP/2 off."""
+    import importlib.util
+    if (os.getenv("SPECIFY_HTTP2") or "").strip().lower() in ("0", "false", "no", "off"):
+        return False
+    return importlib.util.find_spec("h2") is not None
+
+def _client_options(skip_tls: bool) -> dict:
+    """Keyword arguments shared by the sync and async client factories."""
+    import httpx
+    return {
+        "verify": False if skip_tls else get_ssl_context(),
+        "http2": http2_enabled(),
+        "limits": httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    }
+
+def get_http_client(skip_tls: bool = False) -> httpx.Client:
+    """Return the shared, pooled HTTP client, creating it on first use.
+
+    There is one client per TLS mode for the whole process (thread-safe); with
+    ``skip_tls`` it does not verify certificates (not recommended). HTTP/2 is
+    negotiated when ``h2`` is installed (``pip install specify-cli[http2]``).
+    The clients are closed at interpreter exit.
+    """
+    import httpx
+    with _http_clients_lock:
+        client = _http_clients.get(skip_tls)
+        if client is None or client.is_closed:
+            if not _http_clients:
+                atexit.register(close_http_clients)
+            client = _http_clients[skip_tls] = httpx.Client(**_client_options(skip_tls))
+        return client
+
+def get_async_http_client(skip_tls: bool = False) -> httpx.AsyncClient:
+    """Return a new pooled AsyncClient (HTTP/2 when available) for the running event loop.
+
+    Async clients are bound to one event loop, so they are not shared
+    process-wide. Use one per batch of work, as ``async with``, so that the
+    release lookup and all asset downloads share its connections.
+    """
+    import httpx
+    return httpx.AsyncClient(**_client_options(skip_tls))
+
+def close_http_clients() -> None:
+    """Close the shared HTTP clients (they are recreated on next use)."""
+    with _http_clients_lock:
+        clients = list(_http_clients.values())
+        _http_clients.clear()
+    for client in clients:
+        client.close()
+
+def __getattr__(name: str):
+    # ``ssl_context`` and ``client`` used to be module globals built at import time
+    if name == "ssl_context":
+        return get_ssl_context()
+    if name == "client":
+        return get_http_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _github_token(cli_token: str | None = None) -> str | None:
+    """Return sanitized GitHub token (cli arg takes precedence) or None."""
+    return ((cli_token or os.getenv("GH_TOKEN") or os.getenv("GITHUB_TOKEN") or "").strip()) or None
+
+def _github_auth_headers(cli_token: str | None = None) -> dict:
+    """Return Authorization header dict only when a non-empty token exists."""
+    token = _github_token(cli_token)
+    return {"Authorization": f"Bearer {token}"} if token else {}
+
+def _parse_rate_limit_headers(headers: httpx.Headers) -> dict:
+    """Extract and parse GitHub rate-limit headers."""
+    info = {}
+    
+    # Standard GitHub rate-limit headers
+    if "X-RateLimit-Limit" in headers:
+        info["limit"] = headers.get("X-RateLimit-Limit")
+    if "X-RateLimit-Remaining" in headers:
+        info["remaining"] = headers.get("X-RateLimit-Remaining")
+    if "X-RateLimit-Reset" in headers:
+        reset_epoch = int(headers.get("X-RateLimit-Reset", "0"))
+        if reset_epoch:
+            reset_time = datetime.fromtimestamp(reset_epoch, tz=timezone.utc)
+            info["reset_epoch"] = reset_epoch
+            info["reset_time"] = reset_time
+            info["reset_local"] = reset_time.astimezone()
+    
+    # Retry-After header (seconds or HTTP-date)
+    if "Retry-After" in headers:
+        retry_after = headers.get("Retry-After")
+        try:
+            info["retry_after_seconds"] = int(retry_after)
+        except ValueError:
+            # HTTP-date format
+            from email.utils import parsedate_to_datetime
+            info["retry_after"] = retry_after
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                info["retry_after_seconds"] = max(0, int(retry_at.timestamp() - time.time()))
+            except (TypeError, ValueError):
+                pass
+    
+    return info
+
+def _format_rate_limit_error(status_code: int, headers: httpx.Headers, url: str) -> str:
+    """Format a user-friendly error message with rate-limit information."""
+    rate_info = _parse_rate_limit_headers(headers)
+    
+    lines = [f"GitHub API returned status {status_code} for {url}"]
+    lines.append("")
+    
+    if rate_info:
+        lines.append("[bold]Rate Limit Information:[/bold]")
+        if "limit" in rate_info:
+            lines.append(f"  • Rate Limit: {rate_info['limit']} requests/hour")
+        if "remaining" in rate_info:
+            lines.append(f"  • Remaining: {rate_info['remaining']}")
+        if "reset_local" in rate_info:
+            reset_str = rate_info["reset_local"].strftime("%Y-%m-%d %H:%M:%S %Z")
+            lines.append(f"  • Resets at: {reset_str}")
+        if "retry_after_seconds" in rate_info:
+            lines.append(f"  • Retry after: {rate_info['retry_after_seconds']} seconds")
+        lines.append("")
+    
+    # Add troubleshooting guidance
+    lines.append("[bold]Troubleshooting Tips:[/bold]")
+    lines.append("  • If you're on a shared CI or corporate environment, you may be rate-limited.")
+    lines.append("  • Consider using a GitHub token via --github-token or the GH_TOKEN/GITHUB_TOKEN")
+    lines.append("    environment variable to increase rate limits.")
+    lines.append("  • Authenticated requests have a limit of 5,000/hour vs 60/hour for unauthenticated.")
+    
+    return "\n".join(lines)
+
+# GitHub repository that publishes the spec-kit-template-* release assets
+TEMPLATE_REPO_OWNER = "mb-etc"
+TEMPLATE_REPO_NAME = "spec-kit-etc"
+
+# How long a stored release lookup may be reused when GitHub cannot be reached
+# (override with SPECIFY_RELEASE_CACHE_TTL, in seconds; 0 disables the fallback)
+RELEASE_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+def _github_api_base() -> str:
+    """Return the GitHub API base URL (SPECIFY_GITHUB_API_URL overrides, e.g. for a local stand-in)."""
+    return ((os.getenv("SPECIFY_GITHUB_API_URL") or "").strip() or "https://api.github.com").rstrip("/")
+
+def _latest_release_url() -> str:
+    return f"{_github_api_base()}/repos/{TEMPLATE_REPO_OWNER}/{TEMPLATE_REPO_NAME}/releases/latest"
+
+def _release_cache_ttl() -> float:
+    try:
+        return float(os.getenv("SPECIFY_RELEASE_CACHE_TTL", RELEASE_CACHE_TTL_SECONDS))
+    except ValueError:
+        return RELEASE_CACHE_TTL_SECONDS
+
+def _release_cache_path() -> Path:
+    return _cache_root() / "releases" / "latest.json"
+
+def _load_cached_release(api_url: str) -> dict | None:
+    try:
+        with open(_release_cache_path(), "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        return None
+    if not isinstance(entry, dict) or entry.get("url") != api_url or not isinstance(entry.get("data"), dict):
+        return None
+    return entry
+
+def _store_cached_release(entry: dict) -> None:
+    path = _release_cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".latest-", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # Caching is best-effort; the lookup itself already succeeded
+
+def _release_request(github_token: str | None) -> Tuple[str, dict, dict | None]:
+    """Return the URL, headers (with ``If-None-Match`` when a stored ETag exists) and stored entry for a release lookup."""
+    api_url = _latest_release_url()
+    cached = _load_cached_release(api_url)
+    headers = _github_auth_headers(github_token)
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    return api_url, headers, cached
+
+def _release_fallback(cached: dict | None, reason: str) -> dict:
+    if cached and time.time() - cached.get("fetched_at", 0) <= _release_cache_ttl():
+        return cached["data"]
+    raise RuntimeError(reason)
+
+def _release_from_response(response: httpx.Response, api_url: str, cached: dict | None, debug: bool) -> dict:
+    """Turn a (fully read) release response into release JSON, updating the stored copy."""
+    status = response.status_code
+    if status == 304 and cached:
+        cached["fetched_at"] = time.time()
+        _store_cached_release(cached)
+        return cached["data"]
+    if status != 200:
+        # Format detailed error message with rate-limit info
+        error_msg = _format_rate_limit_error(status, response.headers, api_url)
+        if debug:
+            error_msg += f"\n\n[dim]Response body (truncated 500):[/dim]\n{response.text[:500]}"
+        return _release_fallback(cached, error_msg)
+    try:
+        release_data = response.json()
+    except ValueError as je:
+        raise RuntimeError(f"Failed to parse release JSON: {je}\nRaw (truncated 400): {response.text[:400]}")
+
+    _store_cached_release({
+        "url": api_url,
+        "etag": response.headers.get("ETag"),
+        "fetched_at": time.time(),
+        "data": release_data,
+    })
+    return release_data
+
+def fetch_latest_release(client: httpx.Client, *, github_token: str = None, timeout: float = 30, debug: bool = False) -> dict:
+    """Return the release JSON for the latest template release.
+
+    The previous response and its ETag are persisted in the user cache and
+    replayed with ``If-None-Match``; a 304 reply reuses the stored JSON without
+    spending GitHub rate-limit budget. If GitHub is unreachable or refuses the
+    request, a stored response younger than the release cache TTL is returned
+    instead. Raises RuntimeError when no usable release information exists.
+    """
+    import httpx
+    api_url, headers, cached = _release_request(github_token)
+    try:
+        response = client.get(api_url, timeout=timeout, follow_redirects=True, headers=headers)
+    except httpx.HTTPError as e:
+        return _release_fallback(cached, f"Could not reach {api_url}: {e}")
+    return _release_from_response(response, api_url, cached, debug)
+
+async def fetch_latest_release_async(client: httpx.AsyncClient, *, github_token: str = None, timeout: float = 30, debug: bool = False) -> dict:
+    """Async fetch_latest_release, for use with get_async_http_client()."""
+    import httpx
+    api_url, headers, cached = _release_request(github_token)
+    try:
+        response = await client.get(api_url, timeout=timeout, follow_redirects=True, headers=headers)
+    except httpx.HTTPError as e:
+        return _release_fallback(cached, f"Could not reach {api_url}: {e}")
+    return _release_from_response(response, api_url, cached, debug)
+
+# File written next to the assets in a mirror created by `specify templates pull`
+MIRROR_RELEASE_FILE = "release.json"
+
+def _template_asset_pattern(ai_assistant: str, script_type: str) -> str:
+    return f"spec-kit-template-{ai_assistant}-{script_type}"
+
+def find_template_asset(release_data: dict, ai_assistant: str, script_type: str) -> dict | None:
+    """Return the release asset for an agent/script variant, or None."""
+    pattern = _template_asset_pattern(ai_assistant, script_type)
+    for asset in release_data.get("assets", []):
+        if pattern in asset["name"] and asset["name"].endswith(".zip"):
+            return asset
+    return None
+
+# Template downloads up to this size are spooled in memory; larger ones spill to a temp file
+TEMPLATE_SPOOL_MAX_BYTES = 32 * 1024 * 1024
+
+# Interrupted downloads are resumed with HTTP Range requests, up to this many attempts
+# (override with SPECIFY_DOWNLOAD_RETRIES). Waits back off exponentially from
+# DOWNLOAD_RETRY_BASE_SECONDS unless the server asks for a specific delay via
+# Retry-After / X-RateLimit-Reset; delays longer than DOWNLOAD_RETRY_MAX_WAIT_SECONDS
+# are not waited out.
+DOWNLOAD_MAX_ATTEMPTS = 5
+DOWNLOAD_RETRY_BASE_SECONDS = 1.0
+DOWNLOAD_RETRY_MAX_WAIT_SECONDS = 60
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+class _RetryableDownloadError(Exception):
+    """A download attempt failed in a way worth retrying.
+
+    ``delay`` is the wait the server asked for, if any; ``restart`` discards the
+    partial data instead of resuming after it.
+    """
+
+    def __init__(self, message: str, delay: float | None = None, restart: bool = False):
+        super().__init__(message)
+        self.delay = delay
+        self.restart = restart
+
+class DownloadVerificationError(TemplateDownloadError):
+    """A downloaded asset does not match its published size or SHA-256 digest."""
+
+def _download_max_attempts() -> int:
+    try:
+        return max(1, int(os.getenv("SPECIFY_DOWNLOAD_RETRIES", DOWNLOAD_MAX_ATTEMPTS)))
+    except ValueError:
+        return DOWNLOAD_MAX_ATTEMPTS
+
+def _server_retry_delay(headers: httpx.Headers) -> float | None:
+    """Return the delay the server asked for via Retry-After or an exhausted rate limit."""
+    rate_info = _parse_rate_limit_headers(headers)
+    if "retry_after_seconds" in rate_info:
+        return max(0.0, float(rate_info["retry_after_seconds"]))
+    if rate_info.get("remaining") == "0" and "reset_epoch" in rate_info:
+        return max(0.0, rate_info["reset_epoch"] - time.time())
+    return None
+
+def _retry_delay(attempt: int, server_delay: float | None) -> float:
+    if server_delay is not None:
+        return server_delay
+    return DOWNLOAD_RETRY_BASE_SECONDS * (2 ** (attempt - 1)) * random.uniform(0.5, 1.0)
+
+def _asset_sha256(asset: dict) -> str | None:
+    """Return the SHA-256 GitHub publishes for a release asset (``digest: "sha256:<hex>"``), if any."""
+    digest = asset.get("digest") or ""
+    algorithm, _, value = digest.partition(":")
+    return value.lower() if algorithm == "sha256" and value else None
+
+def _check_asset_response(response: httpx.Response, url: str, offset: int, debug: bool) -> bool:
+    """Validate the status of an asset response requested from ``offset``.
+
+    Returns True when the server sent the whole file despite a Range request,
+    so the sink must be restarted. Raises _RetryableDownloadError for transient
+    failures and RuntimeError otherwise. With ``debug`` the caller must have
+    read the body of an error response.
+    """
+    if response.status_code == 416 and offset:
+        # Our partial data no longer matches the remote file; start over
+        raise _RetryableDownloadError("range not satisfiable", delay=0, restart=True)
+    if response.status_code not in (200, 206):
+        error_msg = _format_rate_limit_error(response.status_code, response.headers, url)
+        if debug:
+            error_msg += f"\n\n[dim]Response body (truncated 400):[/dim]\n{response.text[:400]}"
+        rate_limited = response.status_code == 403 and response.headers.get("X-RateLimit-Remaining") == "0"
+        if response.status_code in RETRYABLE_STATUS_CODES or rate_limited:
+            raise _RetryableDownloadError(error_msg, delay=_server_retry_delay(response.headers))
+        raise RuntimeError(error_msg)
+    if response.status_code == 206:
+        content_range = response.headers.get("content-range", "")
+        if not content_range.startswith(f"bytes {offset}-"):
+            raise _RetryableDownloadError(f"unexpected Content-Range {content_range!r}", delay=0, restart=True)
+        return False
+    return bool(offset)
+
+def _stream_attempt(client: httpx.Client, url: str, sink: BinaryIO, sha256, offset: int, *, on_progress: Callable[[int, int], None] | None, github_token: str, debug: bool) -> Tuple[int, int, object]:
+    """Run one GET of a release asset, appending to ``sink`` from ``offset``.
+
+    Returns ``(bytes_in_sink, expected_total, sha256)``; the hash is updated in
+    place, or replaced when a server ignores the Range request and the sink is
+    restarted from scratch. Transient failures raise _RetryableDownloadError.
+    """
+    import httpx
+    headers = _github_auth_headers(github_token)
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+    try:
+        with client.stream("GET", url, timeout=60, follow_redirects=True, headers=headers) as response:
+            if debug and response.status_code not in (200, 206):
+                response.read()
+            if _check_asset_response(response, url, offset, debug):
+                # Full body despite the Range header: discard what we had
+                sink.seek(0)
+                sink.truncate()
+                sha256 = hashlib.sha256()
+                offset = 0
+            content_length = int(response.headers.get("content-length", 0))
+            total = offset + content_length if content_length else 0
+
+            downloaded = offset
+            for chunk in response.iter_bytes(chunk_size=65536):
+                sink.write(chunk)
+                sha256.update(chunk)
+                downloaded += len(chunk)
+                if on_progress:
+                    on_progress(downloaded, total)
+            return downloaded, total, sha256
+    except httpx.TransportError as e:
+        raise _RetryableDownloadError(f"{type(e).__name__}: {e}") from e
+
+async def _stream_attempt_async(client: httpx.AsyncClient, url: str, sink: BinaryIO, sha256, offset: int, *, on_progress: Callable[[int, int], None] | None, github_token: str, debug: bool) -> Tuple[int, int, object]:
+    """Async _stream_attempt."""
+    import httpx
+    headers = _github_auth_headers(github_token)
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+    try:
+        async with client.stream("GET", url, timeout=60, follow_redirects=True, headers=headers) as response:
+            if debug and response.status_code not in (200, 206):
+                await response.aread()
+            if _check_asset_response(response, url, offset, debug):
+                sink.seek(0)
+                sink.truncate()
+                sha256 = hashlib.sha256()
+                offset = 0
+            content_length = int(response.headers.get("content-length", 0))
+            total = offset + content_length if content_length else 0
+
+            downloaded = offset
+            async for chunk in response.aiter_bytes(chunk_size=65536):
+                sink.write(chunk)
+                sha256.update(chunk)
+                downloaded += len(chunk)
+                if on_progress:
+                    on_progress(downloaded, total)
+            return downloaded, total, sha256
+    except httpx.TransportError as e:
+        raise _RetryableDownloadError(f"{type(e).__name__}: {e}") from e
+
+class _AssetTransfer:
+    """Resume, retry and verification state of one asset download.
+
+    Shared by the sync and async download loops, which only differ in how an
+    attempt is streamed and how they wait between attempts.
+    """
+
+    def __init__(self, asset: dict, sink: BinaryIO):
+        self.asset = asset
+        self.sink = sink
+        self.url = asset["browser_download_url"]
+        self.expected_size = asset.get("size") or 0
+        self.expected_sha256 = _asset_sha256(asset)
+        self.max_attempts = _download_max_attempts()
+        self.attempt = 0
+        self.restarted = False
+
+        # Hash the resumed prefix so the final digest covers the whole file
+        self.sha256 = hashlib.sha256()
+        sink.seek(0)
+        for chunk in iter(lambda: sink.read(1024 * 1024), b""):
+            self.sha256.update(chunk)
+        self.offset = sink.tell()
+        if self.expected_size and self.offset > self.expected_size:
+            self.reset()
+
+    def reset(self) -> None:
+        self.sink.seek(0)
+        self.sink.truncate()
+        self.sha256 = hashlib.sha256()
+        self.offset = 0
+
+    @property
+    def complete(self) -> bool:
+        """The sink already holds every expected byte (e.g. from a previous run); only verify."""
+        return bool(self.expected_size) and self.offset == self.expected_size
+
+    def check_length(self, downloaded: int, total: int) -> None:
+        if (total and downloaded < total) or (self.expected_size and downloaded < self.expected_size):
+            raise _RetryableDownloadError(f"connection closed after {downloaded:,} of {total or self.expected_size:,} bytes")
+
+    def retry_delay(self, error: _RetryableDownloadError) -> float:
+        """Record a failed attempt and return how long to wait; raise RuntimeError when giving up."""
+        self.offset = self.sink.tell()
+        if error.restart:
+            self.reset()
+        if self.attempt >= self.max_attempts:
+            raise RuntimeError(f"Download failed after {self.attempt} attempts: {error}") from error
+        delay = _retry_delay(self.attempt, error.delay)
+        if delay > DOWNLOAD_RETRY_MAX_WAIT_SECONDS:
+            raise RuntimeError(f"{error}\n\nServer asked to wait {delay:.0f}s; not retrying.") from error
+        console.print(f"[yellow]Download interrupted ({str(error).splitlines()[0]}); retrying from byte {self.offset:,} in {delay:.1f}s (attempt {self.attempt + 1}/{self.max_attempts})[/yellow]")
+        return delay
+
+    def verify(self, downloaded: int) -> str | None:
+        """Return the hex digest if the sink checks out, or None to download again from the start.
+
+        Raises DownloadVerificationError when a from-scratch download is wrong.
+        """
+        digest = self.sha256.hexdigest()
+        if self.expected_size and downloaded != self.expected_size:
+            problem = f"size mismatch: expected {self.expected_size:,} bytes, got {downloaded:,}"
+        elif self.expected_sha256 and digest != self.expected_sha256:
+            problem = f"SHA-256 mismatch: expected {self.expected_sha256}, got {digest}"
+        else:
+            return digest
+        if self.restarted or self.offset == 0:
+            raise DownloadVerificationError(f"Downloaded {self.asset.get('name', self.url)} failed verification ({problem})")
+        # A stale resumed prefix can poison the file; retry once from scratch
+        console.print(f"[yellow]Resumed download failed verification ({problem}); downloading again from the start[/yellow]")
+        self.reset()
+        self.restarted = True
+        self.attempt = 0
+        return None
+
+def stream_release_asset(client: httpx.Client, asset: dict, sink: BinaryIO, *, on_progress: Callable[[int, int], None] | None = None, github_token: str = None, debug: bool = False) -> str:
+    """Stream a release asset into a readable and writable binary file object.
+
+    Bytes already in ``sink`` are treated as a previously downloaded prefix and
+    the transfer resumes after them with an HTTP Range request; dropped
+    connections, 5xx responses and rate limits are retried the same way with
+    exponential backoff (see DOWNLOAD_MAX_ATTEMPTS). The result is checked
+    against the asset's size and its published SHA-256 digest, when GitHub
+    provides one.
+
+    ``on_progress(downloaded, total)`` is called after every chunk (total is 0
+    when the size is unknown). Returns the hex SHA-256 digest of the sink's
+    content; raises RuntimeError on non-retryable errors, exhausted retries or
+    an integrity mismatch (DownloadVerificationError).
+    """
+    transfer = _AssetTransfer(asset, sink)
+    while True:
+        transfer.attempt += 1
+        try:
+            if transfer.complete:
+                downloaded = transfer.offset
+            else:
+                downloaded, total, transfer.sha256 = _stream_attempt(
+                    client, transfer.url, sink, transfer.sha256, transfer.offset,
+                    on_progress=on_progress, github_token=github_token, debug=debug,
+                )
+                transfer.check_length(downloaded, total)
+        except _RetryableDownloadError as e:
+            time.sleep(transfer.retry_delay(e))
+            continue
+        digest = transfer.verify(downloaded)
+        if digest is not None:
+            return digest
+
+async def stream_release_asset_async(client: httpx.AsyncClient, asset: dict, sink: BinaryIO, *, on_progress: Callable[[int, int], None] | None = None, github_token: str = None, debug: bool = False) -> str:
+    """Async stream_release_asset (same resume, retry and verification rules)."""
+    import asyncio
+    transfer = _AssetTransfer(asset, sink)
+    while True:
+        transfer.attempt += 1
+        try:
+            if transfer.complete:
+                downloaded = transfer.offset
+            else:
+                downloaded, total, transfer.sha256 = await _stream_attempt_async(
+                    client, transfer.url, sink, transfer.sha256, transfer.offset,
+                    on_progress=on_progress, github_token=github_token, debug=debug,
+                )
+                transfer.check_length(downloaded, total)
+        except _RetryableDownloadError as e:
+            await asyncio.sleep(transfer.retry_delay(e))
+            continue
+        digest = transfer.verify(downloaded)
+        if digest is not None:
+            return digest
+
+def download_release_asset(client: httpx.Client, asset: dict, dest: Path, *, show_progress: bool = True, on_progress: Callable[[int, int], None] | None = None, github_token: str = None, debug: bool = False) -> str:
+    """Stream a release asset to ``dest`` and return its hex SHA-256 digest.
+
+    The transfer goes to ``dest`` + ``.part`` first and is renamed on success. A
+    ``.part`` file left by an interrupted run is resumed rather than downloaded
+    again; it is only removed when the data fails verification. Progress goes
+    to ``on_progress(downloaded, total)`` when given, else to a progress bar
+    if ``show_progress``. Raises RuntimeError on HTTP errors.
+    """
+    partial = dest.with_name(dest.name + ".part")
+    try:
+        with open(partial, 'a+b') as f:
+            if on_progress is not None or not show_progress:
+                sha256 = stream_release_asset(client, asset, f, on_progress=on_progress, github_token=github_token, debug=debug)
+            else:
+                with _progress_bar() as progress:
+                    task = progress.add_task("Downloading...", total=asset.get("size") or None)
+                    sha256 = stream_release_asset(
+                        client, asset, f,
+                        on_progress=lambda done, total: progress.update(task, completed=done, total=total or None),
+                        github_token=github_token,
+                        debug=debug,
+                    )
+    except DownloadVerificationError:
+        if partial.exists():
+            partial.unlink()
+        raise
+    os.replace(partial, dest)
+    return sha256
+
+async def download_release_asset_async(client: httpx.AsyncClient, asset: dict, dest: Path, *, github_token: str = None, debug: bool = False) -> str:
+    """Async download_release_asset (no progress bar; resumes ``dest.part`` the same way)."""
+    partial = dest.with_name(dest.name + ".part")
+    try:
+        with open(partial, 'a+b') as f:
+            sha256 = await stream_release_asset_async(client, asset, f, github_token=github_token, debug=debug)
+    except DownloadVerificationError:
+        if partial.exists():
+            partial.unlink()
+        raise
+    os.replace(partial, dest)
+    return sha256
+
+def download_template_from_github(ai_assistant: str, download_dir: Path | None, *, script_type: str = "sh", verbose: bool = True, show_progress: bool = True, client: httpx.Client = None, debug: bool = False, github_token: str = None, use_cache: bool = True, on_progress: Callable[[int, int], None] | None = None) -> Tuple[Path | IO[bytes], dict]:
+    """Fetch the template archive for an agent/script variant of the latest release.
+
+    The archive is written to ``download_dir``; when ``download_dir`` is None it
+    is spooled into a SpooledTemporaryFile instead (in memory up to
+    TEMPLATE_SPOOL_MAX_BYTES) and the open file object is returned, positioned at
+    the start, with ``metadata["spooled"]`` set. The caller must close it.
+
+    When ``use_cache`` is set, archives are served from (and added to) the local
+    TemplateCache; a cached result is flagged with ``metadata["cached"]`` and its
+    path must not be deleted by the caller.
+    """
+    if client is None:
+        client = get_http_client()
+
+    if verbose:
+        console.print("[cyan]Fetching latest release information...[/cyan]")
+
+    try:
+        release_data = fetch_latest_release(client, github_token=github_token, timeout=30, debug=debug)
+    except Exception as e:
+        console.print(f"[red]Error fetching release information[/red]")
+        console.print(Panel(str(e), title="Fetch Error", border_style="red"))
+        raise typer.Exit(1)
+
+    asset = find_template_asset(release_data, ai_assistant, script_type)
+
+    if asset is None:
+        pattern = _template_asset_pattern(ai_assistant, script_type)
+        console.print(f"[red]No matching release asset found[/red] for [bold]{ai_assistant}[/bold] (expected pattern: [bold]{pattern}[/bold])")
+        asset_names = [a.get('name', '?') for a in release_data.get("assets", [])]
+        console.print(Panel("\n".join(asset_names) or "(no assets)", title="Available Assets", border_style="yellow"))
+        raise typer.Exit(1)
+
+    download_url = asset["browser_download_url"]
+    filename = asset["name"]
+    file_size = asset["size"]
+
+    if verbose:
+        console.print(f"[cyan]Found template:[/cyan] {filename}")
+        console.print(f"[cyan]Size:[/cyan] {file_size:,} bytes")
+        console.print(f"[cyan]Release:[/cyan] {release_data['tag_name']}")
+
+    cache = TemplateCache() if use_cache else None
+    if cache is not None:
+        try:
+            cached_path = cache.lookup(release_data["tag_name"], filename, _asset_sha256(asset))
+        except OSError:
+            cached_path = None
+        if cached_path is not None:
+            if verbose:
+                console.print(f"[cyan]Using cached template:[/cyan] {cached_path}")
+            metadata = {
+                "filename": filename,
+                "size": file_size,
+                "release": release_data["tag_name"],
+                "asset_url": download_url,
+                "sha256": cached_path.stem,
+                "cached": True,
+            }
+            return cached_path, metadata
+
+    if verbose:
+        console.print(f"[cyan]Downloading template...[/cyan]")
+
+    if download_dir is None:
+        archive = tempfile.SpooledTemporaryFile(max_size=TEMPLATE_SPOOL_MAX_BYTES)
+        try:
+            if on_progress is None and show_progress:
+                with _progress_bar() as progress:
+                    task = progress.add_task("Downloading...", total=file_size or None)
+                    sha256 = stream_release_asset(
+                        client, asset, archive,
+                        on_progress=lambda done, total: progress.update(task, completed=done, total=total or None),
+                        github_token=github_token,
+                        debug=debug,
+                    )
+            else:
+                sha256 = stream_release_asset(client, asset, archive, on_progress=on_progress, github_token=github_token, debug=debug)
+        except Exception as e:
+            archive.close()
+            console.print(f"[red]Error downloading template[/red]")
+            console.print(Panel(str(e), title="Download Error", border_style="red"))
+            raise typer.Exit(1)
+        archive.seek(0)
+        result = archive
+    else:
+        zip_path = download_dir / filename
+        try:
+            sha256 = download_release_asset(client, asset, zip_path, show_progress=show_progress, on_progress=on_progress, github_token=github_token, debug=debug)
+        except Exception as e:
+            console.print(f"[red]Error downloading template[/red]")
+            console.print(Panel(str(e), title="Download Error", border_style="red"))
+            raise typer.Exit(1)
+        result = zip_path
+
+    if verbose:
+        console.print(f"Downloaded: {filename}")
+    metadata = {
+        "filename": filename,
+        "size": file_size,
+        "release": release_data["tag_name"],
+        "asset_url": download_url,
+        "sha256": sha256,
+        "cached": False,
+        "spooled": download_dir is None,
+    }
+    if cache is not None:
+        try:
+            cache.store(release_data["tag_name"], filename, result, sha256=sha256)
+        except OSError as e:
+            # A read-only or full cache must never fail the download itself
+            if debug:
+                console.print(f"[yellow]Could not write template cache:[/yellow] {e}")
+        finally:
+            if download_dir is None:
+                result.seek(0)
+    return result, metadata
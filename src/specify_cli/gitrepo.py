@@ -0,0 +1,420 @@
+"""Git repository bootstrap for freshly initialized projects.
+
+`specify init` turns the extracted template into a repository with a single
+initial commit. GitBackend abstracts how that happens:
+
+* PythonGitBackend writes the repository directly - loose blob and tree
+  objects, the commit, HEAD/branch refs, reflogs and a version 2 index - so no
+  process is spawned and nothing depends on the current working directory.
+* CliGitBackend runs ``git init`` / ``git add .`` / ``git commit`` with
+  ``cwd=`` set to the project (never ``os.chdir``).
+
+The in-process writer only handles what a plain ``git init && git add . &&
+git commit`` would produce for a simple tree. Whenever the environment or the
+tree needs git's own machinery - ignore rules, attributes/filters, line-ending
+conversion, config includes, signing, hooks templates, non-SHA-1 object
+formats, nested repositories, or an author identity it cannot resolve - it
+raises GitFallback and init_repository() hands the job to the git binary.
+
+SPECIFY_GIT_BACKEND selects the backend: ``auto`` (default: in-process with
+fallback), ``python`` (in-process only) or ``cli`` (always the git binary).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import stat
+import struct
+import subprocess
+import time
+import zlib
+from pathlib import Path
+from typing import Optional, Tuple
+
+DEFAULT_BRANCH = "master"
+INITIAL_COMMIT_MESSAGE = "Initial commit from Specify template"
+
+# Environment variables that change where or how git stores the repository
+_UNSUPPORTED_ENV = (
+    "GIT_DIR", "GIT_WORK_TREE", "GIT_INDEX_FILE", "GIT_OBJECT_DIRECTORY", "GIT_TEMPLATE_DIR",
+    "GIT_CONFIG", "GIT_CONFIG_GLOBAL", "GIT_CONFIG_SYSTEM", "GIT_CONFIG_NOSYSTEM", "GIT_CONFIG_COUNT",
+    "GIT_CONFIG_PARAMETERS", "GIT_AUTHOR_DATE", "GIT_COMMITTER_DATE", "GIT_DEFAULT_HASH",
+)
+
+# Files in the tree whose semantics only git itself implements
+_UNSUPPORTED_FILES = (".gitignore", ".gitattributes", ".gitmodules")
+
+
+class GitFallback(Exception):
+    """The in-process backend cannot reproduce git's behaviour here; use the git binary."""
+
+
+class GitBackend:
+    """How a project is checked for, and turned into, a git repository."""
+
+    name = "abstract"
+
+    def is_repo(self, path: Path) -> bool:
+        raise NotImplementedError
+
+    def init_repo(self, path: Path, message: str = INITIAL_COMMIT_MESSAGE) -> None:
+        """Create a repository in ``path`` with one commit of the whole tree.
+
+        Raises subprocess.CalledProcessError or OSError on failure.
+        """
+        raise NotImplementedError
+
+
+class CliGitBackend(GitBackend):
+    """Drive the git binary, always with an explicit working directory."""
+
+    name = "git"
+
+    def is_repo(self, path: Path) -> bool:
+        try:
+            subprocess.run(
+                ["git", "rev-parse", "--is-inside-work-tree"],
+                check=True,
+                capture_output=True,
+                cwd=path,
+            )
+            return True
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return False
+
+    def init_repo(self, path: Path, message: str = INITIAL_COMMIT_MESSAGE) -> None:
+        for cmd in (["git", "init"], ["git", "add", "."], ["git", "commit", "-m", message]):
+            subprocess.run(cmd, check=True, capture_output=True, text=True, cwd=path)
+
+
+def _parse_git_config(path: Path) -> dict[str, str]:
+    """Parse a git config file into ``{"section.key": value}`` (lower-cased names).
+
+    Subsection headers (``[section "sub"]``) become ``section.sub.key``. Only
+    the subset of the format needed to read identity and behaviour switches is
+    supported; include directives are reported as ``include.*`` keys.
+    """
+    values: dict[str, str] = {}
+    try:
+        text = path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return values
+    section = ""
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line.startswith("["):
+            header = line[1:line.index("]")] if "]" in line else line[1:]
+            if '"' in header:
+                name, _, sub = header.partition('"')
+                section = name.strip().lower() + "." + sub.rstrip('"')
+            else:
+                section = header.strip().lower()
+            line = line[line.index("]") + 1:].strip() if "]" in line else ""
+            if not line:
+                continue
+        key, sep, value = line.partition("=")
+        key = key.strip().lower()
+        value = value.strip() if sep else "true"
+        # Drop trailing comments outside quotes, then unquote
+        out, quoted = [], False
+        for ch in value:
+            if ch == '"':
+                quoted = not quoted
+                continue
+            if ch in "#;" and not quoted:
+                break
+            out.append(ch)
+        values[f"{section}.{key}"] = "".join(out).strip()
+    return values
+
+
+def _global_config_paths() -> list[Path]:
+    home = Path.home()
+    xdg = os.environ.get("XDG_CONFIG_HOME") or str(home / ".config")
+    paths = [Path(xdg) / "git" / "config", home / ".gitconfig"]
+    if os.name != "nt":
+        paths.insert(0, Path("/etc/gitconfig"))
+    return paths
+
+
+def _load_git_config() -> dict[str, str]:
+    """Merge system, XDG and global config in git's precedence order (later wins)."""
+    merged: dict[str, str] = {}
+    for path in _global_config_paths():
+        merged.update(_parse_git_config(path))
+    return merged
+
+
+def _is_true(value: str | None) -> bool:
+    return (value or "").lower() in ("true", "yes", "on", "1")
+
+
+class PythonGitBackend(GitBackend):
+    """Write the initial repository objects, refs and index directly."""
+
+    name = "in-process"
+
+    def is_repo(self, path: Path) -> bool:
+        """True if ``path`` is inside a git work tree (looks for ``.git`` upwards)."""
+        if os.environ.get("GIT_DIR"):
+            return CliGitBackend().is_repo(path)
+        path = Path(path).resolve()
+        if not path.is_dir():
+            return False
+        if ".git" in path.parts:
+            return False  # inside a git directory, not a work tree
+        for candidate in (path, *path.parents):
+            dot_git = candidate / ".git"
+            if dot_git.is_dir() and (dot_git / "HEAD").is_file():
+                return True
+            if dot_git.is_file():
+                try:
+                    return dot_git.read_text(encoding="utf-8").startswith("gitdir:")
+                except OSError:
+                    return False
+        return False
+
+    # -- preflight ---------------------------------------------------------
+
+    def _config(self) -> dict[str, str]:
+        for name in _UNSUPPORTED_ENV:
+            if os.environ.get(name):
+                raise GitFallback(f"{name} is set")
+        config = _load_git_config()
+        if any(key.startswith(("include.", "includeif.")) for key in config):
+            raise GitFallback("git config uses include directives")
+        if config.get("init.templatedir") or config.get("core.hookspath"):
+            raise GitFallback("custom init template or hooks path configured")
+        if _is_true(config.get("commit.gpgsign")):
+            raise GitFallback("commit signing is enabled")
+        if (config.get("core.autocrlf") or "false").lower() not in ("false", "0", "no", "off"):
+            raise GitFallback("core.autocrlf is enabled")
+        if config.get("core.excludesfile"):
+            raise GitFallback("global excludes file configured")
+        if (config.get("init.defaultobjectformat") or "sha1").lower() != "sha1":
+            raise GitFallback("non-SHA-1 object format configured")
+        xdg = os.environ.get("XDG_CONFIG_HOME") or str(Path.home() / ".config")
+        if (Path(xdg) / "git" / "ignore").exists() or (Path(xdg) / "git" / "attributes").exists():
+            raise GitFallback("global ignore or attributes file present")
+        return config
+
+    def _identity(self, config: dict[str, str], role: str) -> str:
+        name = os.environ.get(f"GIT_{role}_NAME") or config.get("user.name")
+        email = os.environ.get(f"GIT_{role}_EMAIL") or config.get("user.email") or os.environ.get("EMAIL")
+        if not name or not email:
+            raise GitFallback("no user.name/user.email configured")
+        return f"{name} <{email}>"
+
+    # -- object writing ----------------------------------------------------
+
+    @staticmethod
+    def _write_object(git_dir: Path, kind: str, data: bytes) -> bytes:
+        payload = f"{kind} {len(data)}".encode() + b"\0" + data
+        digest = hashlib.sha1(payload).digest()
+        hex_digest = digest.hex()
+        target = git_dir / "objects" / hex_digest[:2] / hex_digest[2:]
+        if not target.exists():
+            target.parent.mkdir(exist_ok=True)
+            target.write_bytes(zlib.compress(payload, 1))
+            os.chmod(target, 0o444)
+        return digest
+
+    def _snapshot(self, root: Path, git_dir: Path, filemode: bool) -> Tuple[bytes, list]:
+        """Store every file under ``root`` as blobs; return (root tree id, index entries)."""
+        index_entries = []
+
+        def walk(directory: Path, prefix: str) -> bytes | None:
+            tree_entries = []
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+            for entry in entries:
+                if entry.name == ".git" and directory == root:
+                    continue
+                if entry.name in _UNSUPPORTED_FILES:
+                    raise GitFallback(f"{prefix}{entry.name} present")
+                rel = f"{prefix}{entry.name}"
+                st = entry.stat(follow_symlinks=False)
+                if stat.S_ISLNK(st.st_mode):
+                    data = os.fsencode(os.readlink(entry.path))
+                    mode = 0o120000
+                elif stat.S_ISDIR(st.st_mode):
+                    if os.path.exists(os.path.join(entry.path, ".git")):
+                        raise GitFallback(f"nested repository at {rel}")
+                    subtree = walk(Path(entry.path), rel + "/")
+                    if subtree is not None:  # git does not record empty directories
+                        tree_entries.append((entry.name + "/", b"40000", entry.name, subtree))
+                    continue
+                elif stat.S_ISREG(st.st_mode):
+                    with open(entry.path, "rb") as f:
+                        data = f.read()
+                    mode = 0o100755 if filemode and st.st_mode & stat.S_IXUSR else 0o100644
+                else:
+                    continue  # sockets, FIFOs and devices are not tracked
+                blob = self._write_object(git_dir, "blob", data)
+                tree_entries.append((entry.name, f"{mode:o}".encode(), entry.name, blob))
+                index_entries.append((os.fsencode(rel), st, mode, blob))
+            if not tree_entries:
+                return None
+            # Trees sort directory names as if they ended in "/"
+            tree_entries.sort(key=lambda e: os.fsencode(e[0]))
+            body = b"".join(mode + b" " + os.fsencode(name) + b"\0" + sha for _, mode, name, sha in tree_entries)
+            return self._write_object(git_dir, "tree", body)
+
+        tree = walk(root, "")
+        if tree is None:
+            tree = self._write_object(git_dir, "tree", b"")
+        return tree, index_entries
+
+    @staticmethod
+    def _write_index(git_dir: Path, entries: list) -> None:
+        """Write a version 2 index so the new work tree shows as clean."""
+        body = [b"DIRC", struct.pack(">LL", 2, len(entries))]
+        mask = 0xFFFFFFFF
+        for path, st, mode, sha in sorted(entries, key=lambda e: e[0]):
+            fields = struct.pack(
+                ">LLLLLLLLLL",
+                int(st.st_ctime) & mask, (getattr(st, "st_ctime_ns", 0) % 1_000_000_000) & mask,
+                int(st.st_mtime) & mask, (getattr(st, "st_mtime_ns", 0) % 1_000_000_000) & mask,
+                st.st_dev & mask, st.st_ino & mask, mode,
+                getattr(st, "st_uid", 0) & mask, getattr(st, "st_gid", 0) & mask, st.st_size & mask,
+            )
+            flags = struct.pack(">H", min(len(path), 0xFFF))
+            entry = fields + sha + flags + path
+            entry += b"\0" * (8 - (len(entry) % 8))
+            body.append(entry)
+        data = b"".join(body)
+        (git_dir / "index").write_bytes(data + hashlib.sha1(data).digest())
+
+    def init_repo(self, path: Path, message: str = INITIAL_COMMIT_MESSAGE) -> None:
+        root = Path(path)
+        config = self._config()
+        author = self._identity(config, "AUTHOR")
+        committer = self._identity(config, "COMMITTER")
+        branch = config.get("init.defaultbranch") or DEFAULT_BRANCH
+        filemode = os.name != "nt"
+
+        git_dir = root / ".git"
+        if git_dir.exists():
+            raise GitFallback(".git already exists")
+        try:
+            for sub in ("objects/info", "objects/pack", "refs/heads", "refs/tags", "info", "hooks"):
+                (git_dir / sub).mkdir(parents=True, exist_ok=True)
+            (git_dir / "description").write_text("Unnamed repository; edit this file 'description' to name the repository.\n")
+            (git_dir / "info" / "exclude").write_text(
+                "# git ls-files --others --exclude-from=.git/info/exclude\n"
+                "# Lines that start with '#' are comments.\n"
+                "# For a project mostly in C, the following would be a good set of\n"
+                "# exclude patterns (uncomment them if you want to use them):\n"
+                "# *.[oa]\n"
+                "# *~\n"
+            )
+            (git_dir / "config").write_text(
+                "[core]\n"
+                "\trepositoryformatversion = 0\n"
+                f"\tfilemode = {'true' if filemode else 'false'}\n"
+                "\tbare = false\n"
+                "\tlogallrefupdates = true\n"
+                + ("" if filemode else "\tsymlinks = false\n\tignorecase = true\n")
+            )
+
+            tree, index_entries = self._snapshot(root, git_dir, filemode)
+
+            now = int(time.time())
+            offset = time.localtime(now).tm_gmtoff
+            tz = f"{'+' if offset >= 0 else '-'}{abs(offset) // 3600:02d}{abs(offset) % 3600 // 60:02d}"
+            commit_body = (
+                f"tree {tree.hex()}\n"
+                f"author {author} {now} {tz}\n"
+                f"committer {committer} {now} {tz}\n"
+                f"\n{message}\n"
+            ).encode("utf-8")
+            commit = self._write_object(git_dir, "commit", commit_body).hex()
+
+            reflog = f"{'0' * 40} {commit} {committer} {now} {tz}\tcommit (initial): {message.splitlines()[0]}\n"
+            for ref_file, content in (
+                (git_dir / "refs" / "heads" / branch, commit + "\n"),
+                (git_dir / "HEAD", f"ref: refs/heads/{branch}\n"),
+                (git_dir / "logs" / "HEAD", reflog),
+                (git_dir / "logs" / "refs" / "heads" / branch, reflog),
+            ):
+                ref_file.parent.mkdir(parents=True, exist_ok=True)
+                ref_file.write_text(content, encoding="utf-8")
+            self._write_index(git_dir, index_entries)
+        except BaseException:
+            _remove_tree(git_dir)
+            raise
+
+
+def _remove_tree(path: Path) -> None:
+    """Remove a partially written .git directory (objects are read-only)."""
+    import shutil
+
+    def make_writable(func, target, _exc):
+        os.chmod(target, stat.S_IWRITE)
+        func(target)
+
+    if path.exists():
+        shutil.rmtree(path, onerror=make_writable)
+
+
+def get_git_backend() -> GitBackend:
+    """Return the backend selected by SPECIFY_GIT_BACKEND (``auto``/``python`` -> in-process, ``cli`` -> git binary)."""
+    choice = (os.environ.get("SPECIFY_GIT_BACKEND") or "auto").strip().lower()
+    if choice == "cli":
+        return CliGitBackend()
+    return PythonGitBackend()
+
+
+def init_repository(path: Path, message: str = INITIAL_COMMIT_MESSAGE) -> Tuple[str, Optional[str]]:
+    """Initialize ``path`` as a repository with one commit; return (backend name, fallback reason).
+
+    Uses the in-process backend when possible and the git binary otherwise
+    (unless SPECIFY_GIT_BACKEND=python). Raises subprocess.CalledProcessError
+    or OSError on failure.
+    """
+    backend = get_git_backend()
+    if isinstance(backend, PythonGitBackend):
+        try:
+            backend.init_repo(path, message)
+            return backend.name, None
+        except GitFallback as e:
+            if (os.environ.get("SPECIFY_GIT_BACKEND") or "").strip().lower() == "python":
+                raise OSError(f"in-process git backend cannot initialize this repository: {e}") from e
+            reason = str(e)
+        backend = CliGitBackend()
+    else:
+        reason = None
+    backend.init_repo(path, message)
+    return backend.name, reason
+
+
+def head_branch(work_tree: Path) -> Optional[str]:
+    """Return what ``git rev-parse --abbrev-ref HEAD`` prints for ``work_tree``, read without spawning git.
+
+    ``work_tree`` must be the top level (the directory holding ``.git``, which
+    may be a ``gitdir:`` file as in worktrees and submodules). A detached HEAD
+    gives ``"HEAD"``. Returns None whenever the answer needs git itself
+    (GIT_DIR set, unreadable or unusual HEAD); callers then run git.
+    """
+    if os.environ.get("GIT_DIR"):
+        return None
+    dot_git = Path(work_tree) / ".git"
+    try:
+        if dot_git.is_file():
+            pointer = dot_git.read_text(encoding="utf-8").strip()
+            if not pointer.startswith("gitdir:"):
+                return None
+            dot_git = (dot_git.parent / pointer[len("gitdir:"):].strip()).resolve()
+        head = (dot_git / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if head == "ref: refs/heads/.invalid":
+        return None  # reftable repositories keep the real HEAD elsewhere
+    if head.startswith("ref: refs/heads/"):
+        return head[len("ref: refs/heads/"):] or None
+    if len(head) in (40, 64) and all(c in "0123456789abcdef" for c in head):
+        return "HEAD"
+    return None
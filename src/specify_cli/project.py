@@ -0,0 +1,425 @@
+"""Project scaffolding: greenfield docs, instructions and project context files.
+
+The scaffold documents ship as package data under ``specify_cli/scaffold`` and
+are read on demand with :mod:`importlib.resources`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from importlib import resources
+from pathlib import Path
+
+from .projectcontext import load_cache_entry, stat_key, store_cache_entry, write_text_atomic
+from .ui import StepTracker, console
+from .yamldoc import format_entry
+
+# Project type descriptions for AI reference file
+PROJECT_TYPE_DESCRIPTIONS = {
+    "greenfield": (
+        "This is a **new project** with no existing codebase. You have full design freedom "
+        "and can establish patterns, architecture, and conventions from scratch."
+    ),
+    "brownfield": (
+        "This is an **existing system** with active users and legacy code. Changes must "
+        "consider backward compatibility, existing behavior, and migration paths. "
+        "Regressions are a primary risk."
+    ),
+    "bluefield": (
+        "This is a **hybrid project**—new components being added to an existing platform. "
+        "New code should be isolated where possible, but must integrate with existing "
+        "services and respect platform conventions."
+    ),
+}
+
+# Development implications by project type
+PROJECT_TYPE_IMPLICATIONS = {
+    "greenfield": """
+### When Specifying Features
+- Focus on clean architecture and best practices
+- Establish patterns that will scale
+- No legacy compatibility concerns
+
+### When Planning Implementation
+- Choose optimal technical approaches freely
+- Set up proper testing infrastructure from the start
+- Establish coding standards and conventions
+
+### When Implementing
+- Write clean, well-documented code
+- Build comprehensive test coverage
+- Create proper abstractions from day one
+""",
+    "brownfield": """
+### When Specifying Features
+- **ALWAYS ASK**: What existing behavior must remain unchanged?
+- **ALWAYS ASK**: Are there known bugs or quirks users depend on?
+- **ALWAYS ASK**: What technical debt affects this area?
+- Include backward compatibility requirements in acceptance criteria
+- Document migration/rollback considerations
+
+### When Planning Implementation
+- Identify all touchpoints with existing code
+- Plan for feature flags to enable gradual rollout
+- Include rollback procedures for each major change
+- Consider database migration strategies
+
+### When Implementing
+- Implement behind **feature flags** when touching existing behavior
+- Add **regression tests** before modifying existing code
+- Document **breaking changes** prominently
+- Preserve existing APIs unless explicitly changing them
+- Test with production-like data
+
+### When Reviewing
+- Verify backward compatibility
+- Check for unintended side effects
+- Validate migration scripts
+- Confirm rollback procedures work
+""",
+    "bluefield": """
+### When Specifying Features
+- **ALWAYS ASK**: Which components are new vs existing?
+- **ALWAYS ASK**: What shared services will this integrate with?
+- **ALWAYS ASK**: What platform standards must be followed?
+- Define clear integration boundaries
+- Document dependencies on existing services
+
+### When Planning Implementation
+- Use adapter patterns to isolate new code from legacy
+- Plan integration testing with existing services
+- Identify shared dependencies and versioning concerns
+- Consider deployment coordination with existing components
+
+### When Implementing
+- Respect existing platform conventions
+- Use dependency injection for existing service integration
+- Write contract tests for integration points
+- Keep new components loosely coupled
+- Test boundary conditions between new and existing
+
+### When Reviewing
+- Verify integration contracts are honored
+- Check isolation boundaries are maintained
+- Validate platform standards compliance
+""",
+}
+
+# Context-specific guidance and checklists
+CONTEXT_GUIDANCE = {
+    "greenfield": """
+### Questions to Consider
+- What patterns will best serve this project long-term?
+- What testing strategy fits the project scope?
+- What conventions should be established now?
+
+### Red Flags to Watch For
+- Over-engineering for hypothetical future needs
+- Skipping tests "because it's new code"
+- Inconsistent patterns across components
+""",
+    "brownfield": """
+### Questions to Always Ask
+1. What existing behavior depends on this code?
+2. Who are the current users and how do they use it?
+3. What would break if this change goes wrong?
+4. How do we rollback if needed?
+5. Is there technical debt we should address or avoid?
+
+### Red Flags to Watch For
+- Changes without regression tests
+- Assumptions about "unused" code
+- Breaking API changes without migration paths
+- Skipping feature flags for risky changes
+- "Big bang" releases instead of incremental rollout
+
+### Before Every Change
+- [ ] Identified all callers/consumers of modified code
+- [ ] Added regression tests for existing behavior
+- [ ] Documented rollback procedure
+- [ ] Considered feature flag for gradual rollout
+""",
+    "bluefield": """
+### Questions to Always Ask
+1. Is this component truly new, or does it touch existing code?
+2. What existing services does this integrate with?
+3. Are there platform standards that apply?
+4. How will this be deployed alongside existing components?
+
+### Red Flags to Watch For
+- Tight coupling between new and existing components
+- Ignoring platform conventions "because it's new"
+- Missing contract tests for integrations
+- Deployment plans that don't consider existing services
+
+### Before Every Integration
+- [ ] Contract tests written for integration points
+- [ ] Adapter pattern used for legacy integration
+- [ ] Deployment coordination planned
+- [ ] Rollback won't affect existing components
+""",
+}
+
+# Description prompt hints by project type
+DESCRIPTION_HINTS = {
+    "greenfield": (
+        "[dim]Examples:[/dim]\n"
+        "  • E-commerce platform with React frontend and Node.js API\n"
+        "  • Mobile app for fitness tracking with cloud sync\n"
+        "  • Internal tool for managing customer support tickets"
+    ),
+    "brownfield": (
+        "[dim]Examples:[/dim]\n"
+        "  • Legacy billing system migrating from monolith to microservices\n"
+        "  • Adding new features to 10-year-old Java ERP system\n"
+        "  • Modernizing PHP application with React components\n"
+        "\n"
+        "[dim]Consider mentioning:[/dim]\n"
+        "  • Key integrations (SAP, Salesforce, legacy databases)\n"
+        "  • Known constraints (APIs that can't change, frozen schemas)\n"
+        "  • Technical debt areas"
+    ),
+    "bluefield": (
+        "[dim]Examples:[/dim]\n"
+        "  • New analytics module for existing SaaS platform\n"
+        "  • Adding mobile app to existing web application\n"
+        "  • Building new microservice within existing Kubernetes cluster\n"
+        "\n"
+        "[dim]Consider mentioning:[/dim]\n"
+        "  • Which parts are new vs existing\n"
+        "  • Shared services you'll integrate with\n"
+        "  • Platform constraints or standards"
+    ),
+}
+
+# Scaffold documents ship in specify_cli/scaffold; *.tmpl files are str.format templates
+
+def read_scaffold(name: str) -> str:
+    """Return the text of a scaffold document shipped as package data."""
+    return resources.files(__package__).joinpath("scaffold", name).read_text(encoding="utf-8")
+
+def executable_mode(mode: int) -> int:
+    """Return ``mode`` with execute bits added wherever read is set (always for the owner)."""
+    new_mode = mode
+    if mode & 0o400: new_mode |= 0o100
+    if mode & 0o040: new_mode |= 0o010
+    if mode & 0o004: new_mode |= 0o001
+    return new_mode | 0o100
+
+def is_template_script(parts: list[str] | tuple[str, ...]) -> bool:
+    """True for project-relative path parts under .specify/scripts ending in .sh."""
+    return len(parts) > 2 and parts[0] == ".specify" and parts[1] == "scripts" and parts[-1].endswith(".sh")
+
+def ensure_executable_scripts(project_path: Path, tracker: StepTracker | None = None, *, verify: bool = False) -> None:
+    """Ensure POSIX .sh scripts under .specify/scripts (recursively) have execute bits (no-op on Windows).
+
+    Template zips get their permissions while being extracted (see
+    archive.extract_template_zip), so this walk is only needed for unpacked
+    template directories, or as a check (``verify``, reported on the
+    ``chmod-verify`` tracker key) that extraction left nothing to fix.
+    """
+    if os.name == "nt":
+        return  # Windows: skip silently
+    scripts_root = project_path / ".specify" / "scripts"
+    if not scripts_root.is_dir():
+        return
+    key, label = ("chmod-verify", "Verify script permissions") if verify else ("chmod", "Set script permissions recursively")
+    failures: list[str] = []
+    updated = 0
+    if tracker:
+        tracker.add(key, label)
+        tracker.start(key)
+    for script in scripts_root.rglob("*.sh"):
+        try:
+            if script.is_symlink() or not script.is_file():
+                continue
+            try:
+                with script.open("rb") as f:
+                    if f.read(2) != b"#!":
+                        continue
+            except Exception:
+                continue
+            mode = script.stat().st_mode
+            if mode & 0o111:
+                continue
+            os.chmod(script, executable_mode(mode))
+            updated += 1
+        except Exception as e:
+            failures.append(f"{script.relative_to(scripts_root)}: {e}")
+    if tracker:
+        detail = f"{updated} {'fixed' if verify else 'updated'}" + (f", {len(failures)} failed" if failures else "")
+        (tracker.error if failures else tracker.complete)(key, detail, files=updated)
+    else:
+        if updated:
+            console.print(f"[cyan]Updated execute permissions on {updated} script(s) recursively[/cyan]")
+        if failures:
+            console.print("[yellow]Some scripts could not be updated:[/yellow]")
+            for f in failures:
+                console.print(f"  - {f}")
+
+
+def create_greenfield_scaffolding(project_path: Path, tracker: StepTracker | None = None) -> None:
+    """Create docs/ folder with greenfield scaffolding templates."""
+    docs_dir = project_path / "docs"
+    docs_dir.mkdir(parents=True, exist_ok=True)
+    
+    for filename in ("architecture.md", "roadmap.md", "ideas.md"):
+        dest = docs_dir / filename
+        if not dest.exists():
+            dest.write_text(read_scaffold(filename))
+    
+    if tracker:
+        tracker.add("scaffolding", "Create greenfield scaffolding")
+        tracker.complete("scaffolding", "docs/")
+
+
+def create_instructions_file(project_path: Path, tracker: StepTracker | None = None) -> None:
+    """Create instructions.md in project root."""
+    dest = project_path / "instructions.md"
+    
+    if not dest.exists():
+        dest.write_text(read_scaffold("instructions.md"))
+    
+    if tracker:
+        tracker.add("instructions", "Create instructions.md")
+        tracker.complete("instructions", "created")
+
+
+# Record of the inputs hash and output stat of the last memory/context.md generation
+CONTEXT_REFERENCE_CACHE_NAME = "context-reference.json"
+
+
+def _context_reference_inputs(project_type: str, description: str, constraints: list, linked_artifacts: dict, timestamp: str, version: int) -> dict:
+    """Everything memory/context.md is rendered from: context.yaml fields plus the template and type tables."""
+    return {
+        "template": read_scaffold("context-reference.md.tmpl"),
+        "project_type": project_type,
+        "project_type_description": PROJECT_TYPE_DESCRIPTIONS.get(project_type, "Unknown project type."),
+        "implications": PROJECT_TYPE_IMPLICATIONS.get(project_type, ""),
+        "guidance": CONTEXT_GUIDANCE.get(project_type, ""),
+        "description": description,
+        "constraints": list(constraints or []),
+        "linked_artifacts": {category: list(items) for category, items in (linked_artifacts or {}).items()},
+        "timestamp": timestamp,
+        "version": version,
+    }
+
+
+def _render_context_reference(inputs: dict) -> str:
+    # Format constraints section
+    if inputs["constraints"]:
+        constraints_section = "\n".join(f"- {c}" for c in inputs["constraints"])
+    else:
+        constraints_section = "_No constraints defined. Add via `specify context --add-constraint`._"
+    
+    # Format artifacts section
+    artifacts_lines = []
+    for category, items in inputs["linked_artifacts"].items():
+        if items:
+            artifacts_lines.append(f"### {category.title()}")
+            for item in items:
+                artifacts_lines.append(f"- {item}")
+    artifacts_section = "\n".join(artifacts_lines) if artifacts_lines else "_No linked artifacts. Edit `.specify/context.yaml` to add._"
+    
+    return inputs["template"].format(
+        project_type_upper=inputs["project_type"].upper(),
+        project_type_description=inputs["project_type_description"],
+        description=inputs["description"] if inputs["description"] else "_No description provided._",
+        development_implications=inputs["implications"],
+        constraints_section=constraints_section,
+        artifacts_section=artifacts_section,
+        guidance_section=inputs["guidance"],
+        timestamp=inputs["timestamp"],
+        version=inputs["version"],
+    )
+
+
+def generate_context_reference(
+    project_path: Path,
+    project_type: str,
+    description: str,
+    constraints: list,
+    linked_artifacts: dict,
+    timestamp: str,
+    version: int = 1,
+    *,
+    check: bool = False,
+    record: bool = True,
+) -> bool:
+    """Generate memory/context.md for AI agent reference.
+
+    The inputs (context fields, template, type description, implications and
+    guidance) are hashed. When the hash and the output file's size and mtime
+    match the record in .specify/cache/context-reference.json, nothing is
+    rendered or read. Otherwise the file is rendered and replaced atomically,
+    and only if its content differs.
+
+    Returns True if the file was stale (and, unless ``check`` is set,
+    rewritten). ``check`` never writes anything. ``record=False`` skips the
+    cache record (used while a project is being created).
+    """
+    inputs = _context_reference_inputs(project_type, description, constraints, linked_artifacts, timestamp, version)
+    inputs_hash = hashlib.sha256(json.dumps(inputs, sort_keys=True).encode("utf-8")).hexdigest()
+    context_md = project_path / "memory" / "context.md"
+    try:
+        output_key = stat_key(context_md)
+    except FileNotFoundError:
+        output_key = None
+    stored = load_cache_entry(project_path, CONTEXT_REFERENCE_CACHE_NAME)
+    if output_key and stored and stored.get("inputs") == inputs_hash and stored.get("output") == output_key:
+        return False
+
+    content = _render_context_reference(inputs)
+    stale = True
+    if output_key:
+        try:
+            stale = context_md.read_text(encoding="utf-8") != content
+        except (OSError, UnicodeDecodeError):
+            pass
+    if check:
+        return stale
+    if stale:
+        context_md.parent.mkdir(parents=True, exist_ok=True)
+        write_text_atomic(context_md, content)
+    if record:
+        store_cache_entry(project_path, CONTEXT_REFERENCE_CACHE_NAME, {"inputs": inputs_hash, "output": stat_key(context_md)})
+    return stale
+
+
+def create_project_context(project_path: Path, project_type: str, description: str = "", tracker: StepTracker | None = None) -> None:
+    """Create .specify/context.yaml and memory/context.md with project context metadata."""
+    context_dir = project_path / ".specify"
+    context_dir.mkdir(parents=True, exist_ok=True)
+    context_file = context_dir / "context.yaml"
+    
+    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    
+    # Render the value part of "description: ..." (quoted or a block scalar as needed)
+    description_yaml = "\n".join(format_entry("description", description))[len("description: "):]
+    
+    context_content = read_scaffold("context.yaml.tmpl").format(
+        project_type=project_type,
+        description_yaml=description_yaml,
+        now=now,
+    )
+    
+    context_file.write_text(context_content)
+    
+    # Generate AI-readable reference file
+    generate_context_reference(
+        project_path=project_path,
+        project_type=project_type,
+        description=description,
+        constraints=[],
+        linked_artifacts={},
+        timestamp=now,
+        version=1,
+        record=False,
+    )
+    
+    if tracker:
+        tracker.add("context", "Create project context")
+        tracker.complete("context", project_type)
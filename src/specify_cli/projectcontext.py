@@ -0,0 +1,246 @@
+"""Project context stored in `.specify/context.yaml`, read through a compiled cache.
+
+``load_context`` returns the context as a plain dict with every field of
+CONTEXT_DEFAULTS present. The parsed result is kept in
+``.specify/cache/context.json`` together with the size and mtime of
+context.yaml, so repeated reads (the CLI, agent tooling) skip YAML parsing
+until the file changes. The cache directory ignores itself for git.
+
+Edits go through ``read_context_document``/``write_context``: the returned
+YamlDocument applies any number of field changes in one pass and keeps the
+file's comments and layout. ``plan_context_edit`` turns a batch of edit
+operations (CLI flags or a JSON patch) into those field changes, validating
+all of them before anything is written. Files are replaced atomically.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from .config import PROJECT_TYPE_CHOICES
+from .errors import ConfigurationError
+from .yamldoc import YamlDocument
+
+CONTEXT_FILE = Path(".specify") / "context.yaml"
+# Per-project cache directory; it carries a .gitignore so it is never committed
+PROJECT_CACHE_DIR = Path(".specify") / "cache"
+CONTEXT_CACHE_NAME = "context.json"
+# Bump when the cached layout or normalization changes
+CONTEXT_CACHE_FORMAT = 1
+
+CONTEXT_DEFAULTS = {
+    "project_type": "",
+    "description": "",
+    "constraints": [],
+    "linked_artifacts": {},
+    "created": "",
+    "updated": "",
+    "version": 1,
+}
+
+# Operations accepted by plan_context_edit (and `specify context --patch`)
+CONTEXT_PATCH_KEYS = ("project_type", "description", "constraints", "remove_constraints", "add_constraints", "linked_artifacts")
+
+
+def context_path(project_path: Path) -> Path:
+    return project_path / CONTEXT_FILE
+
+
+def normalize_context(data: Any) -> dict:
+    """Return ``data`` with every CONTEXT_DEFAULTS field present and of the expected type.
+
+    Unknown keys are kept as they are.
+    """
+    context = dict(data) if isinstance(data, dict) else {}
+    for key in ("project_type", "description", "created", "updated"):
+        value = context.get(key)
+        context[key] = "" if value is None else str(value)
+    constraints = context.get("constraints")
+    if isinstance(constraints, str):
+        constraints = [constraints]
+    context["constraints"] = [str(item) for item in constraints or [] if item is not None]
+    artifacts = context.get("linked_artifacts")
+    context["linked_artifacts"] = {
+        str(category): [str(item) for item in (items if isinstance(items, list) else [items]) if item is not None]
+        for category, items in (artifacts.items() if isinstance(artifacts, dict) else [])
+        if items is not None
+    }
+    try:
+        context["version"] = int(context.get("version") or 1)
+    except (TypeError, ValueError):
+        context["version"] = 1
+    return context
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    """Replace ``path`` with ``text`` via a temporary file and rename, keeping its permissions.
+
+    A file that does not exist yet is written directly so it gets the usual
+    umask-derived mode; there is no previous content a reader could see torn.
+    """
+    try:
+        mode = path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        path.write_text(text, encoding="utf-8")
+        return
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def stat_key(path: Path) -> list[int]:
+    """Return the ``[size, mtime_ns]`` pair cache entries use to detect a changed file."""
+    stat = path.stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def load_cache_entry(project_path: Path, name: str) -> dict | None:
+    """Return the JSON object stored as ``.specify/cache/<name>``, or None if missing or unreadable."""
+    try:
+        with open(project_path / PROJECT_CACHE_DIR / name, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def store_cache_entry(project_path: Path, name: str, entry: dict) -> None:
+    """Atomically write ``entry`` as ``.specify/cache/<name>``; failures are ignored."""
+    store_cache_text(project_path, name, json.dumps(entry))
+
+
+def store_cache_text(project_path: Path, name: str, text: str) -> None:
+    """Atomically write ``text`` as ``.specify/cache/<name>``; failures are ignored."""
+    cache_dir = project_path / PROJECT_CACHE_DIR
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        ignore = cache_dir / ".gitignore"
+        if not ignore.exists():
+            ignore.write_text("# Created by Specify; local caches are not meant to be committed\n*\n")
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, prefix=f".{name}-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp, cache_dir / name)
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+    except OSError:
+        pass  # Caching is best-effort (read-only checkouts still work)
+
+
+def _load_cached_context(project_path: Path, key: list[int]) -> dict | None:
+    entry = load_cache_entry(project_path, CONTEXT_CACHE_NAME)
+    if not entry or entry.get("format") != CONTEXT_CACHE_FORMAT or entry.get("key") != key:
+        return None
+    context = entry.get("context")
+    return context if isinstance(context, dict) else None
+
+
+def _store_cached_context(project_path: Path, key: list[int], context: dict) -> None:
+    store_cache_entry(project_path, CONTEXT_CACHE_NAME, {"format": CONTEXT_CACHE_FORMAT, "key": key, "context": context})
+
+
+def load_context(project_path: Path, *, use_cache: bool = True) -> dict:
+    """Return the normalized project context of ``project_path``.
+
+    Raises FileNotFoundError when there is no context.yaml and YamlError when
+    it cannot be parsed.
+    """
+    path = context_path(project_path)
+    key = stat_key(path)
+    if use_cache:
+        cached = _load_cached_context(project_path, key)
+        if cached is not None:
+            return cached
+    context = normalize_context(YamlDocument(path.read_text(encoding="utf-8")).data)
+    # Re-stat so a write that raced with the read is not cached under the new key
+    if use_cache and stat_key(path) == key:
+        _store_cached_context(project_path, key, context)
+    return context
+
+
+def read_context_document(project_path: Path) -> YamlDocument:
+    """Parse context.yaml for editing (always from the file, never the cache)."""
+    return YamlDocument(context_path(project_path).read_text(encoding="utf-8"))
+
+
+def write_context(project_path: Path, document: YamlDocument) -> dict:
+    """Write ``document`` to context.yaml, refresh the cache and return the normalized context."""
+    path = context_path(project_path)
+    write_text_atomic(path, document.dumps())
+    context = normalize_context(document.data)
+    _store_cached_context(project_path, stat_key(path), context)
+    return context
+
+
+def _string_list(value: Any, field: str) -> list[str]:
+    if isinstance(value, str):
+        return [value]
+    if not isinstance(value, list) or not all(isinstance(item, (str, int)) for item in value):
+        raise ConfigurationError(f"'{field}' must be a string or a list of strings")
+    return [str(item) for item in value]
+
+
+def plan_context_edit(current: dict, patch: dict) -> dict:
+    """Apply the edit operations in ``patch`` to ``current`` in memory.
+
+    ``patch`` may hold any of CONTEXT_PATCH_KEYS. They apply in that order:
+    ``constraints`` replaces the list, ``remove_constraints`` removes entries
+    by 1-based index or exact text (all resolved against the list before any
+    removal), and ``add_constraints`` appends entries not already present.
+    Returns only the fields whose value changes, so an empty dict means the
+    edit is a no-op. Raises ConfigurationError, before anything is changed,
+    if any operation is invalid.
+    """
+    unknown = set(patch) - set(CONTEXT_PATCH_KEYS)
+    if unknown:
+        raise ConfigurationError(f"unknown context edit(s): {', '.join(sorted(unknown))}")
+    updated = {key: current.get(key) for key in ("project_type", "description", "constraints", "linked_artifacts")}
+
+    if patch.get("project_type") is not None:
+        if patch["project_type"] not in PROJECT_TYPE_CHOICES:
+            raise ConfigurationError(f"invalid project type '{patch['project_type']}' (choose from: {', '.join(PROJECT_TYPE_CHOICES)})")
+        updated["project_type"] = patch["project_type"]
+    if patch.get("description") is not None:
+        if not isinstance(patch["description"], str):
+            raise ConfigurationError("'description' must be a string")
+        updated["description"] = patch["description"]
+
+    constraints = list(updated["constraints"] or [])
+    if patch.get("constraints") is not None:
+        constraints = _string_list(patch["constraints"], "constraints")
+    removals = set()
+    for target in _string_list(patch.get("remove_constraints") or [], "remove_constraints"):
+        if target.isdigit():
+            index = int(target)
+            if not 1 <= index <= len(constraints):
+                raise ConfigurationError(f"invalid constraint index {index} (valid range: 1-{len(constraints)})")
+            removals.add(index - 1)
+        elif target in constraints:
+            removals.add(constraints.index(target))
+        else:
+            raise ConfigurationError(f"no constraint matches {target!r}")
+    constraints = [item for i, item in enumerate(constraints) if i not in removals]
+    for item in _string_list(patch.get("add_constraints") or [], "add_constraints"):
+        if item and item not in constraints:
+            constraints.append(item)
+    updated["constraints"] = constraints
+
+    if patch.get("linked_artifacts") is not None:
+        artifacts = patch["linked_artifacts"]
+        if not isinstance(artifacts, dict):
+            raise ConfigurationError("'linked_artifacts' must map a category to a list of references")
+        updated["linked_artifacts"] = {str(category): _string_list(items, f"linked_artifacts.{category}") for category, items in artifacts.items()}
+
+    return {key: value for key, value in updated.items() if value != current.get(key)}
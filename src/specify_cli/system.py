@@ -0,0 +1,255 @@
+"""Local tool detection and git helpers."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Tuple
+
+from .config import CLAUDE_LOCAL_PATH
+from .ui import StepTracker, console
+
+def run_command(cmd: list[str], check_return: bool = True, capture: bool = False, shell: bool = False) -> Optional[str]:
+    """Run a shell command and optionally capture output."""
+    try:
+        if capture:
+            result = subprocess.run(cmd, check=check_return, capture_output=True, text=True, shell=shell)
+            return result.stdout.strip()
+        else:
+            subprocess.run(cmd, check=check_return, shell=shell)
+            return None
+    except subprocess.CalledProcessError as e:
+        if check_return:
+            console.print(f"[red]Error running command:[/red] {' '.join(cmd)}")
+            console.print(f"[red]Exit code:[/red] {e.returncode}")
+            if hasattr(e, 'stderr') and e.stderr:
+                console.print(f"[red]Error output:[/red] {e.stderr}")
+            raise
+        return None
+
+# `<tool> --version` probes run concurrently; each gets this long before it is abandoned
+TOOL_VERSION_TIMEOUT_SECONDS = 5.0
+TOOL_PROBE_MAX_WORKERS = 8
+
+class PathIndex:
+    """Answer executable lookups for a PATH from one directory listing per entry.
+
+    ``shutil.which`` stats every candidate in every PATH directory for each
+    lookup; checking twenty tools on a long PATH (or one with slow,
+    network-mounted bin directories) repeats that work twenty times. The index
+    lists each directory once, concurrently, and serves every lookup from
+    memory. Results match ``shutil.which`` for bare command names (PATHEXT
+    and case-insensitive matching on Windows); names containing a path
+    separator are passed through to ``shutil.which``.
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = os.environ.get("PATH", os.defpath) if path is None else path
+        self._is_windows = os.name == "nt"
+        self._pathext = [ext.lower() for ext in os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD").split(os.pathsep) if ext] if self._is_windows else []
+        directories = []
+        for entry in self.path.split(os.pathsep):
+            if entry and entry not in directories:
+                directories.append(entry)
+        self.directories = directories
+        self._listings: list[dict[str, str]] | None = None
+        self._lock = threading.Lock()
+
+    def _list_directory(self, directory: str) -> dict[str, str]:
+        """Map (case-folded on Windows) entry name -> real name for one PATH directory."""
+        try:
+            with os.scandir(directory) as entries:
+                names = [entry.name for entry in entries]
+        except OSError:
+            return {}
+        if self._is_windows:
+            return {name.lower(): name for name in names}
+        return {name: name for name in names}
+
+    def build(self) -> list[dict[str, str]]:
+        """List every PATH directory (once per index; later calls are free)."""
+        with self._lock:
+            if self._listings is None:
+                if len(self.directories) > 1:
+                    with ThreadPoolExecutor(max_workers=min(TOOL_PROBE_MAX_WORKERS, len(self.directories))) as pool:
+                        self._listings = list(pool.map(self._list_directory, self.directories))
+                else:
+                    self._listings = [self._list_directory(d) for d in self.directories]
+            return self._listings
+
+    def _candidates(self, tool: str) -> list[str]:
+        if not self._is_windows:
+            return [tool]
+        name = tool.lower()
+        if any(name.endswith(ext) for ext in self._pathext):
+            return [name]
+        return [name + ext for ext in self._pathext]
+
+    def which(self, tool: str) -> str | None:
+        """Return the full path of ``tool`` on this PATH, or None."""
+        if os.path.dirname(tool):
+            return shutil.which(tool, path=self.path)
+        candidates = self._candidates(tool)
+        for directory, listing in zip(self.directories, self.build()):
+            for candidate in candidates:
+                name = listing.get(candidate)
+                if name is None:
+                    continue
+                full_path = os.path.join(directory, name)
+                if os.access(full_path, os.F_OK | os.X_OK) and not os.path.isdir(full_path):
+                    return full_path
+        return None
+
+_path_index: PathIndex | None = None
+
+def get_path_index() -> PathIndex:
+    """Return the process-wide PathIndex, rebuilding it if PATH has changed."""
+    global _path_index
+    current = os.environ.get("PATH", os.defpath)
+    if _path_index is None or _path_index.path != current:
+        _path_index = PathIndex(current)
+    return _path_index
+
+def find_tool(tool: str) -> str | None:
+    """Return the path of an installed tool, or None."""
+    # Special handling for Claude CLI after `claude migrate-installer`
+    # See: https://github.com/github/spec-kit/issues/123
+    # The migrate-installer command REMOVES the original executable from PATH
+    # and creates an alias at ~/.claude/local/claude instead
+    # This path should be prioritized over other claude executables in PATH
+    if tool == "claude" and CLAUDE_LOCAL_PATH.exists() and CLAUDE_LOCAL_PATH.is_file():
+        return str(CLAUDE_LOCAL_PATH)
+    return get_path_index().which(tool)
+
+def check_tool(tool: str, tracker: StepTracker = None) -> bool:
+    """Check if a tool is installed. Optionally update tracker.
+    
+    Args:
+        tool: Name of the tool to check
+        tracker: Optional StepTracker to update with results
+        
+    Returns:
+        True if tool is found, False otherwise
+    """
+    found = find_tool(tool) is not None
+    
+    if tracker:
+        if found:
+            tracker.complete(tool, "available")
+        else:
+            tracker.error(tool, "not found")
+    
+    return found
+
+def _run_version_probe(executable: str, timeout: float) -> dict:
+    start = time.perf_counter()
+    version = None
+    timed_out = False
+    try:
+        result = subprocess.run(
+            [executable, "--version"],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            stdin=subprocess.DEVNULL,
+        )
+        for line in (result.stdout or result.stderr or "").splitlines():
+            if line.strip():
+                version = line.strip()
+                break
+    except subprocess.TimeoutExpired:
+        timed_out = True
+    except (OSError, subprocess.SubprocessError):
+        pass
+    return {"version": version, "elapsed_ms": (time.perf_counter() - start) * 1000, "timed_out": timed_out}
+
+def probe_tool_version(executable: str, timeout: float = TOOL_VERSION_TIMEOUT_SECONDS) -> str | None:
+    """Run ``<executable> --version`` and return the first line it prints, or None."""
+    return _run_version_probe(executable, timeout)["version"]
+
+def probe_tool_versions(executables: dict[str, str], timeout: float = TOOL_VERSION_TIMEOUT_SECONDS) -> dict[str, dict]:
+    """Probe ``--version`` for several tools concurrently.
+
+    ``executables`` maps tool name -> executable path. Each probe is bounded by
+    ``timeout`` seconds. Returns tool name -> ``{"version", "elapsed_ms",
+    "timed_out"}``; ``version`` is None when the probe failed or timed out.
+    """
+    if not executables:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(TOOL_PROBE_MAX_WORKERS, len(executables))) as pool:
+        futures = {tool: pool.submit(_run_version_probe, path, timeout) for tool, path in executables.items()}
+        return {tool: future.result() for tool, future in futures.items()}
+
+def get_cli_version() -> str:
+    """Return the installed specify-cli version, falling back to pyproject.toml in a source checkout."""
+    import importlib.metadata
+    try:
+        return importlib.metadata.version("specify-cli")
+    except Exception:
+        pass
+    try:
+        import tomllib
+        pyproject_path = Path(__file__).parents[2] / "pyproject.toml"
+        if pyproject_path.exists():
+            with open(pyproject_path, "rb") as f:
+                return tomllib.load(f).get("project", {}).get("version", "unknown")
+    except Exception:
+        pass
+    return "unknown"
+
+def is_git_repo(path: Path = None) -> bool:
+    """Check if the specified path is inside a git repository."""
+    from .gitrepo import get_git_backend
+
+    if path is None:
+        path = Path.cwd()
+    
+    if not path.is_dir():
+        return False
+
+    return get_git_backend().is_repo(path)
+
+def init_git_repo(project_path: Path, quiet: bool = False) -> Tuple[bool, Optional[str]]:
+    """Initialize a git repository in the specified path.
+
+    The repository is written in-process when possible and with the git
+    binary otherwise (see specify_cli.gitrepo). The working directory of the
+    process is never changed, so several projects can be initialized
+    concurrently.
+    
+    Args:
+        project_path: Path to initialize git repository in
+        quiet: if True suppress console output (tracker handles status)
+    
+    Returns:
+        Tuple of (success: bool, error_message: Optional[str])
+    """
+    from .gitrepo import init_repository
+
+    try:
+        if not quiet:
+            console.print("[cyan]Initializing git repository...[/cyan]")
+        init_repository(Path(project_path))
+        if not quiet:
+            console.print("[green]✓[/green] Git repository initialized")
+        return True, None
+
+    except subprocess.CalledProcessError as e:
+        error_msg = f"Command: {' '.join(e.cmd)}\nExit code: {e.returncode}"
+        if e.stderr:
+            error_msg += f"\nError: {e.stderr.strip()}"
+        elif e.stdout:
+            error_msg += f"\nOutput: {e.stdout.strip()}"
+        
+        if not quiet:
+            console.print(f"[red]Error initializing git repository:[/red] {e}")
+        return False, error_msg
+    except OSError as e:
+        if not quiet:
+            console.print(f"[red]Error initializing git repository:[/red] {e}")
+        return False, str(e)
@@ -0,0 +1,420 @@
+"""Console output and interactive widgets shared by all commands.
+
+Rich's Live, Progress, Table and Tree are imported inside the functions that
+use them so that importing this module stays cheap.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import typer
+from rich.align import Align
+from rich.console import Console
+from rich.panel import Panel
+from rich.text import Text
+
+if TYPE_CHECKING:
+    from rich.progress import Progress
+    from rich.tree import Tree
+
+console = Console()
+
+BANNER = """
+███████╗██████╗ ███████╗ ██████╗██╗███████╗██╗   ██╗
+██╔════╝██╔══██╗██╔════╝██╔════╝██║██╔════╝╚██╗ ██╔╝
+███████╗██████╔╝█████╗  ██║     ██║█████╗   ╚████╔╝ 
+╚════██║██╔═══╝ ██╔══╝  ██║     ██║██╔══╝    ╚██╔╝  
+███████║██║     ███████╗╚██████╗██║██║        ██║   
+╚══════╝╚═╝     ╚══════╝ ╚═════╝╚═╝╚═╝        ╚═╝   
+"""
+
+TAGLINE = "GitHub Spec Kit - Spec-Driven Development Toolkit"
+
+# Rich markup for each step status symbol
+STEP_SYMBOLS = {
+    "done": "[green]●[/green]",
+    "pending": "[green dim]○[/green dim]",
+    "running": "[cyan]○[/cyan]",
+    "error": "[red]●[/red]",
+    "skipped": "[yellow]○[/yellow]",
+}
+
+# In line mode (non-terminal output), progress-only updates of a running step
+# (e.g. download percentages) are printed at most this often
+LINE_MODE_PROGRESS_INTERVAL = 1.0
+
+class StepTracker:
+    """Track and render hierarchical steps without emojis, similar to Claude Code tree output.
+
+    Steps are indexed by key, so updates cost the same however many steps
+    there are, and the rendered tree is cached until something changes.
+    Display it with ``live()``: on a terminal the tree is redrawn at a capped
+    frame rate (updates in between are coalesced); otherwise only changed
+    steps are printed, one line each, with progress-only updates of a
+    running step limited to one line per LINE_MODE_PROGRESS_INTERVAL.
+    The tracker is thread-safe.
+
+    Every step records monotonic start/end times (and optional metrics such
+    as byte counts), available from ``timings()`` and ``chrome_trace()``.
+    A callback attached with ``attach_refresh`` still runs on every change.
+    """
+    def __init__(self, title: str):
+        self.title = title
+        self.steps = []  # list of dicts: {key, label, status, detail, started, ended, thread, metrics}, in display order
+        self._index = {}  # key -> step dict
+        self.status_order = {"pending": 0, "running": 1, "done": 2, "error": 3, "skipped": 4}
+        self._refresh_cb = None  # callable to trigger UI refresh
+        self._lock = threading.RLock()
+        self._changes = 0  # bumped on every change; invalidates the cached tree
+        self._tree = None
+        self._tree_changes = -1
+        self._line_console = None  # set by live() when the output is not a terminal
+        self._line_times = {}  # key -> when its last line was printed in line mode
+        self._origin = self._last_event = time.perf_counter()  # timing baseline, last step event
+
+    def attach_refresh(self, cb):
+        self._refresh_cb = cb
+
+    @contextmanager
+    def live(self, output: Console | None = None, *, refresh_per_second: float = 8, transient: bool = True):
+        """Display the tracker while the ``with`` block runs."""
+        output = output or console
+        if output.is_terminal:
+            from rich.live import Live
+            with Live(self, console=output, refresh_per_second=refresh_per_second, transient=transient):
+                yield self
+        else:
+            self._line_console = output
+            try:
+                yield self
+            finally:
+                self._line_console = None
+
+    def add(self, key: str, label: str):
+        with self._lock:
+            if key in self._index:
+                return
+            step = {"key": key, "label": label, "status": "pending", "detail": "", "started": None, "ended": None, "thread": None, "metrics": {}}
+            self.steps.append(step)
+            self._index[key] = step
+            self._changes += 1
+        self._maybe_refresh()
+
+    # Keyword arguments (e.g. bytes=..., files=...) are recorded as step metrics
+    # and show up in timings() and the trace file.
+    def start(self, key: str, detail: str = "", **metrics):
+        self._update(key, status="running", detail=detail, metrics=metrics)
+
+    def complete(self, key: str, detail: str = "", **metrics):
+        self._update(key, status="done", detail=detail, metrics=metrics)
+
+    def error(self, key: str, detail: str = "", **metrics):
+        self._update(key, status="error", detail=detail, metrics=metrics)
+
+    def skip(self, key: str, detail: str = "", **metrics):
+        self._update(key, status="skipped", detail=detail, metrics=metrics)
+
+    def _update(self, key: str, status: str, detail: str, metrics: dict | None = None):
+        now = time.perf_counter()
+        with self._lock:
+            step = self._index.get(key)
+            progress_only = False
+            if step is None:
+                step = {"key": key, "label": key, "status": status, "detail": detail, "started": None, "ended": None, "thread": None, "metrics": {}}
+                self.steps.append(step)
+                self._index[key] = step
+            elif step["status"] == status and (not detail or detail == step["detail"]) and not metrics:
+                return  # nothing visible changed
+            else:
+                progress_only = step["status"] == status == "running"
+                step["status"] = status
+                if detail:
+                    step["detail"] = detail
+            self._record_time(step, status, now)
+            if metrics:
+                step["metrics"].update(metrics)
+            self._changes += 1
+            if self._line_console is not None:
+                self._print_line(step, progress_only)
+        self._maybe_refresh()
+
+    def _record_time(self, step: dict, status: str, now: float):
+        if status == "running":
+            if step["started"] is None or step["ended"] is not None:
+                step["started"], step["ended"] = now, None
+                step["thread"] = threading.get_native_id()
+        else:
+            if step["started"] is None:
+                # Finished without an explicit start: in sequential code the work
+                # ran since the previous step event (a skip took no time)
+                step["started"] = now if status == "skipped" else self._last_event
+                step["thread"] = threading.get_native_id()
+            step["ended"] = now
+        self._last_event = now
+
+    def _print_line(self, step: dict, progress_only: bool):
+        now = time.monotonic()
+        if progress_only and now - self._line_times.get(step["key"], 0.0) < LINE_MODE_PROGRESS_INTERVAL:
+            return
+        self._line_times[step["key"]] = now
+        detail_text = step["detail"].strip() if step["detail"] else ""
+        line = f"[{step['status']}] {step['label']}" + (f" ({detail_text})" if detail_text else "")
+        self._line_console.print(line, markup=False, highlight=False, soft_wrap=True)
+
+    def _maybe_refresh(self):
+        if self._refresh_cb:
+            try:
+                self._refresh_cb()
+            except Exception:
+                pass
+
+    @staticmethod
+    def _step_line(step: dict) -> str:
+        label = step["label"]
+        detail_text = step["detail"].strip() if step["detail"] else ""
+        status = step["status"]
+        symbol = STEP_SYMBOLS.get(status, " ")
+
+        if status == "pending":
+            # Entire line light gray (pending)
+            if detail_text:
+                return f"{symbol} [bright_black]{label} ({detail_text})[/bright_black]"
+            return f"{symbol} [bright_black]{label}[/bright_black]"
+        # Label white, detail (if any) light gray in parentheses
+        if detail_text:
+            return f"{symbol} [white]{label}[/white] [bright_black]({detail_text})[/bright_black]"
+        return f"{symbol} [white]{label}[/white]"
+
+    def render(self) -> Tree:
+        from rich.tree import Tree
+        with self._lock:
+            if self._tree is None or self._tree_changes != self._changes:
+                tree = Tree(f"[cyan]{self.title}[/cyan]", guide_style="grey50")
+                for step in self.steps:
+                    tree.add(self._step_line(step))
+                self._tree, self._tree_changes = tree, self._changes
+            return self._tree
+
+    def __rich__(self) -> Tree:
+        return self.render()
+
+    def timings(self) -> list[dict]:
+        """Return one record per step that ran: key, label, status, start_ms
+        (relative to tracker creation), duration_ms and its metrics.
+        Steps still running are measured up to now."""
+        now = time.perf_counter()
+        with self._lock:
+            return [
+                {
+                    "key": step["key"],
+                    "label": step["label"],
+                    "status": step["status"],
+                    "start_ms": round((step["started"] - self._origin) * 1000, 3),
+                    "duration_ms": round(((step["ended"] or now) - step["started"]) * 1000, 3),
+                    **step["metrics"],
+                }
+                for step in self.steps
+                if step["started"] is not None
+            ]
+
+    def chrome_trace(self) -> dict:
+        """Return the step timings as a Chrome trace-event document (chrome://tracing, Perfetto).
+
+        Each step is a complete ("X") event on the thread that started it.
+        """
+        pid = os.getpid()
+        with self._lock:
+            events = [{"name": "process_name", "ph": "M", "pid": pid, "args": {"name": f"specify: {self.title}"}}]
+            now = time.perf_counter()
+            for step in self.steps:
+                if step["started"] is None:
+                    continue
+                events.append({
+                    "name": step["label"],
+                    "cat": "step",
+                    "ph": "X",
+                    "ts": round((step["started"] - self._origin) * 1e6, 1),
+                    "dur": round(((step["ended"] or now) - step["started"]) * 1e6, 1),
+                    "pid": pid,
+                    "tid": step["thread"] or 0,
+                    "args": {"key": step["key"], "status": step["status"], "detail": step["detail"], **step["metrics"]},
+                })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_trace(self, path: Path) -> None:
+        """Write ``chrome_trace()`` as JSON to ``path``."""
+        Path(path).write_text(json.dumps(self.chrome_trace(), indent=1) + "\n", encoding="utf-8")
+
+def _format_bytes(count: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if count < 1024:
+            return f"{count:,.0f} {unit}" if unit == "B" else f"{count:,.1f} {unit}"
+        count /= 1024
+    return f"{count:,.1f} GB"
+
+def print_timings(tracker: StepTracker, output: Console | None = None) -> None:
+    """Print a table of the tracker's step timings, longest steps highlighted."""
+    from rich.table import Table
+
+    records = tracker.timings()
+    if not records:
+        return
+    total = max(record["start_ms"] + record["duration_ms"] for record in records)
+    table = Table(title=f"Timings: {tracker.title}", title_justify="left")
+    for column in ("Step", "Status", "Start (ms)", "Duration (ms)", "Share", "Metrics"):
+        table.add_column(column, justify="right" if column not in ("Step", "Status", "Metrics") else "left")
+    for record in records:
+        share = record["duration_ms"] / total if total else 0.0
+        metrics = ", ".join(
+            _format_bytes(value) if name == "bytes" else f"{name} {value:,}"
+            for name, value in record.items()
+            if name not in ("key", "label", "status", "start_ms", "duration_ms") and isinstance(value, int)
+        )
+        table.add_row(
+            record["label"], record["status"], f"{record['start_ms']:,.1f}",
+            f"[bold]{record['duration_ms']:,.1f}[/bold]" if share >= 0.25 else f"{record['duration_ms']:,.1f}",
+            f"{share:.0%}", metrics,
+        )
+    (output or console).print(table)
+    (output or console).print(f"[dim]Wall time covered by steps: {total:,.1f} ms[/dim]")
+
+def report_timings(tracker: StepTracker, *, timings: bool = False, trace_file: Path | None = None) -> None:
+    """Handle the --timings / --trace-file options of a command for its tracker."""
+    if timings:
+        console.print()
+        print_timings(tracker)
+    if trace_file is not None:
+        try:
+            tracker.write_trace(trace_file)
+        except OSError as e:
+            console.print(f"[yellow]Warning:[/yellow] could not write trace file {trace_file}: {e}")
+        else:
+            console.print(f"[dim]Trace written to {trace_file} (open in chrome://tracing or ui.perfetto.dev)[/dim]")
+
+def get_key():
+    """Get a single keypress in a cross-platform way using readchar."""
+    import readchar
+    key = readchar.readkey()
+
+    if key == readchar.key.UP or key == readchar.key.CTRL_P:
+        return 'up'
+    if key == readchar.key.DOWN or key == readchar.key.CTRL_N:
+        return 'down'
+
+    if key == readchar.key.ENTER:
+        return 'enter'
+
+    if key == readchar.key.ESC:
+        return 'escape'
+
+    if key == readchar.key.CTRL_C:
+        raise KeyboardInterrupt
+
+    return key
+
+def select_with_arrows(options: dict, prompt_text: str = "Select an option", default_key: str = None) -> str:
+    """
+    Interactive selection using arrow keys with Rich Live display.
+    
+    Args:
+        options: Dict with keys as option keys and values as descriptions
+        prompt_text: Text to show above the options
+        default_key: Default option key to start with
+        
+    Returns:
+        Selected option key
+    """
+    from rich.live import Live
+    from rich.table import Table
+    option_keys = list(options.keys())
+    if default_key and default_key in option_keys:
+        selected_index = option_keys.index(default_key)
+    else:
+        selected_index = 0
+
+    selected_key = None
+
+    def create_selection_panel():
+        """Create the selection panel with current selection highlighted."""
+        table = Table.grid(padding=(0, 2))
+        table.add_column(style="cyan", justify="left", width=3)
+        table.add_column(style="white", justify="left")
+
+        for i, key in enumerate(option_keys):
+            if i == selected_index:
+                table.add_row("▶", f"[cyan]{key}[/cyan] [dim]({options[key]})[/dim]")
+            else:
+                table.add_row(" ", f"[cyan]{key}[/cyan] [dim]({options[key]})[/dim]")
+
+        table.add_row("", "")
+        table.add_row("", "[dim]Use ↑/↓ to navigate, Enter to select, Esc to cancel[/dim]")
+
+        return Panel(
+            table,
+            title=f"[bold]{prompt_text}[/bold]",
+            border_style="cyan",
+            padding=(1, 2)
+        )
+
+    console.print()
+
+    def run_selection_loop():
+        nonlocal selected_key, selected_index
+        with Live(create_selection_panel(), console=console, transient=True, auto_refresh=False) as live:
+            while True:
+                try:
+                    key = get_key()
+                    if key == 'up':
+                        selected_index = (selected_index - 1) % len(option_keys)
+                    elif key == 'down':
+                        selected_index = (selected_index + 1) % len(option_keys)
+                    elif key == 'enter':
+                        selected_key = option_keys[selected_index]
+                        break
+                    elif key == 'escape':
+                        console.print("\n[yellow]Selection cancelled[/yellow]")
+                        raise typer.Exit(1)
+
+                    live.update(create_selection_panel(), refresh=True)
+
+                except KeyboardInterrupt:
+                    console.print("\n[yellow]Selection cancelled[/yellow]")
+                    raise typer.Exit(1)
+
+    run_selection_loop()
+
+    if selected_key is None:
+        console.print("\n[red]Selection failed.[/red]")
+        raise typer.Exit(1)
+
+    return selected_key
+
+def show_banner():
+    """Display the ASCII art banner."""
+    banner_lines = BANNER.strip().split('\n')
+    colors = ["bright_blue", "blue", "cyan", "bright_cyan", "white", "bright_white"]
+
+    styled_banner = Text()
+    for i, line in enumerate(banner_lines):
+        color = colors[i % len(colors)]
+        styled_banner.append(line + "\n", style=color)
+
+    console.print(Align.center(styled_banner))
+    console.print(Align.center(Text(TAGLINE, style="italic bright_yellow")))
+    console.print()
+
+def _progress_bar() -> Progress:
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        console=console,
+    )
@@ -0,0 +1,363 @@
+"""The small YAML subset used by Spec Kit files, with comment-preserving edits.
+
+``parse_yaml`` reads batch manifests and ``.specify/context.yaml``. It covers
+block mappings and sequences, ``- key: value`` list items, plain, single- and
+double-quoted scalars, booleans, integers, null, ``#`` comments, literal and
+folded block scalars (``|``, ``>``, with ``-``/``+`` chomping) and single-line
+flow sequences of scalars (``[a, "b"]``, ``[]``, ``{}``). Anchors, aliases,
+tags, multi-document streams and tab indentation are not supported.
+
+``YamlDocument`` edits the top-level keys of a mapping in place. Lines that
+belong to untouched keys, and every comment, are written back unchanged.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+from .errors import ConfigurationError
+
+_MAPPING_ITEM = re.compile(r"^[A-Za-z_][\w.-]*\s*:(\s|$)")
+_TOP_LEVEL_KEY = re.compile(r"^([A-Za-z_][\w.-]*)\s*:(\s|$)")
+_BLOCK_SCALAR = re.compile(r"^(.*?)(?:(?<=:)|(?<=^-))\s*([|>])([-+]?)$")
+_INTEGER = re.compile(r"^[-+]?\d+$")
+# Plain scalars that would read back as something other than the same string
+_PLAIN_UNSAFE = re.compile(r"^[-?:,\[\]{}#&*!|>'\"%@`\s]|[\s:]$|: | #|[\x00-\x1f\x7f]")
+_RESERVED_PLAIN = {"true", "false", "yes", "no", "on", "off", "null", "~"}
+
+
+class YamlError(ConfigurationError):
+    """The text is not valid in the supported YAML subset."""
+
+
+def _opens_quote(text: str, i: int) -> bool:
+    """True if the quote at ``text[i]`` starts a quoted scalar.
+
+    As in YAML, a quote only does so at the start of a scalar (after ``:``,
+    ``-``, ``[``, ``{``, ``,`` or at the start of the text); elsewhere it is part of a
+    plain scalar, like the apostrophe in ``don't``.
+    """
+    before = text[:i].rstrip(" \t")
+    if not before:
+        return True
+    if len(before) == i:
+        # No whitespace in between: only flow delimiters can precede it ("a:'b'" is plain)
+        return before[-1] in "[{,"
+    return before[-1] in ":-[{,"
+
+
+def _strip_comment(text: str) -> str:
+    """Remove a trailing ``# comment`` that is not inside a quoted scalar."""
+    quote = None
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if quote:
+            if ch == "\\" and quote == '"':
+                i += 1  # backslash escape inside double quotes
+            elif ch == quote:
+                if quote == "'" and text[i + 1:i + 2] == "'":
+                    i += 1  # '' is an escaped quote inside single quotes
+                else:
+                    quote = None
+        elif ch in "'\"" and _opens_quote(text, i):
+            quote = ch
+        elif ch == "#" and (i == 0 or text[i - 1] in " \t"):
+            return text[:i].rstrip()
+        i += 1
+    return text.rstrip()
+
+
+def _split_flow(text: str, lineno: int) -> list[str]:
+    """Split the inside of a flow sequence on commas outside quotes."""
+    items, current, quote = [], "", None
+    for ch in text:
+        if quote:
+            current += ch
+            if ch == quote:
+                quote = None
+        elif ch in "'\"" and not current.strip():
+            # Quotes only delimit a scalar at the start of an item (not "don't")
+            quote = ch
+            current += ch
+        elif ch in "[]{}":
+            raise YamlError(f"line {lineno}: nested flow collections are not supported; use block style")
+        elif ch == ",":
+            items.append(current)
+            current = ""
+        else:
+            current += ch
+    if quote:
+        raise YamlError(f"line {lineno}: unterminated quoted string in flow sequence")
+    items.append(current)
+    if items and not items[-1].strip():
+        items.pop()  # trailing comma
+    return items
+
+
+def _parse_scalar(text: str, lineno: int) -> Any:
+    text = text.strip()
+    if not text:
+        return None
+    if text[0] == '"':
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            # Older specify versions wrote '"' and '\\' inside double quotes unescaped
+            if len(text) < 2 or text[-1] != '"':
+                raise YamlError(f"line {lineno}: invalid double-quoted string") from None
+            return text[1:-1]
+    if text[0] == "'":
+        if len(text) < 2 or text[-1] != "'":
+            raise YamlError(f"line {lineno}: unterminated single-quoted string")
+        return text[1:-1].replace("''", "'")
+    if text[0] == "[":
+        if text[-1] != "]":
+            raise YamlError(f"line {lineno}: flow sequences must close on the same line")
+        return [_parse_scalar(item, lineno) for item in _split_flow(text[1:-1], lineno)]
+    if text[0] == "{":
+        if text.replace(" ", "") != "{}":
+            raise YamlError(f"line {lineno}: flow mappings are not supported; use block style")
+        return {}
+    lowered = text.lower()
+    if lowered in ("true", "yes", "on"):
+        return True
+    if lowered in ("false", "no", "off"):
+        return False
+    if lowered in ("null", "~"):
+        return None
+    if _INTEGER.match(text):
+        return int(text)
+    return text
+
+
+def _is_sequence_item(content: str) -> bool:
+    return content == "-" or content.startswith("- ")
+
+
+def _parse_block(lines: list[tuple[int, str, int]], i: int, indent: int) -> tuple[Any, int]:
+    """Parse the mapping or sequence starting at ``lines[i]`` with the given indent."""
+    if _is_sequence_item(lines[i][1]):
+        return _parse_sequence(lines, i, indent)
+    return _parse_mapping(lines, i, indent)
+
+
+def _parse_sequence(lines, i, indent):
+    items = []
+    while i < len(lines) and lines[i][0] == indent and _is_sequence_item(lines[i][1]):
+        _, content, lineno = lines[i]
+        rest = content[1:].lstrip()
+        if not rest:
+            if i + 1 < len(lines) and lines[i + 1][0] > indent:
+                value, i = _parse_block(lines, i + 1, lines[i + 1][0])
+            else:
+                value, i = None, i + 1
+        elif _MAPPING_ITEM.match(rest):
+            # "- key: value" opens a mapping indented to where "key" starts
+            item_indent = indent + len(content) - len(rest)
+            lines[i] = (item_indent, rest, lineno)
+            value, i = _parse_mapping(lines, i, item_indent)
+        else:
+            value, i = _parse_scalar(rest, lineno), i + 1
+        items.append(value)
+    return items, i
+
+
+def _parse_mapping(lines, i, indent):
+    mapping = {}
+    while i < len(lines) and lines[i][0] == indent:
+        _, content, lineno = lines[i]
+        if not _MAPPING_ITEM.match(content):
+            raise YamlError(f"line {lineno}: expected 'key: value', got {content!r}")
+        key, _, rest = content.partition(":")
+        key = key.strip()
+        if key in mapping:
+            raise YamlError(f"line {lineno}: duplicate key {key!r}")
+        i += 1
+        if rest.strip():
+            mapping[key] = _parse_scalar(rest, lineno)
+        elif i < len(lines) and (lines[i][0] > indent or (lines[i][0] == indent and _is_sequence_item(lines[i][1]))):
+            mapping[key], i = _parse_block(lines, i, lines[i][0])
+        else:
+            mapping[key] = None
+    if i < len(lines) and lines[i][0] > indent:
+        raise YamlError(f"line {lines[i][2]}: unexpected indentation")
+    return mapping, i
+
+
+def _block_scalar(raw_lines: list[str], start: int, indent: int, style: str, chomp: str) -> tuple[str, int]:
+    """Read the block scalar body after ``raw_lines[start - 1]``; return its value and the next line index."""
+    end = start
+    while end < len(raw_lines) and (not raw_lines[end].strip() or len(raw_lines[end]) - len(raw_lines[end].lstrip(" ")) > indent):
+        end += 1
+    body = raw_lines[start:end]
+    content_indent = min((len(line) - len(line.lstrip(" ")) for line in body if line.strip()), default=0)
+    body = [line[content_indent:] if line.strip() else "" for line in body]
+    trailing = 0
+    while body and not body[-1]:
+        body.pop()
+        trailing += 1
+    if style == "|":
+        text = "\n".join(body)
+    else:
+        # Folded: single newlines become spaces, blank lines become newlines
+        text, previous_blank = "", True
+        for line in body:
+            if not line:
+                text += "\n"
+                previous_blank = True
+            else:
+                text += line if previous_blank else " " + line
+                previous_blank = False
+    if body and chomp != "-":
+        text += "\n" * (trailing + 1 if chomp == "+" else 1)
+    return text, end
+
+
+def parse_yaml(text: str) -> Any:
+    """Parse ``text`` in the supported YAML subset and return plain Python values.
+
+    Raises YamlError, with the offending line number, for anything outside it.
+    """
+    raw_lines = text.splitlines()
+    lines = []
+    i = 0
+    while i < len(raw_lines):
+        raw_line, lineno = raw_lines[i], i + 1
+        i += 1
+        if raw_line.strip() in ("---", "..."):
+            continue
+        stripped = raw_line.lstrip(" ")
+        if stripped.startswith("\t"):
+            raise YamlError(f"line {lineno}: tabs are not allowed for indentation")
+        content = _strip_comment(stripped)
+        if not content:
+            continue
+        indent = len(raw_line) - len(stripped)
+        block = _BLOCK_SCALAR.match(content)
+        if block:
+            # Fold the block scalar into a double-quoted scalar on the indicator line
+            value, i = _block_scalar(raw_lines, i, indent, block.group(2), block.group(3))
+            content = f"{block.group(1)} {json.dumps(value)}"
+        lines.append((indent, content, lineno))
+    if not lines:
+        return None
+    value, i = _parse_block(lines, 0, lines[0][0])
+    if i != len(lines):
+        raise YamlError(f"line {lines[i][2]}: unexpected dedent or content")
+    return value
+
+
+def format_scalar(value: Any) -> str:
+    """Render a scalar so that ``parse_yaml`` reads it back as the same value."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    value = str(value)
+    if not value or _PLAIN_UNSAFE.search(value) or value.lower() in _RESERVED_PLAIN or _INTEGER.match(value):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def format_entry(key: str, value: Any, indent: int = 0) -> list[str]:
+    """Render ``key: value`` as block-style YAML lines indented by ``indent`` spaces."""
+    pad = " " * indent
+    if isinstance(value, dict):
+        if not value:
+            return [f"{pad}{key}: {{}}"]
+        lines = [f"{pad}{key}:"]
+        for sub_key, sub_value in value.items():
+            lines.extend(format_entry(str(sub_key), sub_value, indent + 2))
+        return lines
+    if isinstance(value, (list, tuple)):
+        if not value:
+            return [f"{pad}{key}: []"]
+        return [f"{pad}{key}:", *(f"{pad}  - {format_scalar(item)}" for item in value)]
+    if isinstance(value, str) and "\n" in value.rstrip("\n") and not value.startswith(" ") and not value.endswith("\n\n"):
+        chomp = "" if value.endswith("\n") else "-"
+        body = value[:-1] if value.endswith("\n") else value
+        return [f"{pad}{key}: |{chomp}", *(f"{pad}  {line}" if line else "" for line in body.split("\n"))]
+    return [f"{pad}{key}: {format_scalar(value)}"]
+
+
+class YamlDocument:
+    """A top-level YAML mapping that can be edited without losing comments or layout.
+
+    ``data`` holds the parsed values. ``update`` replaces the lines of the
+    given keys in one pass (new keys are appended) and re-parses the result,
+    so ``text`` and ``data`` always agree.
+    """
+
+    def __init__(self, text: str = ""):
+        self._lines = text.splitlines()
+        self._trailing_newline = text.endswith("\n") or not text
+        self._spans: dict[str, tuple[int, int]] = {}
+        self.data: dict[str, Any] = {}
+        self._index()
+
+    def _index(self) -> None:
+        starts = []
+        for i, line in enumerate(self._lines):
+            match = _TOP_LEVEL_KEY.match(line)
+            if match:
+                starts.append((match.group(1), i))
+            elif line and line[0] not in " #-" and line.strip() not in ("---", "..."):
+                raise YamlError(f"line {i + 1}: expected 'key: value', got {line.strip()!r}")
+        for n, (key, start) in enumerate(starts):
+            if key in self._spans:
+                raise YamlError(f"line {start + 1}: duplicate key {key!r}")
+            end = starts[n + 1][1] if n + 1 < len(starts) else len(self._lines)
+            # Blank lines and column-0 comments before the next key belong to that key
+            while end > start + 1 and (not self._lines[end - 1].strip() or self._lines[end - 1].startswith("#")):
+                end -= 1
+            self._spans[key] = (start, end)
+            try:
+                parsed = parse_yaml("\n".join(self._lines[start:end]))
+            except YamlError as e:
+                # Report line numbers relative to the whole document
+                message = re.sub(r"^line (\d+)", lambda m: f"line {int(m.group(1)) + start}", str(e))
+                raise YamlError(message) from None
+            self.data[key] = parsed[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.data.get(key, default)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.data
+
+    def update(self, changes: dict[str, Any]) -> None:
+        """Set several top-level keys at once, keeping comments inside their old blocks."""
+        replacements = {}
+        for key, value in changes.items():
+            lines = format_entry(key, value)
+            if key in self._spans:
+                start, end = self._spans[key]
+                inline_comment = self._lines[start][len(_strip_comment(self._lines[start])):]
+                if len(lines) == 1 and inline_comment.strip():
+                    lines[0] += inline_comment
+                lines.extend(line for line in self._lines[start + 1:end] if line.lstrip().startswith("#") or not line.strip())
+            replacements[key] = lines
+        output = []
+        i = 0
+        span_starts = {start: (key, end) for key, (start, end) in self._spans.items()}
+        while i < len(self._lines):
+            key, end = span_starts.get(i, (None, None))
+            if key in replacements:
+                output.extend(replacements.pop(key))
+                i = end
+            else:
+                output.append(self._lines[i])
+                i += 1
+        for lines in replacements.values():
+            output.extend(lines)
+        self.__init__("\n".join(output) + ("\n" if self._trailing_newline else ""))
+
+    def dumps(self) -> str:
+        """Return the document text."""
+        text = "\n".join(self._lines)
+        return text + "\n" if self._trailing_newline and self._lines else text
@@ -0,0 +1,39 @@
+"""Comment and quote handling in the YAML subset parser."""
+
+import pytest
+
+from specify_cli.yamldoc import parse_yaml
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        # An apostrophe inside a plain scalar does not open a quoted string
+        ("description: don't panic  # note", {"description": "don't panic"}),
+        ("description: it is 'x' # note", {"description": "it is 'x'"}),
+        ("constraints:\n  - it's fine # note\n  - 'q # kept'", {"constraints": ["it's fine", "q # kept"]}),
+        ("tags: [don't, 'b, c', d] # note", {"tags": ["don't", "b, c", "d"]}),
+        # Quotes at the start of a scalar still protect '#'
+        ("a: 'quoted # kept' # note", {"a": "quoted # kept"}),
+        ("a: 'it''s # kept' # note", {"a": "it's # kept"}),
+        ('a: "x # kept"  # note', {"a": "x # kept"}),
+    ],
+)
+def test_trailing_comments(text, expected):
+    assert parse_yaml(text) == expected
+
+
+def test_unescaped_double_quotes_from_older_versions():
+    # set_yaml_value/set_yaml_list used to write '"' and '\' inside double quotes as-is
+    text = (
+        'project_type: brownfield\n'
+        'description: "Use "v2" API"\n'
+        'constraints:\n'
+        '  - "C:\\data"\n'
+        '  - "a: \\"b\\"" # note\n'
+    )
+    assert parse_yaml(text) == {
+        "project_type": "brownfield",
+        "description": 'Use "v2" API',
+        "constraints": ["C:\\data", 'a: "b"'],
+    }